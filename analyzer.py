@@ -1,7 +1,21 @@
 import os
+import re
 import json
+import asyncio
 import logging
-from openai import OpenAI
+import importlib.util
+import threading
+import queue
+import httpx
+from openai import AsyncOpenAI
+
+# tiktoken이 설치되어 있으면 토큰 수 기준으로 내용을 나눔 (없으면 글자 수로 대신 계산)
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+from response_cache import (make_cache_key, get_cached_result, set_cached_result,
+                            find_similar_result, add_semantic_result)
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +32,9 @@ def create_default_analysis_result(content):
     # 여기서는 실제 내용을 바탕으로 기본 분석을 제공합니다.
     # 각 섹션별로 최소 1000자 이상의 기본 분석을 제공합니다.
     
-    word_count = len(content.split())
-    sentence_count = len([s for s in content.split('.') if s.strip()])
+    # 표시용 대략적인 수치이므로 리스트를 만들지 않고 구분 문자 개수로 계산
+    word_count = content.count(' ') + 1
+    sentence_count = content.count('.')
     
     characteristics = f"""
 블로그 글을 분석한 결과, 작성자는 자신의 생각과 경험을 깊이 있게 표현하는 특성을 가지고 있습니다.
@@ -169,54 +184,55 @@ def create_default_analysis_result(content):
         "advice": advice.strip()
     }
 
+
 # Get the OpenAI API key from environment variables
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 
+# 디버깅 중에는 실제 API 호출 대신 기본 분석 결과를 사용합니다.
+# OpenAI API가 정상 작동할 때 OPENAI_ANALYSIS_ENABLED=1 로 활성화하세요.
+OPENAI_ANALYSIS_ENABLED = os.environ.get("OPENAI_ANALYSIS_ENABLED", "").lower() in ("1", "true")
+
 # API 키가 없거나 유효하지 않은 경우에 대비하여 체크
 if not OPENAI_API_KEY:
     logger.warning("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다. 기본 분석 결과를 사용합니다.")
     
-# OpenAI 클라이언트 초기화 (API 키가 없어도 객체는 생성, API 호출 시 검증)
+# OpenAI 비동기 클라이언트 초기화 (API 키가 없어도 객체는 생성, API 호출 시 검증)
+# 모듈 전역에서 하나만 만들어 모든 분석 요청이 연결 풀을 공유합니다.
+# 기본 httpx 연결 풀 제한은 청크 병렬 분석에서 병목이 되므로 명시적으로 늘려주고,
+# h2 패키지가 설치되어 있으면 HTTP/2로 여러 요청을 하나의 연결에 다중화합니다.
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
 try:
-    openai = OpenAI(api_key=OPENAI_API_KEY)
+    openai = AsyncOpenAI(
+        api_key=OPENAI_API_KEY,
+        http_client=httpx.AsyncClient(
+            http2=HTTP2_ENABLED,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+            timeout=httpx.Timeout(180)  # 3분(180초)으로 타임아웃 설정
+        )
+    )
     logger.debug("OpenAI 클라이언트 초기화 성공")
 except Exception as e:
     logger.error(f"OpenAI 클라이언트 초기화 실패: {str(e)}")
     # 클라이언트 초기화 실패 시 None으로 설정하여 기본 분석 결과 사용하도록 함
     openai = None
 
-def analyze_blog_content(content):
-    """
-    Analyze blog content using OpenAI API to generate a comprehensive self-analysis.
-    
-    Args:
-        content (str): The blog content to analyze
-    
-    Returns:
-        dict: A dictionary containing the analysis results
-    """
-    # OpenAI 클라이언트가 없거나 API 키가 없는 경우 기본 분석 결과 사용
-    if openai is None or not OPENAI_API_KEY:
-        logger.warning("OpenAI API가 구성되지 않았거나 API 키가 없습니다. 기본 분석 결과를 사용합니다.")
-        return create_default_analysis_result(content)
-        
-    try:
-        logger.debug("Starting content analysis with OpenAI API")
-        
-        # Check if content is too large - OpenAI 모델의 최대 토큰 수를 고려하여 크기 제한
-        if len(content) > 50000:
-            # 콘텐츠가 너무 크면 대표 샘플만 사용
-            logger.debug(f"Content too large ({len(content)} chars), truncating to 50K")
-            
-            # 앞부분(25K)과 뒷부분(25K)를 균등하게 추출하여 전체 내용을 대표할 수 있도록 함
-            first_part = content[:25000]  # 처음 25K 문자
-            last_part = content[-25000:]  # 마지막 25K 문자
-            content = first_part + "\n...[내용 중략]...\n" + last_part
-            
-            logger.debug(f"Truncated content length: {len(content)} chars")
-        
-        # Define the analysis prompt
-        prompt = """
+# 분석 요청 전용 이벤트 루프
+# Flask 워커 스레드들이 하나의 루프를 공유하므로 여러 블로그 분석이 동시에 진행되고,
+# 비동기 클라이언트의 연결 풀도 루프가 바뀌지 않아 안전하게 재사용됩니다.
+_loop = None
+_loop_lock = threading.Lock()
+
+# 토크나이저 (_get_encoder에서 최초 사용 시 초기화)
+_encoder = None
+_encoder_lock = threading.Lock()
+
+# 고정된 지시문(SYSTEM_PROMPT, ANALYSIS_PROMPT/MERGE_PROMPT)을 메시지 앞쪽에 두고
+# 블로그 내용은 마지막 사용자 메시지에만 넣습니다. 요청의 앞부분이 매번 같아야
+# OpenAI의 자동 프롬프트 캐싱이 적용되므로 지시문에는 .format()을 사용하지 마세요.
+SYSTEM_PROMPT = "당신은 작성된 내용에서 통찰력을 추출하는 데 특화된 심리 분석가입니다. 제공된 텍스트를 바탕으로 한국어로 사려 깊고 미묘한 분석을 제공하세요. 모든 응답은 한국어로만 작성해야 합니다."
+
+ANALYSIS_PROMPT = """
         저는 제 개인 블로그 콘텐츠를 바탕으로 자기 분석 보고서를 작성하고 싶습니다. 
         다음 카테고리에 따라 상세한 분석을 한국어로 제공해주세요:
         
@@ -239,121 +255,456 @@ def analyze_blog_content(content):
         "characteristics", "strengths", "weaknesses", "thinking_patterns", 
         "decision_making", "unconscious_biases", "advice"
         
-        분석할 블로그 내용은 다음과 같습니다:
-        
-        {content}
+        분석할 블로그 내용은 다음 사용자 메시지로 제공됩니다.
         """
+
+# 분석에 사용하는 모델과 프롬프트 버전 (분석 결과 캐시 키에 포함됨)
+# 프롬프트를 수정하면 PROMPT_VERSION을 올려 이전 캐시가 재사용되지 않도록 하세요.
+ANALYSIS_MODEL = "gpt-4o"
+PROMPT_VERSION = "v2"
+
+# 의미 기반 캐시에 사용하는 임베딩 모델과 임베딩할 내용 길이
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_INPUT_CHARS = 8000
+
+REQUIRED_KEYS = ['characteristics', 'strengths', 'weaknesses', 'thinking_patterns', 
+                 'decision_making', 'unconscious_biases', 'advice']
+
+# 한 번의 요청에 보낼 최대 분량 (토큰 수)과 병렬 요청 개수 상한
+# 청크별 부분 분석을 동시에 요청한 뒤 하나의 보고서로 병합합니다.
+# 한국어는 글자당 토큰 수가 영어와 크게 달라 글자 수로 자르면 너무 많이 또는 너무 적게 잘리므로
+# 토큰 수로 계산합니다. gpt-4o의 128K 컨텍스트에서 지시문과 출력(4000 토큰)을 빼고도 충분히 여유가 있는 크기입니다.
+CHUNK_TOKENS = 20000
+MAX_CHUNKS = 8
+
+MERGE_PROMPT = """
+        다음은 한 사람의 블로그 글을 여러 부분으로 나누어 각각 분석한 부분 보고서들입니다.
+        부분 보고서들의 내용을 종합하여 하나의 완성된 자기 분석 보고서로 병합해주세요.
         
-        # 디버깅을 위해 여기서 바로 기본 분석 결과 반환 (실제 API 호출 방지)
-        logger.debug("OpenAI API 대신 기본 분석 결과 사용")
-        return create_default_analysis_result(content)
+        - 여러 부분에서 반복적으로 드러나는 특징을 중심으로 정리하고, 중복되는 내용은 합쳐주세요.
+        - 부분 보고서에 언급된 포스트 제목 등의 구체적인 예시는 최대한 유지해주세요.
+        - 각 카테고리별로 최소 1000자 이상의 상세한 분석을 한국어로 작성해주세요.
         
-        # 아래 코드는 OpenAI API가 정상 작동할 때 활성화
-        """
-        try:
-            # Make the API call to gpt-4o
-            # the newest OpenAI model is "gpt-4o" which was released May 13, 2024.
-            # do not change this unless explicitly requested by the user
-            logger.debug("OpenAI API 호출 시작 - model: gpt-4o")
-            
-            # 재시도 메커니즘 추가
-            max_retries = 3
-            retry_count = 0
-            retry_delay = 10  # 초 단위
-            last_error = None
-            response = None  # 변수 초기화하여 경고 방지
-            
-            while retry_count < max_retries:
-                try:
-                    response = openai.chat.completions.create(
-                        model="gpt-4o",
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": "당신은 작성된 내용에서 통찰력을 추출하는 데 특화된 심리 분석가입니다. 제공된 텍스트를 바탕으로 한국어로 사려 깊고 미묘한 분석을 제공하세요. 모든 응답은 한국어로만 작성해야 합니다."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt.format(content=content)
-                            }
-                        ],
-                        response_format={"type": "json_object"},
-                        max_tokens=4000,
-                        temperature=0.7,
-                        timeout=180  # 3분(180초)으로 타임아웃 설정 늘림
-                    )
-                    # 성공했으면 반복문 종료
-                    break
-                    
-                except Exception as e:
-                    logger.error(f"OpenAI API 호출 시도 {retry_count+1}/{max_retries} 실패: {str(e)}")
-                    last_error = e
-                    retry_count += 1
-                    
-                    if retry_count < max_retries:
-                        import time
-                        logger.debug(f"{retry_delay}초 후 재시도...")
-                        time.sleep(retry_delay)
-                    
-            # 모든 재시도 후에도 실패하면 기본값 반환
-            if retry_count == max_retries or response is None:
-                logger.error(f"OpenAI API 최대 재시도 횟수 초과 또는 응답이 없음, 기본 분석 결과 반환: {str(last_error)}")
-                return create_default_analysis_result(content)
-                
-        except Exception as api_error:
-            logger.error(f"OpenAI API 호출 과정에서 오류 발생: {str(api_error)}")
-            # 기본 분석 결과 반환
-            return create_default_analysis_result(content)
+        응답은 다음 카테고리를 키로 하는 JSON 객체 형식으로 제공해주세요:
+        "characteristics", "strengths", "weaknesses", "thinking_patterns", 
+        "decision_making", "unconscious_biases", "advice"
+        
+        부분 보고서 목록은 다음 사용자 메시지로 제공됩니다.
         """
+
+# app.py의 analyze_blog에서 붙이는 포스트 구분선
+_POST_BOUNDARY_RE = re.compile(r'(?m)^(?====== 포스트 )')
+
+# 잘린 JSON 응답 복구용 "키": 패턴
+_JSON_KEY_RE = re.compile(r'"(\w+)"\s*:\s*')
+
+
+def _get_loop():
+    """
+    분석 전용 이벤트 루프를 반환합니다. 최초 호출 시 백그라운드 스레드에서 루프를 시작합니다.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="analyzer-loop", daemon=True).start()
+    return _loop
+
+
+async def _request_analysis(instructions, user_content, on_token=None):
+    """
+    OpenAI API에 분석을 요청하고 응답 문자열을 반환합니다.
+    
+    Args:
+        instructions (str): 고정된 지시문 (ANALYSIS_PROMPT 또는 MERGE_PROMPT)
+        user_content (str): 사용자 메시지로 전달할 내용 (블로그 내용 또는 부분 보고서)
+        on_token (callable, optional): 지정하면 응답을 스트리밍으로 받아 생성된 토큰마다 호출
         
-        # Parse the response
+    Returns:
+        str or None: 모델이 생성한 JSON 문자열, 모든 재시도가 실패하면 None
+    """
+    # Make the API call to gpt-4o
+    # the newest OpenAI model is "gpt-4o" which was released May 13, 2024.
+    # do not change this unless explicitly requested by the user
+    logger.debug(f"OpenAI API 호출 시작 - model: {ANALYSIS_MODEL}")
+    
+    # 재시도 메커니즘
+    max_retries = 3
+    retry_delay = 10  # 초 단위
+    last_error = None
+    
+    for retry_count in range(max_retries):
         try:
-            response_content = response.choices[0].message.content
-            logger.debug(f"Raw API response: {response_content[:500]}...")  # 로그에 응답 확인 (처음 500자)
-            
-            result = json.loads(response_content)
+            response = await openai.chat.completions.create(
+                model=ANALYSIS_MODEL,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": SYSTEM_PROMPT
+                    },
+                    {
+                        "role": "system",
+                        "content": instructions
+                    },
+                    {
+                        "role": "user",
+                        "content": user_content
+                    }
+                ],
+                response_format={"type": "json_object"},
+                max_tokens=4000,
+                temperature=0.7,
+                stream=on_token is not None
+            )
+            if on_token is None:
+                return response.choices[0].message.content
             
-            # API 응답 키는 대문자로 시작할 수 있으므로 소문자로 변환하여 표준화
-            # OpenAI API가 "Characteristics" 형식으로 반환할 수 있음
-            normalized_result = {}
-            for key, value in result.items():
-                # 대소문자 구분 없이 키를 소문자로 변환
-                normalized_key = key.lower()
-                normalized_result[normalized_key] = value
+            # 스트리밍 응답: 토큰이 도착하는 대로 전달하고 전체 응답을 모아서 반환
+            parts = []
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    on_token(delta)
+            return "".join(parts)
             
-            # 표준화된 결과 사용
-            result = normalized_result
+        except Exception as e:
+            logger.error(f"OpenAI API 호출 시도 {retry_count+1}/{max_retries} 실패: {str(e)}")
+            last_error = e
             
-            # 결과 검증 - 모든 필요한 키가 있는지 확인
-            required_keys = ['characteristics', 'strengths', 'weaknesses', 'thinking_patterns', 
-                             'decision_making', 'unconscious_biases', 'advice']
-            
-            # 모든 키를 소문자로 비교
-            missing_keys = [key for key in required_keys if key not in result or not result[key]]
-            
-            if missing_keys:
-                logger.warning(f"API 응답에 일부 키가 누락되었습니다: {missing_keys}")
-                # 누락된 키에 기본 값 제공
-                for key in missing_keys:
-                    result[key] = f"블로그 내용에서 {key}에 대한 충분한 정보를 찾을 수 없습니다."
-            
-            # 모든 값이 적어도 몇 글자 이상인지 확인
-            for key in required_keys:
-                if len(str(result.get(key, ""))) < 10:
-                    result[key] = f"블로그 내용에서 {key}에 대한 충분한 정보를 분석하지 못했습니다."
-            
-            logger.debug("Analysis completed successfully")
-            return result
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON 파싱 오류: {str(e)}")
-            # response가 정의되었는지 확인하고 로그 출력
-            if response and hasattr(response, 'choices') and response.choices:
-                logger.error(f"원본 응답: {response.choices[0].message.content[:1000]}...")
-            else:
-                logger.error("응답 객체가 없거나 올바른 형식이 아닙니다.")
+            if retry_count + 1 < max_retries:
+                logger.debug(f"{retry_delay}초 후 재시도...")
+                # 대기 중에도 이벤트 루프는 다른 분석 요청을 계속 처리
+                await asyncio.sleep(retry_delay)
+    
+    logger.error(f"OpenAI API 최대 재시도 횟수 초과, 기본 분석 결과 반환: {str(last_error)}")
+    return None
+
+
+def _recover_partial_json(response_content):
+    """
+    중간에 끊긴 JSON 응답에서 읽을 수 있는 "키": "문자열" 쌍을 앞에서부터 순서대로 복구합니다.
+    마지막 값이 잘려 있으면 잘린 지점까지의 문자열을 사용합니다.
+    
+    Args:
+        response_content (str): 모델이 생성한 (불완전한) JSON 문자열
+        
+    Returns:
+        dict: 복구된 키와 값
+    """
+    decoder = json.JSONDecoder()
+    result = {}
+    pos = 0
+    
+    while True:
+        match = _JSON_KEY_RE.search(response_content, pos)
+        if not match:
+            break
+        
+        key = match.group(1)
+        value_start = match.end()
+        try:
+            value, pos = decoder.raw_decode(response_content, value_start)
+            if isinstance(value, str):
+                result[key] = value
+        except json.JSONDecodeError:
+            # 잘린 문자열 값: 끝에 걸린 불완전한 이스케이프 시퀀스를 버리고 따옴표를 닫아 디코딩
+            tail = response_content[value_start:]
+            if tail.startswith('"'):
+                for cut in range(7):
+                    try:
+                        result[key] = json.loads(tail[:len(tail) - cut] + '"')
+                        break
+                    except json.JSONDecodeError:
+                        continue
+            break
+    
+    return result
+
+
+def _parse_analysis_response(response_content, content):
+    """
+    모델 응답(JSON 문자열)을 분석 결과 딕셔너리로 변환하고 검증합니다.
+    
+    Args:
+        response_content (str): 모델이 생성한 JSON 문자열
+        content (str): 분석한 블로그 내용 (파싱 실패 시 기본 분석에 사용)
+        
+    Returns:
+        dict: 7개 카테고리를 모두 포함하는 분석 결과
+    """
+    try:
+        logger.debug(f"Raw API response: {response_content[:500]}...")  # 로그에 응답 확인 (처음 500자)
+        
+        result = json.loads(response_content)
+    except json.JSONDecodeError as e:
+        logger.error(f"JSON 파싱 오류: {str(e)}")
+        logger.error(f"원본 응답: {response_content[:1000]}...")
+        
+        # max_tokens에 걸려 응답이 중간에 끊긴 경우, 완성된 카테고리까지는 살려서 사용
+        result = _recover_partial_json(response_content)
+        if not result:
             # 기본 분석 결과 반환
             return create_default_analysis_result(content)
+        logger.warning(f"잘린 응답에서 {len(result)}개 카테고리를 복구했습니다: {list(result)}")
+    
+    # API 응답 키는 대문자로 시작할 수 있으므로 소문자로 변환하여 표준화
+    # OpenAI API가 "Characteristics" 형식으로 반환할 수 있음
+    result = {key.lower(): value for key, value in result.items()}
+    
+    # 결과 검증 - 모든 필요한 키가 있는지 확인
+    missing_keys = [key for key in REQUIRED_KEYS if key not in result or not result[key]]
+    
+    if missing_keys:
+        logger.warning(f"API 응답에 일부 키가 누락되었습니다: {missing_keys}")
+        # 누락된 키에 기본 값 제공
+        for key in missing_keys:
+            result[key] = f"블로그 내용에서 {key}에 대한 충분한 정보를 찾을 수 없습니다."
+    
+    # 모든 값이 적어도 몇 글자 이상인지 확인
+    for key in REQUIRED_KEYS:
+        if len(str(result.get(key, ""))) < 10:
+            result[key] = f"블로그 내용에서 {key}에 대한 충분한 정보를 분석하지 못했습니다."
+    
+    logger.debug("Analysis completed successfully")
+    return result
+
+
+def _get_encoder():
+    """
+    분석 모델의 토크나이저를 반환합니다. 초기화 비용이 크므로 한 번만 만들어 재사용합니다.
+    
+    Returns:
+        tiktoken.Encoding or None: 토크나이저, tiktoken을 사용할 수 없으면 None
+    """
+    global _encoder
+    if _encoder is None:
+        # 초기화가 끝나기 전에 다른 스레드가 글자 수 기준으로 나누지 않도록 잠금 안에서 한 번만 생성
+        with _encoder_lock:
+            if _encoder is None:
+                encoder = False
+                if tiktoken is not None:
+                    try:
+                        encoder = tiktoken.encoding_for_model(ANALYSIS_MODEL)
+                    except Exception as e:
+                        logger.warning(f"토크나이저 초기화 실패, 글자 수로 분량을 계산합니다: {str(e)}")
+                _encoder = encoder
+    return _encoder or None
+
+
+def _split_by_tokens(text):
+    """
+    텍스트를 CHUNK_TOKENS 이하의 조각들로 나누고 각 조각의 토큰 수를 함께 반환합니다.
+    
+    Args:
+        text (str): 나눌 텍스트
+        
+    Returns:
+        list: (조각 문자열, 토큰 수) 튜플 목록
+    """
+    encoder = _get_encoder()
+    if encoder is None:
+        # 토크나이저가 없으면 한국어 기준으로 글자 하나를 토큰 하나로 보수적으로 계산
+        return [(text[i:i + CHUNK_TOKENS], len(text[i:i + CHUNK_TOKENS]))
+                for i in range(0, len(text), CHUNK_TOKENS)]
+    
+    tokens = encoder.encode(text)
+    if len(tokens) <= CHUNK_TOKENS:
+        return [(text, len(tokens))]
+    return [(encoder.decode(tokens[i:i + CHUNK_TOKENS]), len(tokens[i:i + CHUNK_TOKENS]))
+            for i in range(0, len(tokens), CHUNK_TOKENS)]
+
+
+def _split_content(content):
+    """
+    블로그 내용을 포스트 경계 기준으로 CHUNK_TOKENS 이하의 청크들로 나눕니다.
+    
+    Args:
+        content (str): 분석할 블로그 내용
+        
+    Returns:
+        list: 청크 문자열 목록 (최대 MAX_CHUNKS개)
+    """
+    chunks = []
+    current = []
+    current_tokens = 0
+    
+    for post in _POST_BOUNDARY_RE.split(content):
+        if not post:
+            continue
+        # 한 포스트가 청크 크기를 넘으면 강제로 잘라서 담음
+        for piece, piece_tokens in _split_by_tokens(post):
+            if current and current_tokens + piece_tokens > CHUNK_TOKENS:
+                chunks.append("".join(current))
+                current = []
+                current_tokens = 0
+            current.append(piece)
+            current_tokens += piece_tokens
+    
+    if current:
+        chunks.append("".join(current))
+    
+    # 청크가 너무 많으면 앞부분과 뒷부분을 균등하게 사용하여 전체 내용을 대표할 수 있도록 함
+    if len(chunks) > MAX_CHUNKS:
+        logger.debug(f"청크 수 제한: {len(chunks)}개 -> {MAX_CHUNKS}개")
+        half = MAX_CHUNKS // 2
+        chunks = chunks[:half] + chunks[-(MAX_CHUNKS - half):]
+    
+    return chunks
+
+
+async def _analyze_chunk(chunk, on_token=None):
+    """
+    청크 하나를 분석하여 7개 카테고리의 부분 분석 결과를 반환합니다.
+    
+    Args:
+        chunk (str): 블로그 내용의 일부
+        on_token (callable, optional): 스트리밍 토큰 콜백
+        
+    Returns:
+        dict or None: 부분 분석 결과, 요청이 실패하면 None
+    """
+    response_content = await _request_analysis(ANALYSIS_PROMPT, chunk, on_token)
+    if response_content is None:
+        return None
+    return _parse_analysis_response(response_content, chunk)
+
+
+async def _merge_partial_results(partials, content, on_token=None):
+    """
+    청크별 부분 분석 결과들을 하나의 보고서로 병합합니다.
+    
+    Args:
+        partials (list): 부분 분석 결과 딕셔너리 목록
+        content (str): 전체 블로그 내용 (병합 실패 시 기본 분석에 사용)
+        on_token (callable, optional): 스트리밍 토큰 콜백
+        
+    Returns:
+        dict: 병합된 분석 결과
+    """
+    partials_text = "\n\n".join(
+        f"[부분 보고서 {i}]\n{json.dumps(partial, ensure_ascii=False)}"
+        for i, partial in enumerate(partials, 1)
+    )
+    response_content = await _request_analysis(MERGE_PROMPT, partials_text, on_token)
+    if response_content is None:
+        # 병합 요청이 실패하면 부분 결과를 카테고리별로 이어 붙여 사용
+        logger.warning("부분 분석 병합 요청 실패, 부분 결과를 이어 붙여 사용합니다.")
+        return {
+            key: "\n\n".join(str(partial.get(key, "")) for partial in partials)
+            for key in REQUIRED_KEYS
+        }
+    return _parse_analysis_response(response_content, content)
+
+
+async def _embed_content(content):
+    """
+    의미 기반 캐시 조회를 위해 블로그 내용 앞부분의 임베딩을 생성합니다.
+    
+    Args:
+        content (str): 분석할 블로그 내용
+        
+    Returns:
+        list or None: 임베딩 벡터, 실패하면 None
+    """
+    try:
+        response = await openai.embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=content[:EMBEDDING_INPUT_CHARS]
+        )
+        return response.data[0].embedding
+    except Exception as e:
+        logger.error(f"임베딩 생성 오류: {str(e)}")
+        return None
+
+
+async def _analyze_content(content, on_token=None):
+    """
+    블로그 내용을 청크별로 병렬 분석한 뒤 하나의 결과로 병합합니다.
+    
+    Args:
+        content (str): 분석할 블로그 내용
+        on_token (callable, optional): 최종 보고서를 생성하는 요청의 스트리밍 토큰 콜백
+        
+    Returns:
+        dict or None: 분석 결과, 모든 요청이 실패하면 None
+    """
+    # 내용을 잘라내는 대신 청크로 나누어 병렬로 분석 (map)
+    chunks = _split_content(content)
+    logger.debug(f"총 {len(content)} 글자를 {len(chunks)}개 청크로 나누어 분석합니다.")
+    
+    if len(chunks) == 1:
+        # 청크가 하나면 그 분석 결과가 최종 보고서이므로 바로 스트리밍
+        return await _analyze_chunk(chunks[0], on_token)
+    
+    results = await asyncio.gather(*[_analyze_chunk(chunk) for chunk in chunks])
+    partials = [result for result in results if result is not None]
+    
+    if not partials:
+        return None
+    
+    if len(partials) == 1:
+        return partials[0]
+    
+    # 부분 분석 결과를 하나의 보고서로 병합 (reduce)
+    return await _merge_partial_results(partials, content, on_token)
+
+
+async def analyze_blog_content_async(content, on_token=None, cache_scope=None):
+    """
+    Analyze blog content using OpenAI API to generate a comprehensive self-analysis.
+    
+    Args:
+        content (str): The blog content to analyze
+        on_token (callable, optional): 최종 보고서 응답을 스트리밍으로 받을 토큰 콜백
+        cache_scope (str, optional): 의미 기반 캐시를 나눌 범위 (예: 블로그를 등록한 사용자)
+                                     - 지정하지 않으면 의미 기반 캐시를 사용하지 않음
+    
+    Returns:
+        dict: A dictionary containing the analysis results
+    """
+    # OpenAI 클라이언트가 없거나 API 키가 없는 경우 기본 분석 결과 사용
+    if openai is None or not OPENAI_API_KEY:
+        logger.warning("OpenAI API가 구성되지 않았거나 API 키가 없습니다. 기본 분석 결과를 사용합니다.")
+        return create_default_analysis_result(content)
+        
+    try:
+        logger.debug("Starting content analysis with OpenAI API")
+        
+        if not OPENAI_ANALYSIS_ENABLED:
+            # 디버깅을 위해 여기서 바로 기본 분석 결과 반환 (실제 API 호출 방지)
+            logger.debug("OpenAI API 대신 기본 분석 결과 사용")
+            return create_default_analysis_result(content)
+        
+        # 같은 내용을 다시 분석하는 경우 캐시된 결과를 그대로 사용
+        cache_key = make_cache_key(content, PROMPT_VERSION, ANALYSIS_MODEL)
+        cached_result = get_cached_result(cache_key)
+        if cached_result is not None:
+            logger.debug("캐시된 분석 결과 사용")
+            return cached_result
+        
+        # 내용이 거의 같은 블로그(예: 새 포스트 하나만 추가된 경우)의 분석 결과 재사용
+        # 비슷하기만 한 다른 사용자의 블로그 분석 결과가 반환되지 않도록 사용자(범위)별로 따로 저장
+        # (내용이 완전히 같을 때만 쓰는 위의 캐시는 요청한 쪽도 같은 내용을 가지고 있으므로 범위를 나누지 않음)
+        embedding = None
+        if cache_scope:
+            semantic_namespace = f"analyze:semantic:{PROMPT_VERSION}:{ANALYSIS_MODEL}:{cache_scope}"
+            embedding = await _embed_content(content)
+        if embedding is not None:
+            similar_result = find_similar_result(semantic_namespace, embedding)
+            if similar_result is not None:
+                return similar_result
+        
+        result = await _analyze_content(content, on_token)
+        if result is not None:
+            set_cached_result(cache_key, result)
+            if embedding is not None:
+                add_semantic_result(semantic_namespace, embedding, result)
+            return result
+        
+        return create_default_analysis_result(content)
         
     except Exception as e:
         logger.error(f"Error during content analysis: {str(e)}")
@@ -367,3 +718,64 @@ def analyze_blog_content(content):
             "unconscious_biases": "분석 오류로 인해 정보를 제공할 수 없습니다.",
             "advice": "다시 시도하시거나 문제가 지속되면 지원팀에 문의하세요."
         }
+
+
+def analyze_blog_content(content, cache_scope=None):
+    """
+    동기 코드(Flask 라우트)에서 호출하는 분석 진입점입니다.
+    분석 전용 이벤트 루프에 작업을 넘기고 결과를 기다리므로, 대기 중인 워커 스레드들의
+    OpenAI 요청이 하나의 루프에서 동시에 진행됩니다.
+    
+    Args:
+        content (str): The blog content to analyze
+        cache_scope (str, optional): 의미 기반 캐시를 나눌 범위
+    
+    Returns:
+        dict: A dictionary containing the analysis results
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        analyze_blog_content_async(content, cache_scope=cache_scope), _get_loop()
+    )
+    return future.result()
+
+
+def stream_blog_content_analysis(content, cache_scope=None):
+    """
+    블로그 내용을 분석하면서 모델이 생성하는 토큰을 순서대로 내보내는 제너레이터입니다.
+    SSE 라우트에서 사용하며, 분석은 분석 전용 이벤트 루프에서 진행됩니다.
+    
+    Args:
+        content (str): The blog content to analyze
+        cache_scope (str, optional): 의미 기반 캐시를 나눌 범위
+    
+    Yields:
+        tuple: 생성된 토큰마다 ('token', str), 마지막으로 ('result', dict)
+        
+    결과를 내보내기 전에 제너레이터를 닫으면 진행 중인 분석을 취소합니다.
+    """
+    events = queue.Queue()
+    
+    async def run():
+        try:
+            result = await analyze_blog_content_async(
+                content, on_token=lambda token: events.put(('token', token)), cache_scope=cache_scope
+            )
+        except Exception as e:
+            logger.error(f"스트리밍 분석 중 오류: {str(e)}")
+            result = create_default_analysis_result(content)
+        events.put(('result', result))
+    
+    future = asyncio.run_coroutine_threadsafe(run(), _get_loop())
+    
+    finished = False
+    try:
+        while True:
+            event = events.get()
+            yield event
+            if event[0] == 'result':
+                finished = True
+                break
+    finally:
+        # 결과를 받기 전에 제너레이터가 닫히면(SSE 클라이언트 연결 종료) 남은 OpenAI 요청을 취소
+        if not finished:
+            future.cancel()
@@ -1,16 +1,28 @@
 import os
 import logging
+import time
 import threading
+import hashlib
+import uuid
+import warnings
+from datetime import datetime, timedelta
 from queue import Queue
-from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify
+from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, Response, stream_with_context, abort
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import text, insert, update, delete, values, column, event, inspect as sa_inspect
+from sqlalchemy.exc import DisconnectionError, IntegrityError
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from werkzeug.exceptions import HTTPException
 from werkzeug.middleware.proxy_fix import ProxyFix
-import time
-import urllib.parse
+import json
 import markupsafe
 import re
-from datetime import datetime
+import lxml.html
+from lxml.etree import ParserError
+from cachelib import SimpleCache, FileSystemCache
 
 # Set up logging
 logging.basicConfig(level=logging.DEBUG)
@@ -27,19 +39,47 @@ app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1) # needed for url_for
 
 # configure the database, relative to the app instance folder
 app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL", "sqlite:///daisy.db")
+# 매 체크아웃마다 SELECT 1을 보내는 pool_pre_ping 대신, 오래 쉬었던 연결만 확인 (아래 _ping_idle_connection)
 app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
-    "pool_recycle": 300,
-    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+    "pool_pre_ping": False,
 }
+# 동시 요청(/status 폴링, 분석 워커, 보고서 조회)이 연결을 기다리지 않도록 연결 풀 크기 설정
+# SQLite는 자체 풀(SingletonThreadPool 등)을 사용하므로 풀 크기 옵션을 적용하지 않음
+# 배포 환경의 워커/스레드 수에 맞춰 환경 변수로 조정 (gunicorn.conf.py의 threads보다 크게 유지)
+if not app.config["SQLALCHEMY_DATABASE_URI"].startswith("sqlite"):
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"].update({
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 10)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 20)),
+        "pool_timeout": int(os.environ.get("DB_POOL_TIMEOUT", 30)),
+        "pool_use_lifo": True,  # 최근 사용한 연결을 우선 재사용하여 유휴 연결이 자연스럽게 정리되도록 함
+    })
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
-# 서버 세션 저장소 설정 - 쿠키 크기 문제 해결을 위해 파일 시스템 세션 사용
+# 서버 세션 저장소 설정 - 쿠키 크기 문제 해결을 위해 서버 측 세션 사용
 # Flask 기본 세션은 쿠키에 데이터를 저장하므로 크기 제한이 있음
 # 따라서 대용량 세션 데이터를 서버에 저장하도록 변경
-import os
+# REDIS_URL이 설정되어 있으면 Redis(여러 워커가 세션 공유), 없으면 파일 시스템 캐시 사용
 from flask_session import Session
-app.config['SESSION_TYPE'] = 'filesystem'
-app.config['SESSION_FILE_DIR'] = os.path.join(os.getcwd(), 'flask_session')
+_session_redis_url = os.environ.get("REDIS_URL")
+_session_redis = None
+if _session_redis_url:
+    try:
+        import redis
+        # Redis가 응답하지 않을 때 모든 요청이 세션 조회에서 오래 멈추지 않도록 연결/응답 시간 제한
+        _session_redis = redis.Redis(
+            connection_pool=redis.BlockingConnectionPool.from_url(
+                _session_redis_url, max_connections=32, socket_connect_timeout=2, socket_timeout=2
+            )
+        )
+    except ImportError:
+        logger.warning("redis 패키지가 설치되어 있지 않아 파일 시스템 세션을 사용합니다.")
+if _session_redis is not None:
+    app.config['SESSION_TYPE'] = 'redis'
+    app.config['SESSION_REDIS'] = _session_redis
+else:
+    app.config['SESSION_TYPE'] = 'cachelib'
+    app.config['SESSION_CACHELIB'] = FileSystemCache(os.path.join(os.getcwd(), 'flask_session'), threshold=500)
 app.config['SESSION_PERMANENT'] = False
 app.config['SESSION_USE_SIGNER'] = True
 Session(app)
@@ -52,21 +92,202 @@ db.init_app(app)
 def nl2br_filter(text):
     if not text:
         return ''
-    # 개행 문자를 <br> 태그로 변경
-    text = str(text)  # 문자열로 변환
-    text = markupsafe.escape(text)  # HTML 이스케이프
-    text = re.sub(r'\n', '<br>', text)
-    return markupsafe.Markup(text)
+    escaped = markupsafe.escape(text)
+    # 개행이 없으면 이스케이프 결과를 그대로 반환
+    if '\n' not in escaped:
+        return escaped
+    # HTML 이스케이프 후 개행 문자를 <br> 태그로 변경 (정규식 없이 str.replace 한 번으로 처리)
+    # Markup.replace는 인자를 이스케이프하므로 이스케이프 결과를 일반 문자열로 바꾼 뒤 치환
+    return markupsafe.Markup(str(escaped).replace('\n', '<br>'))
+
+# 이 시간(초) 이상 사용하지 않은 연결만 체크아웃 시 살아 있는지 확인
+DB_IDLE_PING_SECONDS = 60
+
+def _mark_connection_used(dbapi_connection, connection_record):
+    """
+    연결이 풀로 반환된 시각을 기록합니다.
+    """
+    connection_record.info['last_used'] = time.monotonic()
+
+def _ping_idle_connection(dbapi_connection, connection_record, connection_proxy):
+    """
+    오래 쉬었던 연결만 SELECT 1로 확인하고, 끊어졌으면 풀이 새 연결을 만들도록 합니다.
+    /status 폴링처럼 자주 호출되는 요청에서는 추가 왕복이 생기지 않습니다.
+    """
+    last_used = connection_record.info.get('last_used')
+    if last_used is not None and time.monotonic() - last_used < DB_IDLE_PING_SECONDS:
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("SELECT 1")
+    except Exception as e:
+        logger.warning(f"끊어진 DB 연결 교체: {str(e)}")
+        raise DisconnectionError() from e
+    finally:
+        try:
+            cursor.close()
+        except Exception:
+            pass
+
+# 본문 링크에 남아 있는 logNo 추출용 정규식
+_LOGNO_RE = re.compile(r'logNo=(\d+)')
+
+def backfill_post_lognos():
+    """
+    logNo 컬럼이 추가되기 전에 저장된 포스트의 logNo를 본문 링크에서 찾아 채웁니다.
+    본문에 'logNo='가 포함된 행만 조회하므로 한 번 채워진 뒤에는 거의 비용이 들지 않습니다.
+    """
+    try:
+        rows = db.session.query(BlogPost.id, BlogPost.content).filter(
+            BlogPost.logNo.is_(None), BlogPost.content.contains('logNo=')
+        ).all()
+        updates = []
+        for post_id, content in rows:
+            match = _LOGNO_RE.search(content)
+            if match:
+                updates.append({'id': post_id, 'logNo': match.group(1)})
+        if updates:
+            db.session.execute(update(BlogPost), updates)
+            db.session.commit()
+            logger.info(f"포스트 logNo {len(updates)}건 보정")
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"포스트 logNo 보정 중 오류: {str(e)}")
+
+def has_post_logno_unique_index():
+    """
+    blog_post 테이블에 (blog_id, logNo) 유니크 인덱스/제약이 있는지 확인합니다.
+    유니크 인덱스가 추가되기 전에 만들어진 테이블은 create_all이 변경하지 않기 때문입니다.
+    
+    Returns:
+        bool: 유니크 인덱스가 있으면 True
+    """
+    try:
+        inspector = sa_inspect(db.engine)
+        columns = ['blog_id', 'logNo']
+        # 식 기반 정렬 인덱스(ix_blogpost_blog_logno_sort)는 조회되지 않는다는 경고는 무시
+        # (SQLite의 get_unique_constraints도 내부에서 인덱스를 조회하므로 두 조회 모두 같은 블록에서 실행)
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', message='Skipped unsupported reflection of expression-based index')
+            indexes = inspector.get_indexes('blog_post')
+            constraints = inspector.get_unique_constraints('blog_post')
+        for index in indexes:
+            if index.get('unique') and index.get('column_names') == columns:
+                return True
+        for constraint in constraints:
+            if constraint.get('column_names') == columns:
+                return True
+        return False
+    except Exception as e:
+        logger.error(f"blog_post 인덱스 확인 중 오류: {str(e)}")
+        return False
+
+def migrate_report_created_at():
+    """
+    report.created_at이 문자열 컬럼으로 만들어진 예전 테이블을 DATETIME 컬럼으로 바꾸고 기본값을 설정합니다.
+    create_all은 기존 테이블의 컬럼 타입을 바꾸지 않기 때문입니다.
+    SQLite는 컬럼 타입을 바꿀 수 없지만 저장된 'YYYY-MM-DD HH:MM:SS' 문자열을 그대로 DATETIME으로 읽으므로
+    PostgreSQL에서만 변경합니다. (보고서 저장 시에는 항상 created_at 값을 넘기므로 기본값이 없어도 동작)
+    """
+    if db.engine.dialect.name != 'postgresql':
+        return
+    try:
+        columns = {col['name']: col for col in sa_inspect(db.engine).get_columns('report')}
+        created_at = columns.get('created_at')
+        if created_at is None or not isinstance(created_at['type'], db.String):
+            return
+        with db.engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE report "
+                "ALTER COLUMN created_at TYPE TIMESTAMP WITHOUT TIME ZONE "
+                "USING COALESCE(NULLIF(created_at, '')::timestamp, now()::timestamp), "
+                "ALTER COLUMN created_at SET DEFAULT now()"
+            ))
+        logger.info("report.created_at 컬럼을 TIMESTAMP로 변경")
+    except Exception as e:
+        logger.error(f"report.created_at 컬럼 변경 중 오류: {str(e)}")
+
+def migrate_blog_owner():
+    """
+    예전 blog 테이블에 naver_user_id 컬럼과 (url, naver_user_id) 유니크 인덱스를 추가하고,
+    URL 하나만 유니크했던 uq_blog_url 제약을 제거합니다.
+    create_all은 기존 테이블에 컬럼이나 제약을 추가하지 않기 때문입니다.
+    """
+    try:
+        inspector = sa_inspect(db.engine)
+        column_names = {col['name'] for col in inspector.get_columns('blog')}
+        has_old_unique = any(c.get('name') == 'uq_blog_url' for c in inspector.get_unique_constraints('blog'))
+        has_owner_unique = any(
+            c.get('column_names') == ['url', 'naver_user_id'] for c in inspector.get_unique_constraints('blog')
+        ) or any(
+            i.get('unique') and i.get('column_names') == ['url', 'naver_user_id'] for i in inspector.get_indexes('blog')
+        )
+        
+        with db.engine.begin() as conn:
+            if 'naver_user_id' not in column_names:
+                conn.execute(text("ALTER TABLE blog ADD COLUMN naver_user_id VARCHAR(64)"))
+                logger.info("blog.naver_user_id 컬럼 추가")
+            if not has_owner_unique:
+                conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS uq_blog_url_user ON blog (url, naver_user_id)"))
+            if has_old_unique:
+                if db.engine.dialect.name == 'postgresql':
+                    conn.execute(text("ALTER TABLE blog DROP CONSTRAINT IF EXISTS uq_blog_url"))
+                    logger.info("blog uq_blog_url 제약 제거")
+                else:
+                    # SQLite는 테이블 제약을 지울 수 없으므로, 이미 다른 사용자가 등록한 URL은 새로 등록하지 못함
+                    logger.warning("uq_blog_url 제약을 제거하지 못해 같은 블로그를 여러 사용자가 등록할 수 없습니다.")
+    except Exception as e:
+        logger.error(f"blog 소유자 컬럼 추가 중 오류: {str(e)}")
+
+def ensure_post_indexes():
+    """
+    이미 만들어진 blog_post 테이블에 새로 추가된 인덱스가 없으면 만듭니다.
+    create_all은 기존 테이블에 새 인덱스를 만들지 않기 때문입니다.
+    """
+    # 최신순 정렬용 인덱스 - 식 기반 인덱스는 인스펙터가 조회하지 못하므로 CREATE INDEX IF NOT EXISTS로 생성
+    # 숫자가 아닌 logNo에서 CAST 오류가 나던 예전 정렬 인덱스(ix_blogpost_blog_logno_num)는 삭제
+    try:
+        with db.engine.begin() as conn:
+            conn.execute(text("DROP INDEX IF EXISTS ix_blogpost_blog_logno_num"))
+            for index in BlogPost.__table__.indexes:
+                if index.name == 'ix_blogpost_blog_logno_sort':
+                    conn.execute(CreateIndex(index, if_not_exists=True))
+    except Exception as e:
+        logger.error(f"포스트 정렬 인덱스 생성 중 오류: {str(e)}")
+    
+    # (blog_id, logNo) 유니크 인덱스 - 예전 테이블에는 같은 이름의 일반 인덱스만 있으므로 다른 이름으로 생성
+    # PostgreSQL에서는 다른 워커의 쓰기를 막지 않도록 CONCURRENTLY로 만들며, 이는 트랜잭션 밖에서만 가능
+    if has_post_logno_unique_index():
+        return
+    concurrently = "CONCURRENTLY " if db.engine.dialect.name == 'postgresql' else ""
+    try:
+        with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text(
+                f'CREATE UNIQUE INDEX {concurrently}IF NOT EXISTS uq_blogpost_blog_logno ON blog_post (blog_id, "logNo")'
+            ))
+        logger.info("포스트 (blog_id, logNo) 유니크 인덱스 추가")
+    except Exception as e:
+        # 이미 중복 저장된 포스트가 있으면 실패하며, 이 경우 저장 시 기존처럼 조회로 중복을 거름
+        logger.warning(f"포스트 유니크 인덱스를 만들지 못했습니다: {str(e)}")
 
 with app.app_context():
     # Import the models here to create their tables
-    from models import User, Blog, BlogPost, Report
+    from models import User, Blog, BlogPost, Report, AnalysisJob, logno_sort_key
     db.create_all()
+    backfill_post_lognos()
+    migrate_report_created_at()
+    migrate_blog_owner()
+    ensure_post_indexes()
+    
+    # SQLite는 네트워크 연결이 아니므로 연결 확인 불필요
+    if not app.config["SQLALCHEMY_DATABASE_URI"].startswith("sqlite"):
+        event.listen(db.engine, 'checkin', _mark_connection_used)
+        event.listen(db.engine, 'checkout', _ping_idle_connection)
 
 from scraper import extract_blog_id
-from analyzer import analyze_blog_content
-from oauth_handler import get_authorization_url, get_token_from_code, get_user_info
-from oauth_scraper import scrape_blog_with_oauth
+from blog_scraper_pipeline import normalize_date_format, normalize_date_formats, scrape_blog_pipeline
+from analyzer import analyze_blog_content, stream_blog_content_analysis
+from oauth_handler import get_authorization_url, get_token_from_code, get_user_info, invalidate_user_info
 
 @app.route('/')
 def index():
@@ -138,6 +359,17 @@ def oauth_callback():
         flash('로그인 콜백 처리 중 오류가 발생했습니다.', 'danger')
         return redirect(url_for('index'))
 
+@app.route('/oauth/logout')
+def oauth_logout():
+    """
+    로그아웃 처리 - 세션과 캐시된 사용자 정보 삭제
+    """
+    invalidate_user_info(session.get('access_token'))
+    for key in ('access_token', 'refresh_token', 'user_id', 'user_name', 'user_email'):
+        session.pop(key, None)
+    flash('로그아웃했습니다.', 'info')
+    return redirect(url_for('index'))
+
 @app.route('/blog/form')
 def blog_form():
     """
@@ -150,6 +382,34 @@ def blog_form():
     
     return render_template('blog_form.html', user_name=session.get('user_name'))
 
+# 포스트 저장 시 INSERT 한 번에 보내는 최대 행 수
+POST_INSERT_BATCH_SIZE = 1000
+
+# blog_post 테이블에 (blog_id, logNo) 유니크 인덱스가 있는지 여부 (처음 저장할 때 한 번 확인)
+_post_logno_unique = None
+
+def post_insert_statement():
+    """
+    포스트 저장용 INSERT 문을 만듭니다. PostgreSQL/SQLite에서는 (blog_id, logNo)가 이미 있는 행을
+    DB가 건너뛰도록 ON CONFLICT DO NOTHING을 붙여, 같은 블로그를 동시에 제출해도 중복 저장되지 않습니다.
+    
+    Returns:
+        Insert: 딕셔너리 목록과 함께 실행할 INSERT 문
+    """
+    global _post_logno_unique
+    if _post_logno_unique is None:
+        _post_logno_unique = has_post_logno_unique_index()
+    
+    dialect = db.engine.dialect.name
+    if not _post_logno_unique:
+        # 유니크 인덱스가 없는 기존 DB에서는 ON CONFLICT 대상이 없어 오류가 나므로 일반 INSERT 사용
+        return insert(BlogPost)
+    if dialect == 'postgresql':
+        return pg_insert(BlogPost).on_conflict_do_nothing(index_elements=['blog_id', 'logNo'])
+    if dialect == 'sqlite':
+        return sqlite_insert(BlogPost).on_conflict_do_nothing(index_elements=['blog_id', 'logNo'])
+    return insert(BlogPost)
+
 @app.route('/blog/submit', methods=['POST'])
 def oauth_submit_blog():
     """
@@ -167,20 +427,40 @@ def oauth_submit_blog():
         return redirect(url_for('blog_form'))
     
     # 로그인 여부 확인
-    if 'access_token' not in session:
+    if 'access_token' not in session or not session.get('user_id'):
         flash('세션이 만료되었습니다. 다시 로그인해주세요.', 'warning')
         return redirect(url_for('oauth_login'))
+    naver_user_id = session['user_id']
     
     # 컨텍스트 매니저를 사용한 세션 관리
     try:
+        # 같은 사용자가 이미 보고서를 만든 블로그면 수집/분석을 다시 하지 않고 기존 보고서로 이동
+        # 다른 사용자의 보고서는 그 사용자의 비공개 글로 만들어졌으므로 재사용하지 않고 새로 수집
+        blog = Blog.query.filter_by(url=blog_url, naver_user_id=naver_user_id).first()
+        if blog is not None:
+            existing_report_id = find_report_id(blog.id)
+            if existing_report_id is not None:
+                flash('이미 분석한 블로그입니다. 기존 보고서로 이동합니다.', 'info')
+                return redirect(url_for('view_report', report_id=existing_report_id))
+        
         # 스크래핑 시작
         flash('블로그 콘텐츠 수집을 시작합니다...', 'info')
         
         # 세션 작업 시작 
-        # 데이터베이스에 블로그 등록
-        blog = Blog(url=blog_url)
-        db.session.add(blog)
-        db.session.flush()  # ID 생성을 위해 플러시 (아직 커밋은 안 함)
+        # 데이터베이스에 블로그 등록 (보고서 없이 등록만 된 블로그는 그대로 재사용)
+        if blog is None:
+            blog = Blog(url=blog_url, naver_user_id=naver_user_id)
+            db.session.add(blog)
+            try:
+                db.session.flush()  # ID 생성을 위해 플러시 (아직 커밋은 안 함)
+            except IntegrityError:
+                # 같은 사용자가 같은 URL을 동시에 제출한 경우 먼저 등록된 블로그 사용
+                db.session.rollback()
+                blog = Blog.query.filter_by(url=blog_url, naver_user_id=naver_user_id).first()
+                if blog is None:
+                    # URL만 유니크한 예전 SQLite 테이블에서 다른 사용자가 먼저 등록한 경우
+                    flash('다른 계정으로 이미 등록된 블로그입니다.', 'warning')
+                    return redirect(url_for('blog_form'))
         
         # 세션에 blog_id 저장 - 서버 세션 사용
         session['blog_id'] = blog.id
@@ -190,302 +470,1063 @@ def oauth_submit_blog():
         access_token = session['access_token']
         db.session.commit()  # 블로그 정보 먼저 저장
         
-        # 강화된 스크래핑 파이프라인 사용
+        # 스크래핑은 수십 초 이상 걸리므로 요청 처리 중에 실행하지 않고 백그라운드 워커에 맡김
+        # 수집이 끝나면 같은 워커가 보고서 생성 작업을 이어서 등록하고, 진행 상황 페이지는 /status를 폴링
+        # refresh=1이면 스크래핑 캐시를 무시하고 블로그를 다시 수집
+        refresh = request.values.get('refresh') == '1'
+        if enqueue_scrape(blog_id, blog_url, access_token, refresh=refresh):
+            logger.debug(f"블로그 수집 작업 등록: blog_id={blog_id}")
+        
+        return redirect(url_for('analyze_blog', blog_id=blog_id))
+    
+    except Exception as e:
+        # 외부 예외 처리 - 세션 확인 및 닫기
+        if db.session.is_active:
+            db.session.rollback()
+        
+        logger.error(f"블로그 제출 오류: {str(e)}")
+        flash(f'오류가 발생했습니다: {str(e)}', 'danger')
+        return redirect(url_for('blog_form'))
+
+# 쿠키 기반 스크래핑이 제거되었으므로 submit_blog 라우트도 제거
+
+def dedupe_posts_by_logno(posts):
+    """
+    스크래핑 결과에서 같은 logNo가 여러 번 나오면 마지막 항목만 남깁니다.
+    logNo가 없는 포스트는 저장 단계에서 제외되므로 그대로 둡니다.
+    
+    Args:
+        posts (list): 포스트 딕셔너리 목록
+        
+    Returns:
+        list: logNo 중복이 제거된 포스트 목록 (원래 순서 유지)
+    """
+    seen = set()
+    deduped = []
+    for post in reversed(posts):
+        log_no = post.get('logNo')
+        if log_no:
+            if log_no in seen:
+                continue
+            seen.add(log_no)
+        deduped.append(post)
+    deduped.reverse()
+    return deduped
+
+
+def bulk_update_posts(post_updates):
+    """
+    기존 포스트의 날짜와 비공개 상태를 일괄 갱신합니다.
+    PostgreSQL에서는 UPDATE ... FROM (VALUES ...) 한 문장으로 배치 단위 갱신을 처리하고,
+    그 외 DB에서는 기본 키 기준 executemany UPDATE를 사용합니다.
+    
+    Args:
+        post_updates (list): id, date, is_private 키를 가진 딕셔너리 목록
+    """
+    if db.engine.dialect.name != 'postgresql':
+        db.session.execute(update(BlogPost), post_updates)
+        return
+    
+    table = BlogPost.__table__
+    for start in range(0, len(post_updates), POST_INSERT_BATCH_SIZE):
+        batch = post_updates[start:start + POST_INSERT_BATCH_SIZE]
+        rows = values(
+            column('id', db.Integer), column('date', db.String), column('is_private', db.Boolean),
+            name='v'
+        ).data([(row['id'], row['date'], row['is_private']) for row in batch])
+        db.session.execute(
+            update(table).where(table.c.id == rows.c.id).values(date=rows.c.date, is_private=rows.c.is_private)
+        )
+
+
+def save_scraped_posts(blog_id, posts):
+    """
+    스크래핑한 포스트를 저장합니다. 이미 저장된 포스트(logNo 기준)는 날짜와 비공개 상태만 갱신합니다.
+    
+    Args:
+        blog_id (int): 블로그 ID
+        posts (list): scrape_blog_pipeline이 반환한 포스트 딕셔너리 목록
+        
+    Returns:
+        int: 새로 저장한 포스트 수
+    """
+    # 여러 수집 방식의 결과가 합쳐지면 같은 포스트가 두 번 들어올 수 있으므로 DB에 보내기 전에 정리
+    scraped_count = len(posts)
+    posts = dedupe_posts_by_logno(posts)
+    if len(posts) != scraped_count:
+        logger.debug(f"스크래핑 결과 내 중복 logNo {scraped_count - len(posts)}개 제거")
+    
+    # 스크래핑한 logNo 중 이미 저장된 포스트만 조회해서 logNo로 찾을 수 있게 정리
+    # (블로그의 기존 포스트 전체 대신 겹치는 행만 가져오고, IN 목록이 너무 길지 않도록 배치 단위로 조회)
+    incoming_lognos = [log_no for post in posts if (log_no := post.get('logNo'))]
+    existing_by_logno = {}
+    for start in range(0, len(incoming_lognos), POST_INSERT_BATCH_SIZE):
+        existing_rows = db.session.query(
+            BlogPost.id, BlogPost.logNo, BlogPost.date, BlogPost.is_private
+        ).filter(
+            BlogPost.blog_id == blog_id,
+            BlogPost.logNo.in_(incoming_lognos[start:start + POST_INSERT_BATCH_SIZE])
+        ).all()
+        existing_by_logno.update((row.logNo, row) for row in existing_rows)
+    
+    # 새로 저장할 포스트와 기존 포스트 계산
+    new_posts = []
+    post_updates = []
+    duplicates = 0
+    
+    # 중복 검사 및 처리
+    for post in posts:
+        log_no = post.get('logNo', '')
+        
+        # logNo가 없는 경우는 건너뛰기
+        if not log_no:
+            logger.warning(f"logNo가 없는 포스트 제외: {post.get('title')}")
+            continue
+        
+        # 중복 검사
+        existing_post = existing_by_logno.get(log_no)
+        if existing_post is not None:
+            duplicates += 1
+            logger.debug(f"중복 포스트 제외: logNo={log_no}, title={post.get('title')}")
+            
+            # 기존 포스트의 날짜나 비공개 상태 업데이트가 필요한 경우 변경 내용만 모아둠
+            changes = {}
+            # 날짜가 비어있거나 새 데이터에서 날짜가 있으면 업데이트
+            if (not existing_post.date or not existing_post.date.strip()) and post.get('date'):
+                changes['date'] = post.get('date')
+                logger.debug(f"기존 포스트 날짜 업데이트: logNo={log_no}")
+            
+            # 비공개 상태가 변경된 경우 업데이트
+            if existing_post.is_private != post.get('is_private', False):
+                changes['is_private'] = post.get('is_private', False)
+                logger.debug(f"비공개 상태 업데이트: logNo={log_no}")
+            
+            if changes:
+                # 행마다 같은 컬럼 구성으로 맞춰 두면 한 문장으로 일괄 UPDATE 가능
+                post_updates.append({
+                    'id': existing_post.id,
+                    'date': changes.get('date', existing_post.date),
+                    'is_private': changes.get('is_private', existing_post.is_private),
+                })
+        else:
+            # 새 포스트 추가
+            new_posts.append(post)
+    
+    # 기존 포스트 변경 사항은 기본 키 기준 일괄 UPDATE로 반영
+    if post_updates:
+        bulk_update_posts(post_updates)
+    
+    # 새 포스트만 저장 - ORM 객체를 만들지 않고 딕셔너리 목록을 다중 행 INSERT로 저장
+    # 포스트가 매우 많은 블로그에서 한 문장이 너무 커지지 않도록 배치 단위로 나눠 실행
+    new_post_rows = [
+        {
+            'blog_id': blog_id,
+            'title': post.get('title', ''),
+            'content': post.get('content', ''),
+            'date': post.get('date', ''),
+            'is_private': post.get('is_private', False),
+            'logNo': post.get('logNo', '')
+        }
+        for post in new_posts
+    ]
+    for start in range(0, len(new_post_rows), POST_INSERT_BATCH_SIZE):
+        db.session.execute(post_insert_statement(), new_post_rows[start:start + POST_INSERT_BATCH_SIZE])
+    
+    # 저장 결과 로깅
+    logger.info(f"총 {len(posts)}개 포스트 중 {len(new_posts)}개 저장, {duplicates}개 중복 제외")
+    
+    # 비공개 글 개수 계산 및 로깅
+    private_posts = [post for post in new_posts if post.get('is_private', False)]
+    private_count = len(private_posts)
+    logger.info(f"저장된 {len(new_posts)}개 포스트 중 공개글 {len(new_posts) - private_count}개, 비공개글 {private_count}개")
+    
+    # 스크래핑한 포스트는 다시 수집할 수 있으므로, PostgreSQL에서는 이 트랜잭션만 WAL 디스크 기록을
+    # 기다리지 않고 커밋 (서버 장애 시 직전 몇 건이 유실될 수 있으나 DB 정합성은 유지됨)
+    if new_post_rows and db.engine.dialect.name == 'postgresql':
+        db.session.execute(text("SET LOCAL synchronous_commit TO OFF"))
+    
+    # 업데이트와 새 포스트 INSERT를 하나의 트랜잭션으로 커밋
+    db.session.commit()
+    return len(new_posts)
+
+
+# 스크래핑 결과 캐시 - 같은 블로그를 짧은 시간 안에 다시 제출하면 네이버 요청 없이 이전 결과 재사용
+# 저장 위치는 SCRAPE_CACHE_DIR, 기본값은 인스턴스 폴더(instance/scrape_cache)이며 처음 사용할 때 만듭니다.
+SCRAPE_CACHE_TTL = int(os.environ.get("SCRAPE_CACHE_TTL", 900))
+_scrape_cache = None
+_scrape_cache_lock = threading.Lock()
+
+
+def _get_scrape_cache():
+    """
+    스크래핑 결과 캐시를 처음 사용할 때 만듭니다. 앱을 import하기만 해도 캐시 디렉터리가 생기지 않도록 합니다.
+    
+    Returns:
+        FileSystemCache: 스크래핑 결과 캐시
+    """
+    global _scrape_cache
+    if _scrape_cache is None:
+        with _scrape_cache_lock:
+            if _scrape_cache is None:
+                cache_dir = os.environ.get("SCRAPE_CACHE_DIR", os.path.join(app.instance_path, 'scrape_cache'))
+                _scrape_cache = FileSystemCache(cache_dir, threshold=500, default_timeout=SCRAPE_CACHE_TTL)
+    return _scrape_cache
+
+
+def _scrape_cache_key(blog_url, access_token):
+    """
+    블로그 URL과 액세스 토큰으로 스크래핑 결과 캐시 키를 만듭니다.
+    토큰마다 볼 수 있는 비공개 글이 다르므로 키에 포함하되, 원문 대신 해시만 사용합니다.
+    """
+    digest = hashlib.sha1(f"{blog_url}:{access_token or ''}".encode('utf-8')).hexdigest()
+    return f"scrape:{digest}"
+
+
+def run_scrape_pipeline(blog_url, access_token, refresh=False):
+    """
+    스크래핑 파이프라인을 실행합니다. SCRAPE_CACHE_TTL 안에 같은 블로그를 스크래핑한 결과가 있으면 재사용합니다.
+    
+    Args:
+        blog_url (str): 네이버 블로그 URL
+        access_token (str): OAuth 액세스 토큰
+        refresh (bool): True이면 캐시를 무시하고 다시 스크래핑
+        
+    Returns:
+        tuple: (성공 여부, 메시지, 포스트 목록)
+    """
+    key = _scrape_cache_key(blog_url, access_token)
+    if not refresh:
+        try:
+            cached = _get_scrape_cache().get(key)
+        except Exception as e:
+            logger.error(f"스크래핑 캐시 조회 오류: {str(e)}")
+            cached = None
+        if cached is not None:
+            logger.debug(f"스크래핑 캐시 적중: {blog_url}")
+            return cached
+    
+    # 파이프라인 실행 - Playwright 자동화 활성화 (비공개 글 접근 강화)
+    result = scrape_blog_pipeline(
+        blog_url=blog_url, 
+        access_token=access_token, 
+        use_playwright=True,
+        refresh=refresh
+    )
+    
+    # 실패한 결과는 저장하지 않아 다음 제출 때 다시 시도
+    success, _, posts = result
+    if success and posts:
+        try:
+            _get_scrape_cache().set(key, result)
+        except Exception as e:
+            logger.error(f"스크래핑 캐시 저장 오류: {str(e)}")
+    return result
+
+
+def scrape_and_store_posts(blog_id, blog_url, access_token, refresh=False):
+    """
+    블로그를 스크래핑해서 포스트를 저장합니다. 백그라운드 워커에서 실행됩니다.
+    
+    Args:
+        blog_id (int): 블로그 ID
+        blog_url (str): 네이버 블로그 URL
+        access_token (str): OAuth 액세스 토큰
+        refresh (bool): True이면 스크래핑 캐시를 무시
+        
+    Raises:
+        ValueError: 스크래핑에 실패했거나 포스트를 찾지 못한 경우
+    """
+    with app.app_context():
         try:
             logger.debug("강화된 블로그 스크래핑 파이프라인 시작 (Playwright 활성화)")
-            from blog_scraper_pipeline import scrape_blog_pipeline
             
-            # 파이프라인 실행 - Playwright 자동화 활성화 (비공개 글 접근 강화)
-            success, message, posts = scrape_blog_pipeline(
-                blog_url=blog_url, 
-                access_token=session['access_token'], 
-                use_playwright=True
-            )
+            success, message, posts = run_scrape_pipeline(blog_url, access_token, refresh=refresh)
             
             if not success or not posts:
-                raise ValueError(message)
-                
+                raise ValueError(message or '블로그에서 포스트를 찾을 수 없습니다.')
+            
             logger.debug(f"스크래핑 성공: {message}")
             logger.debug(f"총 {len(posts)}개의 포스트를 추출했습니다.")
             
-        except Exception as e:
-            logger.error(f"스크래핑 오류: {str(e)}")
+            save_scraped_posts(blog_id, posts)
+        except Exception:
+            if db.session.is_active:
+                db.session.rollback()
+            raise
+
+
+# HTML 파싱에 실패했을 때만 사용하는 태그 제거 정규식
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+def strip_html(content):
+    """
+    포스트 본문에서 HTML 태그를 제거하고 공백을 하나로 정리합니다.
+    lxml 파서로 텍스트 노드만 뽑아내므로 속성 값 안의 '>' 같은 경우도 올바르게 처리합니다.
+    
+    Args:
+        content (str): 포스트 본문 (HTML 또는 일반 텍스트)
+        
+    Returns:
+        str: 태그가 제거된 텍스트
+    """
+    if not content or not content.strip():
+        return ""
+    # 스크래퍼가 대부분 이미 텍스트만 추출해 저장하므로, 태그가 없으면 파서를 거치지 않음
+    if '<' not in content:
+        return ' '.join(content.split())
+    try:
+        text_content = ' '.join(lxml.html.fromstring(content).itertext())
+    except (ParserError, ValueError) as e:
+        logger.debug(f"HTML 파싱 실패, 정규식으로 태그 제거: {str(e)}")
+        text_content = _HTML_TAG_RE.sub(' ', content)
+    return ' '.join(text_content.split())
+
+def query_analysis_posts(blog_id):
+    """
+    분석에 필요한 컬럼만 조회합니다. ORM 객체를 만들지 않고 행 튜플로 가져오므로
+    포스트가 많은 블로그에서도 메모리와 identity map 부담이 적습니다.
+    
+    Args:
+        blog_id (int): 블로그 ID
+        
+    Returns:
+        list: title, content, date, is_private, logNo 속성을 가진 행 목록 (최신글 순)
+    """
+    # 최신순 정렬은 DB에서 처리 (네이버 블로그는 최신글이 높은 logNo를 가짐)
+    # 정렬식은 ix_blogpost_blog_logno_sort 인덱스의 식과 같아야 인덱스 순서로 읽음 (models.logno_sort_key)
+    return db.session.query(
+        BlogPost.title, BlogPost.content, BlogPost.date, BlogPost.is_private, BlogPost.logNo
+    ).filter_by(blog_id=blog_id).order_by(
+        logno_sort_key(BlogPost.logNo).desc()
+    ).all()
+
+
+def build_analysis_content(posts):
+    """
+    블로그 포스트들을 분석용 텍스트 하나로 합칩니다.
+    
+    Args:
+        posts (list): query_analysis_posts로 조회한 포스트 행 목록
+        
+    Returns:
+        str: 포스트 구분선, 메타데이터, 정리된 본문을 포함한 분석용 텍스트
+    """
+    # 블로그 콘텐츠 분석을 위한 전처리
+    # 문자열을 += 로 이어 붙이면 포스트가 많을 때 매번 재할당이 일어나므로 리스트에 모은 뒤 한 번에 합침
+    # 분석기는 전체 내용으로 캐시 키를 만들고 앞/뒤 청크를 고르므로 제너레이터가 아닌 완성된 문자열을 넘김
+    content_parts = []
+    post_count = len(posts)
+    logger.debug(f"총 {post_count}개의 포스트를 분석합니다.")
+    
+    # 포스트는 query_analysis_posts에서 이미 최신순(logNo 내림차순)으로 정렬되어 있음
+    # 정렬 결과 로그 출력
+    logger.debug("정렬된 포스트 logNo 순서:")
+    for p in posts[:5]:  # 처음 5개만 로그로 확인
+        log_no = p.logNo if hasattr(p, 'logNo') and p.logNo else "없음"
+        logger.debug(f"logNo: {log_no}, 날짜: {p.date}, 제목: {p.title[:10]}...")
+    
+    # 포스트 메타데이터와 함께 콘텐츠 구성 (날짜는 한 번에 정규화)
+    normalized_dates = normalize_date_formats([post.date for post in posts])
+    for i, (post, normalized_date) in enumerate(zip(posts, normalized_dates), 1):
+        # 포스트 번호와 날짜 추가
+        normalized_date = normalized_date or ""
+        date_info = f"작성일: {normalized_date}" if normalized_date else ""
+        privacy_info = "[비공개 글]" if post.is_private else "[공개 글]"
+        
+        # 각 포스트별 구분선 추가하여 가독성 향상
+        post_header = f"===== 포스트 {i}/{post_count} {privacy_info} {date_info} =====\n"
+        
+        # HTML 태그 제거 및 텍스트 정리
+        clean_content = strip_html(post.content)
+        
+        # 제목과 콘텐츠 추가 - 본문을 중간 문자열에 다시 복사하지 않도록 조각 단위로 추가
+        content_parts.extend((post_header, "\n제목: ", post.title, "\n\n내용:\n", clean_content, "\n\n"))
+    
+    return "".join(content_parts)
+
+
+def find_report_id(blog_id):
+    """
+    블로그의 보고서 ID를 조회합니다. 보고서 본문(Text 컬럼)은 읽지 않고 ID만 가져옵니다.
+    
+    Args:
+        blog_id (int): 블로그 ID
+        
+    Returns:
+        int or None: 보고서 ID, 보고서가 없으면 None
+    """
+    return db.session.query(Report.id).filter_by(blog_id=blog_id).limit(1).scalar()
+
+
+def create_report(blog_id, analysis_result):
+    """
+    분석 결과로 보고서를 만들어 저장합니다.
+    
+    Args:
+        blog_id (int): 블로그 ID
+        analysis_result (dict): analyze_blog_content의 분석 결과
+        
+    Returns:
+        Report: 저장된 보고서
+    """
+    report = Report(
+        blog_id=blog_id,
+        characteristics=analysis_result.get('characteristics', ''),
+        strengths=analysis_result.get('strengths', ''),
+        weaknesses=analysis_result.get('weaknesses', ''),
+        thinking_patterns=analysis_result.get('thinking_patterns', ''),
+        decision_making=analysis_result.get('decision_making', ''),
+        unconscious_biases=analysis_result.get('unconscious_biases', ''),
+        advice=analysis_result.get('advice', ''),
+        # 예전 테이블(created_at 문자열, 기본값 없음)에서도 저장되도록 값을 직접 지정
+        created_at=datetime.utcnow()
+    )
+    
+    # 중첩된 트랜잭션 방지를 위한 명시적 세션 관리
+    db.session.add(report)
+    db.session.commit()
+    
+    # 폴링 중인 클라이언트가 바로 보고서로 이동하도록 상태 캐시 삭제
+    with _status_cache_lock:
+        _status_cache.delete(blog_id)
+    return report
+
+# 백그라운드 작업 큐 (블로그 수집 -> 보고서 생성)
+# 스크래핑과 OpenAI 분석은 수십 초 이상 걸리므로 요청을 처리하는 워커에서 실행하지 않고
+# 백그라운드 스레드가 처리합니다. 진행 상황은 /status/<blog_id>로 확인합니다.
+# 작업 상태는 analysis_job 테이블에 저장하므로 다른 인스턴스(autoscale)나 gunicorn 워커에서도 같은 상태를 조회하고,
+# 인스턴스가 내려가면서 잃어버린 작업은 하트비트가 끊긴 것으로 판단해 다른 인스턴스가 다시 시작합니다.
+ANALYSIS_WORKERS = int(os.environ.get("ANALYSIS_WORKERS", 4))
+# 작업을 맡은 프로세스가 이 간격(초)마다 작업 행의 updated_at을 갱신
+JOB_HEARTBEAT_SECONDS = int(os.environ.get("ANALYSIS_JOB_HEARTBEAT_SECONDS", 30))
+# 진행 중인 작업이 이 시간(초) 동안 갱신되지 않으면 중단된 작업으로 보고 다시 시작
+JOB_STALE_SECONDS = int(os.environ.get("ANALYSIS_JOB_STALE_SECONDS", 120))
+analysis_queue = Queue()  # (작업 종류 'scrape' | 'analyze', blog_id, 작업 토큰, 인자 튜플)
+_local_jobs = {}  # blog_id -> 이 프로세스가 맡은 작업의 토큰 (하트비트 대상)
+_analysis_jobs_lock = threading.Lock()
+_analysis_workers_started = False
+# 진행 중인 작업 상태 - 같은 블로그의 작업을 중복으로 넣지 않음
+_ACTIVE_JOB_STATES = ('scraping', 'queued', 'running')
+
+def get_job(blog_id):
+    """
+    블로그의 백그라운드 작업 상태를 조회합니다.
+    
+    Args:
+        blog_id (int): 블로그 ID
+        
+    Returns:
+        dict or None: state, message, stale(하트비트가 끊긴 진행 중 작업인지) 키를 가진 딕셔너리, 작업이 없으면 None
+    """
+    job = db.session.get(AnalysisJob, blog_id)
+    if job is None:
+        return None
+    stale_before = datetime.utcnow() - timedelta(seconds=JOB_STALE_SECONDS)
+    return {
+        'state': job.state,
+        'message': job.message,
+        'stale': job.state in _ACTIVE_JOB_STATES and job.updated_at < stale_before,
+    }
+
+def _claim_job(blog_id, state):
+    """
+    블로그의 작업을 맡습니다. 진행 중인 작업이 없거나 하트비트가 끊긴 경우에만 새 토큰으로 작업 행을 기록합니다.
+    여러 인스턴스가 동시에 맡으려 해도 조건부 UPDATE/INSERT 중 하나만 성공합니다.
+    
+    Args:
+        blog_id (int): 블로그 ID
+        state (str): 기록할 작업 상태
+        
+    Returns:
+        str or None: 작업 토큰, 다른 곳에서 진행 중이면 None
+    """
+    token = uuid.uuid4().hex
+    now = datetime.utcnow()
+    with app.app_context():
+        try:
+            result = db.session.execute(
+                update(AnalysisJob).where(
+                    AnalysisJob.blog_id == blog_id,
+                    db.or_(AnalysisJob.state.notin_(_ACTIVE_JOB_STATES),
+                           AnalysisJob.updated_at < now - timedelta(seconds=JOB_STALE_SECONDS))
+                ).values(state=state, message=None, claim_token=token, updated_at=now),
+                execution_options={'synchronize_session': False}
+            )
+            if result.rowcount == 0:
+                if db.session.get(AnalysisJob, blog_id) is not None:
+                    db.session.rollback()
+                    return None
+                db.session.add(AnalysisJob(blog_id=blog_id, state=state, claim_token=token, updated_at=now))
+            db.session.commit()
+            return token
+        except IntegrityError:
+            # 다른 인스턴스가 같은 블로그의 작업 행을 먼저 만든 경우
             db.session.rollback()
-            flash(f'블로그 스크래핑 중 오류가 발생했습니다: {str(e)}', 'danger')
-            return redirect(url_for('blog_form'))
+            return None
+
+def _take_over_queued_job(blog_id):
+    """
+    아직 워커가 시작하지 않은(대기 중인) 보고서 생성 작업을 넘겨받습니다.
+    큐에 남아 있는 원래 작업은 토큰이 바뀌었으므로 워커가 꺼내도 실행하지 않습니다.
+    
+    Args:
+        blog_id (int): 블로그 ID
         
-        if not posts:
-            # 롤백 후 리다이렉트
+    Returns:
+        str or None: 새 작업 토큰, 대기 중인 작업이 없으면 None
+    """
+    token = uuid.uuid4().hex
+    with app.app_context():
+        try:
+            result = db.session.execute(
+                update(AnalysisJob).where(
+                    AnalysisJob.blog_id == blog_id, AnalysisJob.state == 'queued'
+                ).values(state='running', message=None, claim_token=token, updated_at=datetime.utcnow()),
+                execution_options={'synchronize_session': False}
+            )
+            db.session.commit()
+            return token if result.rowcount > 0 else None
+        except Exception as e:
             db.session.rollback()
-            flash('블로그에서 포스트를 찾을 수 없습니다.', 'danger')
-            return redirect(url_for('blog_form'))
+            logger.error(f"대기 중인 작업 인수 중 오류: {str(e)}")
+            return None
+
+def _set_job_state(blog_id, token, state, message=None):
+    """
+    맡은 작업의 상태를 갱신합니다. 다른 인스턴스가 작업을 넘겨받았으면(토큰이 다르면) 갱신하지 않습니다.
+    
+    Args:
+        blog_id (int): 블로그 ID
+        token (str): _claim_job이 발급한 작업 토큰
+        state (str): 작업 상태
+        message (str, optional): 오류 메시지
         
-        # 로그 기록
-        logger.debug(f"성공적으로 {len(posts)}개의 포스트를 추출했습니다.")
+    Returns:
+        bool: 갱신했으면 True
+    """
+    with app.app_context():
+        try:
+            result = db.session.execute(
+                update(AnalysisJob).where(
+                    AnalysisJob.blog_id == blog_id, AnalysisJob.claim_token == token
+                ).values(state=state, message=message, updated_at=datetime.utcnow()),
+                execution_options={'synchronize_session': False}
+            )
+            db.session.commit()
+            return result.rowcount > 0
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"작업 상태 갱신 중 오류: {str(e)}")
+            return False
+
+def _finish_job(blog_id, token):
+    """
+    완료된 작업 행을 삭제합니다. 완료 여부는 보고서(report 테이블)로 확인합니다.
+    """
+    with app.app_context():
+        try:
+            db.session.execute(
+                delete(AnalysisJob).where(AnalysisJob.blog_id == blog_id, AnalysisJob.claim_token == token),
+                execution_options={'synchronize_session': False}
+            )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"작업 상태 삭제 중 오류: {str(e)}")
+
+def _release_local_job(blog_id, token):
+    """
+    이 프로세스가 맡은 작업 목록(하트비트 대상)에서 작업을 뺍니다.
+    """
+    with _analysis_jobs_lock:
+        if _local_jobs.get(blog_id) == token:
+            del _local_jobs[blog_id]
+
+def _job_heartbeat():
+    """
+    이 프로세스가 맡은 작업(대기 중 포함)의 updated_at을 주기적으로 갱신하는 루프
+    프로세스가 내려가면 갱신이 멈추므로 다른 인스턴스가 JOB_STALE_SECONDS 뒤에 작업을 다시 시작할 수 있습니다.
+    """
+    while True:
+        time.sleep(JOB_HEARTBEAT_SECONDS)
+        with _analysis_jobs_lock:
+            tokens = list(_local_jobs.values())
+        if not tokens:
+            continue
+        with app.app_context():
+            try:
+                db.session.execute(
+                    update(AnalysisJob).where(AnalysisJob.claim_token.in_(tokens)).values(updated_at=datetime.utcnow()),
+                    execution_options={'synchronize_session': False}
+                )
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"작업 하트비트 갱신 중 오류: {str(e)}")
+
+def load_analysis_content(blog_id):
+    """
+    블로그 포스트를 조회해서 분석용 텍스트로 만듭니다.
+    조회한 행(원본 본문 포함)은 이 함수 안에서만 참조되므로, 오래 걸리는 분석 요청 동안에는
+    정리된 텍스트 한 벌만 메모리에 남습니다.
+    
+    Args:
+        blog_id (int): 블로그 ID
         
-        # 세션에 큰 데이터 저장 금지 - 스크랩한 포스트 내용을 세션에 직접 저장하지 않음
-        # 대신 포스트 ID만 저장하고 필요할 때 DB에서 조회
+    Returns:
+        str or None: 분석용 텍스트, 포스트가 없으면 None
+    """
+    posts = query_analysis_posts(blog_id)
+    if not posts:
+        return None
+    return build_analysis_content(posts)
+
+def analysis_cache_scope(blog_id):
+    """
+    의미 기반 분석 캐시의 범위를 정합니다. 비슷한 내용이라도 다른 사용자의 분석 결과는 재사용하지 않도록
+    블로그를 등록한 사용자별로, 소유자가 없는 예전 블로그는 블로그별로 나눕니다.
+    
+    Args:
+        blog_id (int): 블로그 ID
         
-        # 데이터베이스에 포스트 저장 (중복 제거 로직 적용)
+    Returns:
+        str: 캐시 범위
+    """
+    naver_user_id = db.session.query(Blog.naver_user_id).filter(Blog.id == blog_id).scalar()
+    return f"user:{naver_user_id}" if naver_user_id else f"blog:{blog_id}"
+
+def run_analysis(blog_id):
+    """
+    블로그 포스트를 분석하여 보고서를 저장합니다. 백그라운드 워커에서 실행됩니다.
+    
+    Args:
+        blog_id (int): 분석할 블로그 ID
+    """
+    with app.app_context():
         try:
-            # 이 블로그에 있는 기존 포스트 logNo 목록 가져오기
-            existing_logno_query = db.session.query(BlogPost.logNo).filter(BlogPost.blog_id == blog.id)
-            existing_lognos = [row[0] for row in existing_logno_query.all() if row[0]]
-            
-            # 새로 저장할 포스트와 기존 포스트 계산
-            new_posts = []
-            duplicates = 0
+            # 다른 경로(스트리밍 분석 등)에서 이미 보고서가 만들어졌으면 건너뜀
+            if find_report_id(blog_id) is not None:
+                return
             
-            # 중복 검사 및 처리
-            for post in posts:
-                log_no = post.get('logNo', '')
-                
-                # logNo가 없는 경우는 건너뛰기
-                if not log_no:
-                    logger.warning(f"logNo가 없는 포스트 제외: {post.get('title')}")
-                    continue
-                
-                # 중복 검사
-                if log_no in existing_lognos:
-                    duplicates += 1
-                    logger.debug(f"중복 포스트 제외: logNo={log_no}, title={post.get('title')}")
-                    
-                    # 기존 포스트의 날짜나 제목 업데이트가 필요한 경우
-                    existing_post = BlogPost.query.filter_by(blog_id=blog.id, logNo=log_no).first()
-                    if existing_post:
-                        # 날짜가 비어있거나 새 데이터에서 날짜가 있으면 업데이트
-                        if (not existing_post.date or not existing_post.date.strip()) and post.get('date'):
-                            existing_post.date = post.get('date')
-                            logger.debug(f"기존 포스트 날짜 업데이트: logNo={log_no}")
-                        
-                        # 비공개 상태가 변경된 경우 업데이트
-                        if existing_post.is_private != post.get('is_private', False):
-                            existing_post.is_private = post.get('is_private', False)
-                            logger.debug(f"비공개 상태 업데이트: logNo={log_no}")
-                else:
-                    # 새 포스트 추가
-                    new_posts.append(post)
-            
-            # 새 포스트만 저장
-            for post in new_posts:
-                blog_post = BlogPost(
-                    blog_id=blog.id,
-                    title=post.get('title', ''),
-                    content=post.get('content', ''),
-                    date=post.get('date', ''),
-                    is_private=post.get('is_private', False)
-                )
-                # logNo 필드는 별도로 설정 (컬럼명 충돌 방지)
-                blog_post.logNo = post.get('logNo', '')
-                db.session.add(blog_post)
+            all_content = load_analysis_content(blog_id)
+            if all_content is None:
+                raise ValueError('분석할 포스트가 없습니다.')
+            logger.debug(f"분석할 총 콘텐츠 길이: {len(all_content)} 글자")
             
-            # 저장 결과 로깅
-            logger.info(f"총 {len(posts)}개 포스트 중 {len(new_posts)}개 저장, {duplicates}개 중복 제외")
-            
-            # 비공개 글 개수 계산 및 로깅
-            private_posts = [post for post in new_posts if post.get('is_private', False)]
-            private_count = len(private_posts)
-            logger.info(f"저장된 {len(new_posts)}개 포스트 중 공개글 {len(new_posts) - private_count}개, 비공개글 {private_count}개")
-            
-            # 모든 작업이 성공하면 커밋
+            analysis_result = analyze_blog_content(all_content, cache_scope=analysis_cache_scope(blog_id))
+            report = create_report(blog_id, analysis_result)
+            logger.info(f"보고서 생성 완료: blog_id={blog_id}, report_id={report.id}")
+        except Exception:
+            if db.session.is_active:
+                db.session.rollback()
+            raise
+
+def _run_scrape_job(blog_id, token, blog_url, access_token, refresh=False):
+    """
+    블로그 수집 작업을 실행하고, 성공하면 같은 블로그의 보고서 생성 작업을 이어서 등록합니다.
+    """
+    # 대기하는 동안 다른 인스턴스가 작업을 넘겨받았으면 실행하지 않음
+    if not _set_job_state(blog_id, token, 'scraping'):
+        _release_local_job(blog_id, token)
+        return
+    try:
+        scrape_and_store_posts(blog_id, blog_url, access_token, refresh=refresh)
+    except Exception as e:
+        logger.error(f"스크래핑 오류: {str(e)}")
+        _set_job_state(blog_id, token, 'error', f'블로그 스크래핑 중 오류가 발생했습니다: {str(e)}')
+        _release_local_job(blog_id, token)
+        return
+    
+    # 같은 작업 토큰으로 보고서 생성 단계를 이어서 진행
+    if _set_job_state(blog_id, token, 'queued'):
+        analysis_queue.put(('analyze', blog_id, token, ()))
+    else:
+        _release_local_job(blog_id, token)
+
+def _run_analysis_job(blog_id, token):
+    """
+    보고서 생성 작업을 실행하고 결과에 따라 작업 상태를 갱신합니다.
+    """
+    try:
+        # 대기하는 동안 다른 인스턴스가 작업을 넘겨받았으면 실행하지 않음
+        if not _set_job_state(blog_id, token, 'running'):
+            return
+        try:
+            run_analysis(blog_id)
+            _finish_job(blog_id, token)
+        except Exception as e:
+            logger.error(f"콘텐츠 분석 및 리포트 생성 중 오류: {str(e)}")
+            _set_job_state(blog_id, token, 'error', f'콘텐츠 분석 중 오류가 발생했습니다: {str(e)}')
+    finally:
+        _release_local_job(blog_id, token)
+
+def _analysis_worker():
+    """
+    작업 큐에서 작업을 꺼내 블로그 수집 또는 보고서 생성을 실행하는 워커 루프
+    """
+    while True:
+        job_type, blog_id, token, args = analysis_queue.get()
+        try:
+            if job_type == 'scrape':
+                _run_scrape_job(blog_id, token, *args)
+            else:
+                _run_analysis_job(blog_id, token)
+        finally:
+            analysis_queue.task_done()
+
+def _start_analysis_workers():
+    """
+    워커 스레드와 하트비트 스레드를 시작합니다. 첫 작업이 들어올 때 한 번만 시작합니다.
+    """
+    global _analysis_workers_started
+    with _analysis_jobs_lock:
+        if not _analysis_workers_started:
+            for n in range(ANALYSIS_WORKERS):
+                threading.Thread(target=_analysis_worker, name=f"analysis-worker-{n}", daemon=True).start()
+            threading.Thread(target=_job_heartbeat, name="analysis-job-heartbeat", daemon=True).start()
+            _analysis_workers_started = True
+
+def _enqueue_job(job_type, blog_id, args, state):
+    """
+    작업을 큐에 넣습니다. 같은 블로그의 작업이 이미 진행 중이면 무시합니다.
+    
+    Args:
+        job_type (str): 'scrape' 또는 'analyze'
+        blog_id (int): 블로그 ID
+        args (tuple): 작업 함수에 전달할 추가 인자
+        state (str): 대기 중 표시할 작업 상태
+        
+    Returns:
+        bool: 새 작업을 넣었으면 True
+    """
+    _start_analysis_workers()
+    
+    # 같은 블로그의 작업이 어느 인스턴스에서든 진행 중이면 넣지 않음
+    token = _claim_job(blog_id, state)
+    if token is None:
+        return False
+    with _analysis_jobs_lock:
+        _local_jobs[blog_id] = token
+    
+    analysis_queue.put((job_type, blog_id, token, args))
+    return True
+
+def enqueue_scrape(blog_id, blog_url, access_token, refresh=False):
+    """
+    블로그 수집 작업을 큐에 넣습니다. 수집이 끝나면 보고서 생성 작업이 자동으로 이어집니다.
+    
+    Args:
+        blog_id (int): 블로그 ID
+        blog_url (str): 네이버 블로그 URL
+        access_token (str): OAuth 액세스 토큰
+        refresh (bool): True이면 스크래핑 캐시를 무시
+        
+    Returns:
+        bool: 새 작업을 넣었으면 True
+    """
+    return _enqueue_job('scrape', blog_id, (blog_url, access_token, refresh), 'scraping')
+
+def enqueue_analysis(blog_id):
+    """
+    보고서 생성 작업을 큐에 넣습니다. 같은 블로그의 작업이 이미 대기 중이거나 실행 중이면 무시합니다.
+    
+    Args:
+        blog_id (int): 분석할 블로그 ID
+        
+    Returns:
+        bool: 새 작업을 넣었으면 True
+    """
+    return _enqueue_job('analyze', blog_id, (), 'queued')
+
+def _fail_stale_job(blog_id, message):
+    """
+    하트비트가 끊긴 진행 중 작업을 오류 상태로 바꿉니다. 그 사이 다른 곳에서 작업을 넘겨받았으면 바꾸지 않습니다.
+    """
+    stale_before = datetime.utcnow() - timedelta(seconds=JOB_STALE_SECONDS)
+    with app.app_context():
+        try:
+            db.session.execute(
+                update(AnalysisJob).where(
+                    AnalysisJob.blog_id == blog_id,
+                    AnalysisJob.state.in_(_ACTIVE_JOB_STATES),
+                    AnalysisJob.updated_at < stale_before
+                ).values(state='error', message=message, updated_at=datetime.utcnow()),
+                execution_options={'synchronize_session': False}
+            )
             db.session.commit()
-            
-            # 분석 페이지로 리다이렉트
-            return redirect(url_for('analyze_blog', blog_id=blog.id))
-            
-        except Exception as inner_e:
-            # 데이터베이스 오류 발생 시 롤백
+        except Exception as e:
             db.session.rollback()
-            logger.error(f"포스트 저장 중 오류: {str(inner_e)}")
-            flash(f'포스트 저장 중 오류가 발생했습니다: {str(inner_e)}', 'danger')
-            return redirect(url_for('blog_form'))
+            logger.error(f"중단된 작업 상태 변경 중 오류: {str(e)}")
+
+def restart_stale_job(blog_id, job):
+    """
+    하트비트가 끊긴 작업(작업을 맡은 인스턴스가 내려간 경우)을 이 인스턴스에서 다시 시작합니다.
+    블로그 수집은 OAuth 토큰이 필요하므로 블로그를 등록한 사용자의 요청일 때만 그 사용자의 토큰으로 다시 시작하고,
+    그렇지 않으면 다시 제출하도록 오류 상태로 바꿉니다.
     
-    except Exception as e:
-        # 외부 예외 처리 - 세션 확인 및 닫기
-        if db.session.is_active:
-            db.session.rollback()
+    Args:
+        blog_id (int): 블로그 ID
+        job (dict): get_job으로 조회한 작업 상태
         
-        logger.error(f"블로그 제출 오류: {str(e)}")
-        flash(f'오류가 발생했습니다: {str(e)}', 'danger')
-        return redirect(url_for('blog_form'))
+    Returns:
+        bool: 작업 상태를 바꿨으면 True
+    """
+    if not job['stale']:
+        return False
+    if job['state'] == 'scraping':
+        blog = db.session.get(Blog, blog_id)
+        access_token = session.get('access_token')
+        if blog is not None and access_token and blog.naver_user_id == session.get('user_id'):
+            if enqueue_scrape(blog_id, blog.url, access_token):
+                logger.info(f"중단된 블로그 수집 작업 재시작: blog_id={blog_id}")
+                return True
+            return False
+        _fail_stale_job(blog_id, '블로그 수집 작업이 중단되었습니다. 블로그를 다시 제출해주세요.')
+        return True
+    if enqueue_analysis(blog_id):
+        logger.info(f"중단된 보고서 생성 작업 재시작: blog_id={blog_id}")
+        return True
+    return False
 
-# 쿠키 기반 스크래핑이 제거되었으므로 submit_blog 라우트도 제거
+def get_blog_or_404(blog_id):
+    """
+    블로그를 조회합니다. 블로그를 등록한 네이버 사용자가 아니면 404로 처리합니다.
+    수집한 포스트와 보고서에는 등록한 사용자의 비공개 글 내용이 들어 있기 때문입니다.
+    소유자가 기록되기 전에 등록된 예전 블로그는 기존처럼 누구나 볼 수 있습니다.
+    
+    Args:
+        blog_id (int): 블로그 ID
+        
+    Returns:
+        Blog: 블로그
+    """
+    blog = Blog.query.get_or_404(blog_id)
+    if not can_view_blog(blog):
+        abort(404)
+    return blog
+
+def can_view_blog(blog):
+    """
+    현재 로그인한 사용자가 블로그의 포스트와 보고서를 볼 수 있는지 확인합니다.
+    
+    Args:
+        blog (Blog): 블로그
+        
+    Returns:
+        bool: 볼 수 있으면 True
+    """
+    return blog.naver_user_id is None or blog.naver_user_id == session.get('user_id')
 
 @app.route('/analyze/<int:blog_id>')
 def analyze_blog(blog_id):
     # Check if the blog exists
-    blog = Blog.query.get_or_404(blog_id)
+    blog = get_blog_or_404(blog_id)
     
-    # Fetch all posts for this blog
-    posts = BlogPost.query.filter_by(blog_id=blog_id).all()
+    # Count posts for this blog
+    post_count = BlogPost.query.filter_by(blog_id=blog_id).count()
     
-    if not posts:
+    # 아직 수집 중이거나 수집이 실패한 블로그는 진행 상황 페이지에서 상태를 보여줌
+    # (수집은 다른 인스턴스에서 진행 중일 수 있으므로 DB의 작업 상태로 확인)
+    job = get_job(blog_id)
+    if job and restart_stale_job(blog_id, job):
+        job = get_job(blog_id)
+    if not post_count and not job:
         flash('No posts found for analysis', 'danger')
         return redirect(url_for('index'))
     
     # Check if a report already exists
-    existing_report = Report.query.filter_by(blog_id=blog_id).first()
-    if existing_report:
-        return redirect(url_for('view_report', report_id=existing_report.id))
+    existing_report_id = find_report_id(blog_id)
+    if existing_report_id is not None:
+        return redirect(url_for('view_report', report_id=existing_report_id))
     
-    try:
-        # 블로그 콘텐츠 분석을 위한 전처리
-        all_content = ""
-        post_count = len(posts)
-        logger.debug(f"총 {post_count}개의 포스트를 분석합니다.")
-        
-        # 최신순으로 정렬(내림차순) - 최근 작성된 글이 먼저 분석되도록 함
-        # 중요: logNo 번호만으로 정렬 (네이버 블로그는 최신글이 높은 번호를 가짐)
-        sorted_posts = sorted(posts, 
-                             key=lambda p: int(p.logNo) if hasattr(p, 'logNo') and p.logNo and p.logNo.isdigit() else 0,
-                             reverse=True)
-        
-        # 정렬 결과 로그 출력
-        logger.debug("정렬된 포스트 logNo 순서:")
-        for p in sorted_posts[:5]:  # 처음 5개만 로그로 확인
-            log_no = p.logNo if hasattr(p, 'logNo') and p.logNo else "없음"
-            logger.debug(f"logNo: {log_no}, 날짜: {p.date}, 제목: {p.title[:10]}...")
-        
-        # 포스트 메타데이터와 함께 콘텐츠 구성
-        for i, post in enumerate(sorted_posts, 1):
-            # 포스트 번호와 날짜 추가 (날짜 정규화)
-            from blog_scraper_pipeline import normalize_date_format
-            normalized_date = normalize_date_format(post.date) if post.date else ""
-            date_info = f"작성일: {normalized_date}" if normalized_date else ""
-            privacy_info = "[비공개 글]" if post.is_private else "[공개 글]"
-            
-            # 각 포스트별 구분선 추가하여 가독성 향상
-            post_header = f"===== 포스트 {i}/{post_count} {privacy_info} {date_info} =====\n"
-            
-            # HTML 태그 제거 및 텍스트 정리
-            import re
-            clean_content = re.sub(r'<[^>]+>', ' ', post.content)  # HTML 태그 제거
-            clean_content = re.sub(r'\s+', ' ', clean_content)     # 여러 공백을 하나로 통일
-            
-            # 제목과 콘텐츠 추가
-            all_content += f"{post_header}\n제목: {post.title}\n\n내용:\n{clean_content}\n\n"
-        
-        # 로그에 분석할 총 콘텐츠 길이 기록
-        logger.debug(f"분석할 총 콘텐츠 길이: {len(all_content)} 글자")
-        
+    # 보고서 생성은 백그라운드 워커에 맡기고, 진행 상황 페이지에서 /status를 폴링
+    # 수집이 진행 중이면 수집이 끝난 뒤 보고서 생성이 이어지므로 지금까지 저장된 포스트로 분석하지 않음
+    scraping = job is not None and job['state'] == 'scraping'
+    if post_count and not scraping and enqueue_analysis(blog_id):
+        logger.debug(f"보고서 생성 작업 등록: blog_id={blog_id}")
+    
+    return render_template('analysis_status.html', blog=blog, post_count=post_count, scraping=scraping), 202
+
+@app.route('/analyze/<int:blog_id>/live')
+def analyze_blog_live(blog_id):
+    """
+    분석 결과가 생성되는 과정을 실시간으로 보여주는 페이지
+    """
+    blog = get_blog_or_404(blog_id)
+    
+    existing_report_id = find_report_id(blog_id)
+    if existing_report_id is not None:
+        return redirect(url_for('view_report', report_id=existing_report_id))
+    
+    return render_template('analyzing.html', blog=blog)
+
+@app.route('/analyze/<int:blog_id>/stream')
+def analyze_blog_stream(blog_id):
+    """
+    분석 결과를 Server-Sent Events로 스트리밍합니다.
+    모델이 생성하는 토큰을 'token' 이벤트로 보내고, 보고서 저장이 끝나면 'done' 이벤트로
+    보고서 ID를 보냅니다.
+    백그라운드 작업과 같은 보고서를 두 번 만들지 않도록 작업(analysis_job)을 맡은 경우에만 직접 분석하고,
+    다른 곳에서 수집/분석 중이면 'pending' 이벤트를 보내 진행 상황 페이지(/status 폴링)로 전환합니다.
+    """
+    get_blog_or_404(blog_id)
+    
+    def sse(data, event=None):
+        prefix = f"event: {event}\n" if event else ""
+        return f"{prefix}data: {json.dumps(data, ensure_ascii=False)}\n\n"
+    
+    existing_report_id = find_report_id(blog_id)
+    if existing_report_id is not None:
+        return Response(sse({'report_id': existing_report_id}, 'done'), mimetype='text/event-stream')
+    
+    # 진행 중인 작업이 없으면 새로 맡고, 워커가 아직 시작하지 않은 대기 작업이면 넘겨받음
+    token = _claim_job(blog_id, 'running') or _take_over_queued_job(blog_id)
+    if token is None:
+        return Response(sse({'status_url': url_for('analyze_blog', blog_id=blog_id)}, 'pending'),
+                        mimetype='text/event-stream')
+    with _analysis_jobs_lock:
+        _local_jobs[blog_id] = token
+    
+    # 작업을 맡는 사이 다른 곳에서 보고서가 완성된 경우
+    existing_report_id = find_report_id(blog_id)
+    all_content = load_analysis_content(blog_id) if existing_report_id is None else None
+    if all_content is None:
+        _finish_job(blog_id, token)
+        _release_local_job(blog_id, token)
+        if existing_report_id is not None:
+            return Response(sse({'report_id': existing_report_id}, 'done'), mimetype='text/event-stream')
+        return Response(sse({'message': '분석할 포스트가 없습니다.'}, 'error'), mimetype='text/event-stream')
+    logger.debug(f"스트리밍 분석할 총 콘텐츠 길이: {len(all_content)} 글자")
+    cache_scope = analysis_cache_scope(blog_id)
+    
+    def generate():
+        events = stream_blog_content_analysis(all_content, cache_scope=cache_scope)
+        handled = False
         try:
-            # 세션에 큰 데이터 저장 금지 - 텍스트 내용을 session에 저장하지 않음
-            
-            # 콘텐츠 분석 실행
-            analysis_result = analyze_blog_content(all_content)
-            
-            # Create a new report
-            report = Report(
-                blog_id=blog_id,
-                characteristics=analysis_result.get('characteristics', ''),
-                strengths=analysis_result.get('strengths', ''),
-                weaknesses=analysis_result.get('weaknesses', ''),
-                thinking_patterns=analysis_result.get('thinking_patterns', ''),
-                decision_making=analysis_result.get('decision_making', ''),
-                unconscious_biases=analysis_result.get('unconscious_biases', ''),
-                advice=analysis_result.get('advice', ''),
-                created_at=time.strftime('%Y-%m-%d %H:%M:%S')
-            )
-            
-            # 중첩된 트랜잭션 방지를 위한 명시적 세션 관리
-            db.session.add(report)
-            db.session.commit()
-            
-            return redirect(url_for('view_report', report_id=report.id))
-            
-        except Exception as inner_e:
-            # 중첩된 예외 처리
+            for kind, value in events:
+                if kind == 'token':
+                    yield sse({'token': value})
+                else:
+                    report = create_report(blog_id, value)
+                    _finish_job(blog_id, token)
+                    handled = True
+                    yield sse({'report_id': report.id}, 'done')
+        except Exception as e:
             if db.session.is_active:
                 db.session.rollback()
-            logger.error(f"콘텐츠 분석 및 리포트 생성 중 오류: {str(inner_e)}")
-            flash(f'콘텐츠 분석 중 오류가 발생했습니다: {str(inner_e)}', 'danger')
-            return redirect(url_for('index'))
+            logger.error(f"스트리밍 분석 중 오류: {str(e)}")
+            _set_job_state(blog_id, token, 'error', f'콘텐츠 분석 중 오류가 발생했습니다: {str(e)}')
+            handled = True
+            yield sse({'message': f'콘텐츠 분석 중 오류가 발생했습니다: {str(e)}'}, 'error')
+        finally:
+            # 분석 제너레이터를 닫아 진행 중인 분석을 취소
+            events.close()
+            if not handled:
+                # 보고서가 만들어지기 전에 클라이언트가 연결을 끊은 경우 - 같은 작업 토큰으로 백그라운드 워커에 넘김
+                _start_analysis_workers()
+                if _set_job_state(blog_id, token, 'queued'):
+                    logger.debug(f"스트리밍 연결 종료, 보고서 생성 작업을 워커에 넘김: blog_id={blog_id}")
+                    analysis_queue.put(('analyze', blog_id, token, ()))
+                else:
+                    _release_local_job(blog_id, token)
+            else:
+                _release_local_job(blog_id, token)
     
-    except Exception as e:
-        # 최상위 예외 처리
-        if db.session.is_active:
-            db.session.rollback()
-        logger.error(f"Error during analysis: {str(e)}")
-        flash(f'An error occurred during analysis: {str(e)}', 'danger')
-        return redirect(url_for('index'))
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    # 프록시가 응답을 버퍼링하지 않도록 설정
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+# 보고서 페이지 포스트 목록 설정
+REPORT_POSTS_PER_PAGE = 30
+POST_PREVIEW_LENGTH = 150
+
+def build_post_view(post, blog_user_id):
+    """
+    보고서 페이지에 표시할 포스트 미리보기 정보를 만듭니다.
+    
+    Args:
+        post: id, title, date, is_private, logNo, preview 속성을 가진 행
+        blog_user_id (str): 네이버 블로그 ID
+        
+    Returns:
+        dict: 템플릿에 전달할 포스트 정보
+    """
+    # 세션에서 큰 데이터 저장 안 함 - 디스플레이용 정보만 메모리에서 처리
+    post_view = {}
+    
+    # 본문이 길면 앞부분 150자만 표시하고 '...' 추가 (UI 레이아웃 개선)
+    if len(post.preview) > POST_PREVIEW_LENGTH:
+        post_view['preview'] = post.preview[:POST_PREVIEW_LENGTH] + '...'
+    else:
+        post_view['preview'] = post.preview
+    
+    # 비공개 글인 경우 표시 추가
+    if post.is_private:
+        post_view['preview'] = "[비공개 글] " + post_view['preview']
+    
+    # 스크래핑 시 저장한 실제 logNo 사용 (본문을 다시 검색하지 않음)
+    if post.logNo:
+        post_view['url'] = f"https://blog.naver.com/{blog_user_id}/{post.logNo}"
+    else:
+        # 마지막 대안: 데이터베이스 ID 사용 (실제 네이버 URL과 다를 수 있음)
+        post_view['url'] = f"https://blog.naver.com/{blog_user_id}?Redirect=Log&logNo={post.id}"
+    
+    # 필요한 기타 정보
+    post_view['title'] = post.title
+    # 날짜 정규화 (템플릿에 표시될 때 사용)
+    if post.date:
+        post_view['date'] = normalize_date_format(post.date)
+    else:
+        post_view['date'] = ""
+    post_view['is_private'] = post.is_private
+    return post_view
 
 @app.route('/report/<int:report_id>')
 def view_report(report_id):
     try:
-        # 날짜 정규화 함수 임포트
-        from blog_scraper_pipeline import normalize_date_format
-        
-        # Get the report
-        report = Report.query.get_or_404(report_id)
-        
-        # Get the blog
-        blog = Blog.query.get_or_404(report.blog_id)
+        # Get the report and its blog in one query
+        report, blog = db.session.query(Report, Blog).join(
+            Blog, Blog.id == Report.blog_id
+        ).filter(Report.id == report_id).first_or_404()
+        if not can_view_blog(blog):
+            abort(404)
         
-        # Get the blog posts (최대 30개까지 표시 - 최신 순으로 정렬)
+        # Get the blog posts (페이지당 최대 30개까지 표시 - 최신 순으로 정렬)
         # 로직을 심플하게 유지: 오직 logNo만 기준으로 정렬 (최신글이 높은 번호)
-        # SQL 인젝션 방지를 위해 text()와 bindparam 사용
-        from sqlalchemy import text
-        posts = db.session.query(BlogPost).filter(
+        # 본문 전체 대신 미리보기에 필요한 앞부분만 DB에서 잘라서 가져옴
+        page = max(request.args.get('page', 1, type=int), 1)
+        posts = db.session.query(
+            BlogPost.id, BlogPost.title, BlogPost.date, BlogPost.is_private, BlogPost.logNo,
+            db.func.substr(BlogPost.content, 1, POST_PREVIEW_LENGTH + 1).label('preview')
+        ).filter(
             BlogPost.blog_id == report.blog_id
         ).order_by(
-            text('CAST("logNo" as BIGINT) DESC')
-        ).limit(30).all()
+            logno_sort_key(BlogPost.logNo).desc()
+        ).offset((page - 1) * REPORT_POSTS_PER_PAGE).limit(REPORT_POSTS_PER_PAGE + 1).all()
         
-        # 세션에서 큰 데이터 저장 안 함 - 디스플레이용 정보만 메모리에서 처리
-        post_views = []
+        # 한 개 더 조회해서 다음 페이지 존재 여부 판단
+        has_next = len(posts) > REPORT_POSTS_PER_PAGE
+        posts = posts[:REPORT_POSTS_PER_PAGE]
         
-        # 각 포스트 컨텐츠 중 일부만 발췌 (미리보기용)
-        for post in posts:
-            post_view = {}
-            
-            # 본문이 길면 앞부분 150자만 표시하고 '...' 추가 (UI 레이아웃 개선)
-            if len(post.content) > 150:
-                post_view['preview'] = post.content[:150] + '...'
-            else:
-                post_view['preview'] = post.content
-            
-            # 비공개 글인 경우 표시 추가
-            if post.is_private:
-                post_view['preview'] = "[비공개 글] " + post_view['preview']
-            
-            # 네이버 블로그 URL 형식으로 포스트 URL 구성
-            # 블로그 URL에서 ID 추출
-            import re
-            from scraper import extract_blog_id
-            
-            # 블로그 URL에서 ID 추출
+        # 네이버 블로그 URL 형식으로 포스트 URL 구성
+        # 블로그 URL에서 ID 추출 - 모든 포스트가 같은 블로그이므로 한 번만 추출
+        # 추출에 실패하면 URL 마지막 경로에서 쿼리 문자열을 뗀 값을 사용
+        # (extract_blog_id는 URL별로 캐시되며, 형식이 맞지 않으면 ValueError를 발생시킴)
+        try:
             blog_user_id = extract_blog_id(blog.url)
-            if not blog_user_id:
-                # URL에서 직접 추출 시도
-                blog_user_id = blog.url.split('/')[-1]
-                if '?' in blog_user_id:
-                    blog_user_id = blog_user_id.split('?')[0]
-            
-            # DB에 저장된 실제 logNo 사용 (BlogPost.logNo 필드 필요)
-            # 데이터 모델에 logNo가 없으면 content에서 추출 시도
-            if hasattr(post, 'logNo') and post.logNo:
-                post_view['url'] = f"https://blog.naver.com/{blog_user_id}/{post.logNo}"
-            else:
-                # content에서 logNo 추출 시도
-                logno_match = re.search(r'logNo=(\d+)', post.content)
-                if logno_match:
-                    logno = logno_match.group(1)
-                    post_view['url'] = f"https://blog.naver.com/{blog_user_id}/{logno}"
-                else:
-                    # 마지막 대안: 데이터베이스 ID 사용 (실제 네이버 URL과 다를 수 있음)
-                    post_view['url'] = f"https://blog.naver.com/{blog_user_id}?Redirect=Log&logNo={post.id}"
-            
-            # 필요한 기타 정보
-            post_view['title'] = post.title
-            # 날짜 정규화 (템플릿에 표시될 때 사용)
-            if post.date:
-                post_view['date'] = normalize_date_format(post.date)
-            else:
-                post_view['date'] = ""
-            post_view['is_private'] = post.is_private
-            
-            # 메모리 내 배열에 추가
-            post_views.append(post_view)
+        except ValueError:
+            blog_user_id = None
+        if not blog_user_id:
+            blog_user_id = blog.url.rsplit('/', 1)[-1].split('?', 1)[0]
+        
+        # 공개/비공개 글 수는 스트리밍 전에 미리 계산 (템플릿 상단에서 사용)
+        private_count = sum(1 for post in posts if post.is_private)
+        public_count = len(posts) - private_count
+        
+        # 포스트 미리보기는 템플릿이 렌더링하는 시점에 하나씩 생성
+        post_views = (build_post_view(post, blog_user_id) for post in posts)
         
         # 블로그 및 보고서 정보의 필수 부분만 템플릿에 전달
         blog_info = {
@@ -496,8 +1537,18 @@ def view_report(report_id):
         # 세션에 큰 데이터 저장 금지 (필요한 경우 ID만 저장하고 매번 DB에서 다시 가져오기)
         # 렌더링에만 필요한 데이터는 request/response 사이클에만 존재
         
-        return render_template('report.html', report=report, blog=blog_info, posts=post_views)
+        # 전체 HTML을 만든 뒤 보내지 않고 렌더링되는 대로 조금씩 전송
+        context = dict(report=report, blog=blog_info, posts=post_views, has_posts=bool(posts),
+                       public_count=public_count, private_count=private_count,
+                       page=page, has_next=has_next)
+        app.update_template_context(context)
+        template_stream = app.jinja_env.get_template('report.html').stream(context)
+        template_stream.enable_buffering(5)
+        return Response(stream_with_context(template_stream), mimetype='text/html')
         
+    except HTTPException:
+        # 없는 보고서나 다른 사용자의 보고서는 404 페이지로 처리
+        raise
     except Exception as e:
         # 예외 처리 - 세션 닫기 확인
         if db.session.is_active:
@@ -507,24 +1558,75 @@ def view_report(report_id):
         flash(f'보고서를 조회하는 중 오류가 발생했습니다: {str(e)}', 'danger')
         return redirect(url_for('index'))
 
+# /status 폴링 결과 캐시 (blog_id -> (post_count, report_id))
+# 클라이언트가 몇 초 간격으로 폴링하므로 짧은 시간 동안은 같은 DB 조회 결과를 재사용합니다.
+STATUS_CACHE_TTL = 2
+# 보고서가 생성된 뒤에는 상태가 더 바뀌지 않으므로 (보고서 삭제 기능 없음) 더 오래 재사용
+STATUS_DONE_CACHE_TTL = 300
+_status_cache = SimpleCache(threshold=10000, default_timeout=STATUS_CACHE_TTL)
+_status_cache_lock = threading.Lock()
+
+def query_blog_status(blog_id):
+    """
+    블로그 존재 여부, 포스트 수, 보고서 ID를 한 번의 쿼리로 조회합니다.
+    
+    Args:
+        blog_id (int): 블로그 ID
+        
+    Returns:
+        tuple or None: (post_count, report_id), 블로그가 없으면 None
+    """
+    with _status_cache_lock:
+        cached = _status_cache.get(blog_id)
+    if cached is not None:
+        return cached
+    
+    post_count = db.session.query(db.func.count(BlogPost.id)).filter(
+        BlogPost.blog_id == Blog.id
+    ).scalar_subquery()
+    report_id = db.session.query(Report.id).filter(
+        Report.blog_id == Blog.id
+    ).limit(1).scalar_subquery()
+    row = db.session.query(post_count, report_id).filter(Blog.id == blog_id).first()
+    if row is None:
+        return None
+    
+    result = (row[0], row[1])
+    timeout = STATUS_DONE_CACHE_TTL if result[1] is not None else STATUS_CACHE_TTL
+    with _status_cache_lock:
+        _status_cache.set(blog_id, result, timeout=timeout)
+    return result
+
 @app.route('/status/<int:blog_id>')
 def status(blog_id):
     try:
-        # Check if the blog exists
-        blog = Blog.query.get_or_404(blog_id)
-        
-        # Count posts for this blog
-        post_count = BlogPost.query.filter_by(blog_id=blog_id).count()
+        # 다른 사용자의 블로그는 진행 상태(오류 메시지 포함)도 보여주지 않고, 중단된 작업을 건드리지도 않음
+        # 상태 캐시는 blog_id로만 구분되므로 캐시를 조회하기 전에 확인
+        blog = db.session.get(Blog, blog_id)
+        if blog is None or not can_view_blog(blog):
+            return jsonify({'error': '블로그를 찾을 수 없습니다.'}), 404
         
-        # Check if a report exists
-        report = Report.query.filter_by(blog_id=blog_id).first()
+        # 포스트 수, 보고서 ID를 한 번에 조회
+        blog_status = query_blog_status(blog_id)
+        if blog_status is None:
+            return jsonify({'error': '블로그를 찾을 수 없습니다.'}), 404
+        post_count, report_id = blog_status
         
         status_data = {
             'post_count': post_count,
-            'has_report': report is not None,
-            'report_id': report.id if report else None
+            'has_report': report_id is not None,
+            'report_id': report_id
         }
         
+        # 백그라운드 보고서 생성 작업 상태 (보고서가 생성된 뒤에는 조회하지 않음)
+        job = get_job(blog_id) if report_id is None else None
+        if job:
+            if restart_stale_job(blog_id, job):
+                job = get_job(blog_id)
+            status_data['analysis_state'] = job['state']
+            if job['state'] == 'error':
+                status_data['analysis_error'] = job['message']
+        
         # 세션 데이터를 최소화 - 세션에 상태 데이터를 저장하지 않고 API 응답으로만 반환
         return jsonify(status_data)
         
@@ -545,4 +1647,5 @@ def server_error(e):
     return render_template('error.html', error="500 - Server Error"), 500
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # 개발용 실행 - 배포 환경에서는 gunicorn(gunicorn.conf.py)으로 실행
+    app.run(host='0.0.0.0', port=5000, debug=os.environ.get("FLASK_DEBUG") == "1", threaded=True)
@@ -1,17 +1,169 @@
+import os
 import logging
 import time
 import re
 import datetime
-import requests
-from requests.exceptions import RequestException, Timeout, ConnectionError, ReadTimeout
+import asyncio
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from blog_utils import extract_blog_id
-from scrape_blog_admin import scrape_blog_admin_mode, get_posts_via_admin_api, create_authenticated_session as create_admin_session
-from scrape_blog_mobile import scrape_blog_mobile_mode, fetch_mobile_lognos, get_post_detail
-from scrape_blog_rss import scrape_blog_rss_mode, fetch_rss_lognos
+from oauth_handler import generate_auth_cookies_from_token
+from scrape_blog_admin import get_posts_via_admin_api, create_authenticated_session as create_admin_session
+from scrape_blog_mobile import fetch_mobile_lognos, fetch_post_details
+from scrape_blog_rss import fetch_rss_lognos
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 날짜 형식 판별용 정규식 - 포스트마다 호출되므로 모듈 로드 시 한 번만 컴파일
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_DOT_DATE_RE = re.compile(r'^\d{4}\.\s*\d{1,2}\.\s*\d{1,2}\.?$')
+_DOT_DATE_SEP_RE = re.compile(r'[\.\s]')
+_KOREAN_DATE_RE = re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일')
+_ENGLISH_DATE_RE = re.compile(r'[A-Za-z]{3,9}\s+\d{1,2},\s*\d{4}')
+_WEEKDAY_DATE_RE = re.compile(r'(\d{1,2})-(\d{1,2})\s*\([월화수목금토일]\)')
+_TIMESTAMP_RE = re.compile(r'^\d{10,13}$')
+# 영문 날짜 전체 형식 ("%b %d, %Y"/"%B %d, %Y"와 같은 범위)과 월 이름(약어/전체) -> 월 번호
+_ENGLISH_DATE_FULL_RE = re.compile(r'([A-Za-z]{3,9})\s+(\d{1,2}),\s+(\d{4})')
+_ENGLISH_MONTHS = {
+    name.lower(): number
+    for number, full_name in enumerate(
+        ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+         'August', 'September', 'October', 'November', 'December'], 1)
+    for name in (full_name, full_name[:3])
+}
+
+# 비공개/접근 실패 포스트의 제목이나 본문 앞부분에 나타나는 문구 (한 번의 검색으로 확인)
+_PRIVATE_POST_RE = re.compile('|'.join(map(re.escape, ["접근 실패", "접근 권한이 없", "비공개", "권한이 없습니다", "비밀글"])))
+
+# 후순위 logNo 수집 방식이 먼저 성공했을 때 앞 순위 방식의 결과를 더 기다리는 최대 시간 (초)
+# 모바일 API/관리자 AJAX는 비공개 글까지 포함하므로 조금 기다릴 가치가 있지만, 느리게 실패하는 경우까지 기다리지는 않음
+LOGNO_PRIORITY_GRACE = float(os.environ.get("LOGNO_PRIORITY_GRACE", 3))
+
+# 한 번의 파이프라인 실행에서 상세 내용을 수집할 최대 포스트 수 (타임아웃 방지)
+PIPELINE_POST_LIMIT = 10
+
+def _dot_date(match, date_str, year):
+    # 네이버 날짜 형식 1: "YYYY. MM. DD."
+    cleaned = _DOT_DATE_SEP_RE.sub('', date_str)
+    if len(cleaned) >= 8:
+        return f"{cleaned[0:4]}-{cleaned[4:6].zfill(2)}-{cleaned[6:8].zfill(2)}"
+    return None
+
+
+def _korean_date(match, date_str, year):
+    # 네이버 날짜 형식 2: "YYYY년 MM월 DD일"
+    y, month, day = match.groups()
+    return f"{y}-{month.zfill(2)}-{day.zfill(2)}"
+
+
+def _english_date(match, date_str, year):
+    # 네이버 날짜 형식 3: "MMM DD, YYYY" (영문) - 월 이름은 표에서 찾아 strptime 예외 없이 변환
+    full = _ENGLISH_DATE_FULL_RE.fullmatch(date_str)
+    if not full:
+        return None
+    month_name, day, y = full.groups()
+    month = _ENGLISH_MONTHS.get(month_name.lower())
+    if not month:
+        return None
+    try:
+        return datetime.date(int(y), month, int(day)).strftime("%Y-%m-%d")
+    except ValueError:
+        # 존재하지 않는 날짜 (예: Feb 30)
+        return None
+
+
+def _weekday_date(match, date_str, year):
+    # 네이버 날짜 형식 4: "MM-DD (요일)" - 연도가 없으므로 올해로 간주
+    month, day = match.groups()
+    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+
+
+def _timestamp_date(match, date_str, year):
+    # Unix 타임스탬프 (밀리초)
+    timestamp = int(date_str)
+    if timestamp > 10000000000:  # 밀리초 타임스탬프
+        timestamp = timestamp / 1000
+    return datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+
+
+# (판별 함수, 변환 함수) 목록 - 처음 일치하는 형식 하나만 시도
+_DATE_FORMATS = (
+    (_DOT_DATE_RE.match, _dot_date),
+    (_KOREAN_DATE_RE.search, _korean_date),
+    (_ENGLISH_DATE_RE.match, _english_date),
+    (_WEEKDAY_DATE_RE.match, _weekday_date),
+    (_TIMESTAMP_RE.match, _timestamp_date),
+)
+
+# 첫 글자 종류별로 일치할 수 있는 형식만 남긴 목록 (순서는 _DATE_FORMATS와 동일)
+# 숫자로만 된 문자열은 타임스탬프, 영문으로 시작하면 영문/한글 날짜만 가능하므로 나머지 정규식은 실행하지 않음
+_DATE_DISPATCH = {
+    'digits': (_DATE_FORMATS[4],),
+    'digit': (_DATE_FORMATS[0], _DATE_FORMATS[1], _DATE_FORMATS[3]),
+    'alpha': (_DATE_FORMATS[1], _DATE_FORMATS[2]),
+    'other': (_DATE_FORMATS[1],),
+}
+
+
+def _date_class(date_str):
+    """
+    날짜 문자열의 첫 글자 종류로 _DATE_DISPATCH 키를 정합니다.
+    """
+    first = date_str[:1]
+    if first.isdigit():
+        return 'digits' if date_str.isdigit() else 'digit'
+    if first.isascii() and first.isalpha():
+        return 'alpha'
+    return 'other'
+
+
+@lru_cache(maxsize=1)
+def _current_year_bucketed(hour):
+    """
+    현재 연도를 반환합니다. hour(1시간 단위 시각)가 바뀔 때만 다시 계산합니다.
+    """
+    return datetime.datetime.now().year
+
+
+def _current_year():
+    """
+    날짜마다 datetime 객체를 만들지 않도록 1시간 단위로 캐시한 현재 연도를 반환합니다.
+    """
+    return _current_year_bucketed(int(time.time() // 3600))
+
+
+def _is_iso_date(date_str):
+    """
+    이미 YYYY-MM-DD 형식인지 정규식 없이 문자 비교만으로 확인합니다.
+    저장된 포스트와 API 응답의 날짜는 대부분 이 형식이므로 가장 먼저 검사합니다.
+    """
+    return (len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-' and date_str.isascii()
+            and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit())
+
+
+@lru_cache(maxsize=4096)
+def _normalize_date(date_str, year):
+    """
+    공백을 제거한 날짜 문자열을 YYYY-MM-DD 형식으로 변환합니다.
+    한 블로그의 날짜 문자열은 종류가 많지 않으므로 결과를 캐시합니다.
+    연도가 없는 형식은 올해를 기준으로 하므로 연도를 캐시 키에 포함합니다.
+    """
+    if _ISO_DATE_RE.match(date_str):
+        return date_str
+    
+    try:
+        for matcher, convert in _DATE_DISPATCH[_date_class(date_str)]:
+            match = matcher(date_str)
+            if match:
+                return convert(match, date_str, year) or date_str
+    except Exception as e:
+        logger.error(f"날짜 정규화 오류: {str(e)}")
+    
+    # 정규화 실패 시 원본 반환
+    return date_str
+
+
 def normalize_date_format(date_str):
     """
     다양한 네이버 블로그 날짜 형식을 YYYY-MM-DD 형식으로 정규화합니다.
@@ -26,64 +178,167 @@ def normalize_date_format(date_str):
         # 현재 날짜 기본값 사용
         return datetime.datetime.now().strftime("%Y-%m-%d")
     
-    date_str = date_str.strip()
-    
-    # 이미 YYYY-MM-DD 형식이면 그대로 반환
-    if re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
+    if _is_iso_date(date_str):
         return date_str
+    return _normalize_date(date_str.strip(), _current_year())
+
+
+def normalize_date_formats(date_strs):
+    """
+    여러 날짜 문자열을 한 번에 YYYY-MM-DD 형식으로 정규화합니다.
+    같은 날짜 문자열은 한 번만 변환합니다.
     
-    try:
-        # 네이버 날짜 형식 1: "YYYY. MM. DD."
-        if re.match(r'^\d{4}\.\s*\d{1,2}\.\s*\d{1,2}\.?$', date_str):
-            cleaned = re.sub(r'[\.\s]', '', date_str)
-            if len(cleaned) >= 8:
-                year = cleaned[0:4]
-                month = cleaned[4:6].zfill(2)
-                day = cleaned[6:8].zfill(2)
-                return f"{year}-{month}-{day}"
-        
-        # 네이버 날짜 형식 2: "YYYY년 MM월 DD일"
-        elif re.search(r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일', date_str):
-            match = re.search(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', date_str)
-            if match:
-                year, month, day = match.groups()
-                return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-        
-        # 네이버 날짜 형식 3: "MMM DD, YYYY" (영문)
-        elif re.match(r'[A-Za-z]{3,9}\s+\d{1,2},\s*\d{4}', date_str):
-            try:
-                dt = datetime.datetime.strptime(date_str, "%b %d, %Y")
-                return dt.strftime("%Y-%m-%d")
-            except ValueError:
-                try:
-                    dt = datetime.datetime.strptime(date_str, "%B %d, %Y")
-                    return dt.strftime("%Y-%m-%d")
-                except ValueError:
-                    pass
+    Args:
+        date_strs (list): 원본 날짜 문자열 목록
         
-        # 네이버 날짜 형식 4: "MM-DD (요일)"
-        elif re.match(r'\d{1,2}-\d{1,2}\s*\([월화수목금토일]\)', date_str):
-            match = re.match(r'(\d{1,2})-(\d{1,2})', date_str)
-            if match:
-                month, day = match.groups()
-                year = datetime.datetime.now().year
-                return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+    Returns:
+        list: 같은 순서의 정규화된 날짜 목록 (빈 값은 그대로 유지)
+    """
+    year = _current_year()
+    converted = {}
+    normalized = []
+    for date_str in date_strs:
+        if not date_str or _is_iso_date(date_str):
+            normalized.append(date_str)
+            continue
+        if date_str not in converted:
+            converted[date_str] = _normalize_date(date_str.strip(), year)
+        normalized.append(converted[date_str])
+    return normalized
+
+
+def _collect_mobile_lognos(blog_id, session):
+    """
+    단계 1: 모바일 API 방식으로 logNo 목록을 수집합니다 (OAuth 권장, 비공개 글 접근 가능).
+    """
+    logger.debug("단계 1: 모바일 API 방식으로 logNo 수집 시작")
+    start_time = time.time()
+    
+    # 모바일 API로 logNo 목록 가져오기 (비공개 글 포함)
+    mobile_log_nos = fetch_mobile_lognos(session, blog_id)
+    
+    if mobile_log_nos:
+        duration = time.time() - start_time
+        logger.debug(f"모바일 API 성공: {len(mobile_log_nos)}개 logNo, {duration:.2f}초 소요")
+    else:
+        logger.warning("모바일 API 방식 실패, 다음 단계로 진행")
+    return mobile_log_nos
+
+
+def _collect_admin_lognos(blog_id, session):
+    """
+    단계 2: 관리자 AJAX 방식으로 logNo 목록을 수집합니다 (OAuth 필수).
+    """
+    logger.debug("단계 2: 관리자 AJAX 방식으로 logNo 수집 시작")
+    start_time = time.time()
+    
+    # 관리자 API로 포스트 목록 가져오기
+    # 상세 내용은 최신 PIPELINE_POST_LIMIT개만 수집하므로 목록도 그만큼만 요청 (전체 페이지 순회 방지)
+    admin_posts = get_posts_via_admin_api(session, blog_id, max_posts=PIPELINE_POST_LIMIT)
+    
+    if admin_posts:
+        admin_log_nos = [log_no for post in admin_posts if (log_no := post.get('logNo'))]
+        duration = time.time() - start_time
+        logger.debug(f"관리자 AJAX 성공: {len(admin_log_nos)}개 logNo, {duration:.2f}초 소요")
+        return admin_log_nos
+    
+    logger.warning("관리자 AJAX 방식 실패, 다음 단계로 진행")
+    return None
+
+
+def _collect_rss_lognos(blog_id, session):
+    """
+    단계 3: RSS 피드 방식으로 logNo 목록을 수집합니다 (OAuth 필수 아님, 공개 글만).
+    """
+    logger.debug("단계 3: RSS 피드 방식으로 logNo 수집 시작")
+    start_time = time.time()
+    
+    # RSS 피드로 logNo 목록 가져오기 (인증 헤더 없이 공개 피드를 요청하므로 자체 세션 사용)
+    rss_log_nos = fetch_rss_lognos(blog_id)
+    
+    if rss_log_nos:
+        duration = time.time() - start_time
+        logger.debug(f"RSS 피드 성공: {len(rss_log_nos)}개 logNo, {duration:.2f}초 소요")
+    else:
+        logger.warning("RSS 피드 방식도 실패")
+    return rss_log_nos
+
+
+def collect_lognos_concurrently(blog_id, access_token=None, session=None):
+    """
+    모바일 API, 관리자 AJAX, RSS 피드 방식으로 동시에 logNo 목록을 수집하고,
+    우선순위가 가장 높은 성공 결과를 반환합니다. 후순위 방식이 먼저 성공하면
+    앞 순위 방식은 LOGNO_PRIORITY_GRACE초까지만 기다립니다.
+    
+    Args:
+        blog_id (str): 네이버 블로그 ID
+        access_token (str, optional): OAuth 액세스 토큰
+        session (requests.Session, optional): 모바일/관리자 방식이 함께 사용할 인증된 세션 (없으면 새로 생성)
         
-        # Unix 타임스탬프 (밀리초)
-        elif re.match(r'^\d{10,13}$', date_str):
-            timestamp = int(date_str)
-            if timestamp > 10000000000:  # 밀리초 타임스탬프
-                timestamp = timestamp / 1000
-            dt = datetime.datetime.fromtimestamp(timestamp)
-            return dt.strftime("%Y-%m-%d")
+    Returns:
+        tuple: (logNo 목록 또는 None, 사용된 방식 이름 또는 None)
+    """
+    if session is None:
+        session = create_admin_session(access_token)
     
-    except Exception as e:
-        logger.error(f"날짜 정규화 오류: {str(e)}")
+    collectors = [("mobile", _collect_mobile_lognos)]
+    if access_token:
+        collectors.append(("admin", _collect_admin_lognos))
+    else:
+        logger.warning("OAuth 토큰이 없어 관리자 AJAX 방식을 건너뜁니다.")
+    collectors.append(("rss", _collect_rss_lognos))
     
-    # 정규화 실패 시 원본 반환
-    return date_str
+    executor = ThreadPoolExecutor(max_workers=len(collectors), thread_name_prefix="lognos")
+    try:
+        futures = {executor.submit(collector, blog_id, session): (rank, method)
+                   for rank, (method, collector) in enumerate(collectors)}
+        pending = set(futures)
+        results = {}
+        deadline = None
+        
+        while pending:
+            done, pending = wait(pending, timeout=None if deadline is None else max(0, deadline - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            for future in done:
+                rank, method = futures[future]
+                try:
+                    log_nos = future.result()
+                except Exception as e:
+                    logger.error(f"{method} logNo 수집 오류: {str(e)}")
+                    continue
+                if log_nos:
+                    results[rank] = (log_nos, method)
+            
+            if results:
+                best = min(results)
+                # 더 앞 순위의 방식이 모두 끝났으면 바로 사용
+                if not any(futures[f][0] < best for f in pending):
+                    return results[best]
+                # 후순위 결과가 있으면 앞 순위 방식은 정해진 시간까지만 기다림
+                if deadline is None:
+                    deadline = time.monotonic() + LOGNO_PRIORITY_GRACE
+                elif time.monotonic() >= deadline:
+                    log_nos, method = results[best]
+                    logger.debug(f"앞 순위 수집 방식이 {LOGNO_PRIORITY_GRACE}초 안에 끝나지 않아 {method} 결과 사용")
+                    return results[best]
+        
+        if results:
+            return results[min(results)]
+        return None, None
+    finally:
+        # 이미 결과를 얻었으면 남은 수집 작업을 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
+
 
-def scrape_blog_pipeline(blog_url, access_token=None, use_playwright=True):
+# 스크래핑 방식별 결과 메시지에 표시할 이름
+SCRAPE_METHOD_LABELS = {
+    "admin": "관리자 API",
+    "mobile": "모바일 API",
+    "rss": "RSS 피드",
+}
+
+
+def scrape_blog_pipeline(blog_url, access_token=None, use_playwright=True, session=None, refresh=False):
     """
     단계적 블로그 스크래핑 파이프라인을 실행합니다.
     
@@ -101,6 +356,9 @@ def scrape_blog_pipeline(blog_url, access_token=None, use_playwright=True):
         access_token (str, optional): OAuth 액세스 토큰
         use_playwright (bool, optional): Playwright 자동화를 사용할지 여부. 기본값은 True.
                                          비공개 글 접근에 가장 효과적이지만 시간이 조금 더 소요됨.
+        session (requests.Session, optional): OAuth 토큰으로 인증된 세션. 없으면 한 번 만들어
+                                              logNo 수집과 상세 내용 수집에 함께 사용
+        refresh (bool, optional): True이면 이전에 가져온 포스트 상세 내용도 다시 요청
         
     Returns:
         tuple: (성공 여부, 메시지, 포스트 목록)
@@ -109,7 +367,6 @@ def scrape_blog_pipeline(blog_url, access_token=None, use_playwright=True):
     auth_cookies = {}
     if access_token:
         try:
-            from oauth_handler import generate_auth_cookies_from_token
             auth_cookies = generate_auth_cookies_from_token(access_token)
             if auth_cookies:
                 logger.debug(f"OAuth 토큰으로부터 {len(auth_cookies)}개의 인증 쿠키를 생성했습니다")
@@ -160,167 +417,62 @@ def scrape_blog_pipeline(blog_url, access_token=None, use_playwright=True):
                 logger.error(f"Playwright 스크래핑 오류: {str(pw_error)}")
                 logger.debug("대체 방법으로 진행합니다")
         
-        # 스크래핑 메소드 순서 변경: 모바일 API를 먼저 시도합니다 (비공개 글 접근성 향상)
-        
-        # 단계 1: 모바일 API 방식 (OAuth 권장, 비공개 글 접근 가능)
-        logger.debug("단계 1: 모바일 API 방식으로 logNo 수집 시작")
-        start_time = time.time()
-        
-        try:
-            # 모바일 API로 logNo 목록 가져오기 (비공개 글 포함)
-            mobile_session = create_admin_session(access_token)
-            mobile_log_nos = fetch_mobile_lognos(mobile_session, blog_id)
-            
-            if mobile_log_nos:
-                all_log_nos = mobile_log_nos
-                method_used = "mobile"
-                duration = time.time() - start_time
-                logger.debug(f"모바일 API 성공: {len(all_log_nos)}개 logNo, {duration:.2f}초 소요")
-            else:
-                logger.warning("모바일 API 방식 실패, 다음 단계로 진행")
-        except Exception as e:
-            logger.error(f"모바일 API logNo 수집 오류: {str(e)}")
-        
-        # 단계 2: 관리자 AJAX 방식 (OAuth 필수)
-        if not all_log_nos and access_token:
-            logger.debug("단계 2: 관리자 AJAX 방식으로 logNo 수집 시작")
-            start_time = time.time()
-            
-            try:
-                # 인증된 세션 생성
-                admin_session = create_admin_session(access_token)
-                # 관리자 API로 포스트 목록 가져오기
-                admin_posts = get_posts_via_admin_api(admin_session, blog_id)
-                
-                if admin_posts:
-                    all_log_nos = [post.get('logNo') for post in admin_posts if post.get('logNo')]
-                    method_used = "admin"
-                    duration = time.time() - start_time
-                    logger.debug(f"관리자 AJAX 성공: {len(all_log_nos)}개 logNo, {duration:.2f}초 소요")
-                else:
-                    logger.warning("관리자 AJAX 방식 실패, 다음 단계로 진행")
-            except Exception as e:
-                logger.error(f"관리자 AJAX logNo 수집 오류: {str(e)}")
-        elif not all_log_nos and not access_token:
-            logger.warning("OAuth 토큰이 없어 관리자 AJAX 방식을 건너뜁니다.")
-        
-        # 단계 3: RSS 피드 방식 (OAuth 필수 아님, 공개 글만)
-        if not all_log_nos:
-            logger.debug("단계 3: RSS 피드 방식으로 logNo 수집 시작")
-            start_time = time.time()
-            
-            try:
-                # RSS 피드로 logNo 목록 가져오기
-                rss_log_nos = fetch_rss_lognos(blog_id)
-                
-                if rss_log_nos:
-                    all_log_nos = rss_log_nos
-                    method_used = "rss"
-                    duration = time.time() - start_time
-                    logger.debug(f"RSS 피드 성공: {len(all_log_nos)}개 logNo, {duration:.2f}초 소요")
-                else:
-                    logger.warning("RSS 피드 방식도 실패")
-            except Exception as e:
-                logger.error(f"RSS 피드 logNo 수집 오류: {str(e)}")
+        # 스크래핑 메소드 순서: 모바일 API > 관리자 AJAX > RSS (비공개 글 접근성 순)
+        # 앞 단계가 실패할 때까지 기다린 뒤 다음 단계를 시작하면 실패한 단계의 대기 시간이 그대로 누적되므로
+        # 세 방식을 동시에 시작하고, 우선순위가 가장 높은 성공 결과를 사용합니다 (앞 순위 방식은 LOGNO_PRIORITY_GRACE초까지만 기다림).
+        if session is None:
+            session = create_admin_session(access_token)
+        all_log_nos, method_used = collect_lognos_concurrently(blog_id, access_token, session)
         
         # logNo 목록을 얻지 못한 경우
+        # 각 방식의 전체 스크래핑(scrape_blog_*_mode)도 같은 목록 수집부터 다시 하므로 추가로 시도하지 않음
         if not all_log_nos:
-            # 각 방법을 직접 시도 (전체 파이프라인)
-            logger.debug("개별 logNo 수집 실패, 전체 스크래핑 파이프라인 시도")
-            
-            # 관리자 AJAX 방식 시도
-            if access_token:
-                logger.debug("관리자 AJAX 전체 스크래핑 시도")
-                try:
-                    admin_posts = scrape_blog_admin_mode(blog_url, access_token)
-                    if admin_posts:
-                        return True, f"관리자 API로 {len(admin_posts)}개의 포스트를 가져왔습니다.", admin_posts
-                except Exception as e:
-                    logger.error(f"관리자 AJAX 전체 스크래핑 오류: {str(e)}")
-            
-            # 모바일 API 방식 시도
-            logger.debug("모바일 API 전체 스크래핑 시도")
-            try:
-                mobile_posts = scrape_blog_mobile_mode(blog_url, access_token)
-                if mobile_posts:
-                    return True, f"모바일 API로 {len(mobile_posts)}개의 포스트를 가져왔습니다.", mobile_posts
-            except Exception as e:
-                logger.error(f"모바일 API 전체 스크래핑 오류: {str(e)}")
-            
-            # RSS 피드 방식 시도
-            logger.debug("RSS 피드 전체 스크래핑 시도")
-            try:
-                rss_posts = scrape_blog_rss_mode(blog_url, access_token)
-                if rss_posts:
-                    return True, f"RSS 피드로 {len(rss_posts)}개의 포스트를 가져왔습니다.", rss_posts
-            except Exception as e:
-                logger.error(f"RSS 피드 전체 스크래핑 오류: {str(e)}")
-            
-            # 모든 방법 실패
+            logger.warning("모든 방식으로 logNo 목록을 가져오지 못했습니다")
             return False, "모든 스크래핑 방법이 실패했습니다. 블로그 URL과 계정 권한을 확인해주세요.", []
         
         # logNo 목록을 얻었으므로 포스트 상세 내용 수집
         logger.debug(f"{method_used} 방식으로 얻은 {len(all_log_nos)}개 logNo로 상세 내용 수집 시작")
         
-        # 최대 10개로 제한 (기존 20개에서 추가 축소하여 타임아웃 방지)
+        # 최대 PIPELINE_POST_LIMIT개로 제한 (기존 20개에서 추가 축소하여 타임아웃 방지)
         # logNo 형식이 숫자이므로 역순 정렬 - 최신글이 일반적으로 큰 숫자
         all_log_nos = sorted(all_log_nos, reverse=True)
-        if len(all_log_nos) > 10:
-            logger.debug(f"logNo 수 제한: {len(all_log_nos)}개 -> 10개")
-            all_log_nos = all_log_nos[:10]
+        if len(all_log_nos) > PIPELINE_POST_LIMIT:
+            logger.debug(f"logNo 수 제한: {len(all_log_nos)}개 -> {PIPELINE_POST_LIMIT}개")
+            all_log_nos = all_log_nos[:PIPELINE_POST_LIMIT]
         
         # 포스트 상세 내용 수집
         posts = []
-        session = create_admin_session(access_token)
         
         # 생성된 인증 쿠키를 세션에 직접 적용 (비공개 글 접근 개선)
         if auth_cookies:
             logger.debug("인증 쿠키를 세션에 직접 적용합니다")
             session.cookies.update(auth_cookies)
         
-        for log_no in all_log_nos:
+        # 포스트 상세 페이지를 동시에 요청 (동시 요청 수는 세마포어로 제한)
+        post_details = asyncio.run(fetch_post_details(session, blog_id, all_log_nos, refresh=refresh))
+        
+        # 포스트 URL은 logNo만 다르므로 한 번에 만들어 둠
+        post_urls = [f"https://blog.naver.com/{blog_id}/{log_no}" for log_no in all_log_nos]
+        
+        for log_no, post_url, post_detail in zip(all_log_nos, post_urls, post_details):
             try:
-                # 네트워크 오류 재시도 메커니즘 추가
-                max_retries = 2
-                retry_count = 0
-                post_detail = None
-                
-                # 현재 세션 환경에 맞는 함수 선택 (모바일)
-                from scrape_blog_mobile import get_post_detail
-                
-                while retry_count <= max_retries and not post_detail:
-                    try:
-                        logger.debug(f"포스트 {log_no} 상세 내용 가져오기 시도 {retry_count+1}/{max_retries+1}")
-                        post_detail = get_post_detail(session, blog_id, log_no)
-                        break  # 성공하면 루프 종료
-                    except (RequestException, ConnectionError, Timeout, ReadTimeout) as req_err:
-                        logger.warning(f"포스트 {log_no} 네트워크 오류 (재시도 {retry_count+1}/{max_retries+1}): {str(req_err)}")
-                        retry_count += 1
-                        if retry_count <= max_retries:
-                            time.sleep(1)  # 재시도 전 대기
-                    except Exception as other_err:
-                        logger.error(f"포스트 {log_no} 처리 중 오류: {str(other_err)}")
-                        break  # 네트워크 오류가 아닌 경우 재시도하지 않음
-                
                 if post_detail:
                     # 필요한 필드 확인 및 추가
                     if 'logNo' not in post_detail:
                         post_detail['logNo'] = log_no
                     if 'url' not in post_detail:
-                        post_detail['url'] = f"https://blog.naver.com/{blog_id}/{log_no}"
+                        post_detail['url'] = post_url
                     
                     # 비공개 글 감지 개선: 제목이나 내용에 특정 키워드가 있으면 비공개 글로 처리
                     title = post_detail.get('title', '제목 없음')
                     content = post_detail.get('content', '')
                     is_private = post_detail.get('is_private', False)
                     
-                    # 자동 비공개 글 감지 (추가 검사)
-                    private_keywords = ["접근 실패", "접근 권한이 없", "비공개", "권한이 없습니다", "비밀글"]
-                    for keyword in private_keywords:
-                        if keyword in title or (content and keyword in content[:100]):  # 제목이나 내용 앞부분에서 검사
-                            is_private = True
-                            logger.debug(f"비공개 글 감지: 키워드 '{keyword}' 발견")
-                            break
+                    # 자동 비공개 글 감지 (추가 검사) - 제목이나 내용 앞부분에서 검사
+                    private_match = _PRIVATE_POST_RE.search(title) or _PRIVATE_POST_RE.search(content[:100] if content else '')
+                    if private_match:
+                        is_private = True
+                        logger.debug(f"비공개 글 감지: 키워드 '{private_match.group()}' 발견")
                     
                     # 매우 짧은 내용이면 비공개일 가능성 높음 (예외적 상황 시)
                     if not is_private and content and len(content.strip()) < 50:
@@ -330,13 +482,7 @@ def scrape_blog_pipeline(blog_url, access_token=None, use_playwright=True):
                     # 업데이트된 is_private 상태 반영
                     post_detail['is_private'] = is_private
                     
-                    # 날짜 형식 정규화 (YYYY-MM-DD)
-                    if 'date' in post_detail and post_detail['date']:
-                        post_detail['date'] = normalize_date_format(post_detail['date'])
-                    
                     posts.append(post_detail)
-                    # 서버 부하 방지 (0.5초 → 0.1초로 단축)
-                    time.sleep(0.1)
                 else:
                     # 최대 재시도 후에도 실패하면 최소한의 정보로 기록
                     fallback_post = {
@@ -345,7 +491,7 @@ def scrape_blog_pipeline(blog_url, access_token=None, use_playwright=True):
                         'content': '네트워크 오류로 접근할 수 없는 포스트입니다.',
                         'date': datetime.datetime.now().strftime("%Y-%m-%d"),
                         'is_private': True,
-                        'url': f"https://blog.naver.com/{blog_id}/{log_no}"
+                        'url': post_url
                     }
                     posts.append(fallback_post)
                     logger.warning(f"포스트 {log_no} 가져오기 실패 후 대체 정보 사용")
@@ -356,15 +502,14 @@ def scrape_blog_pipeline(blog_url, access_token=None, use_playwright=True):
         if not posts:
             return False, "포스트 상세 내용을 가져올 수 없습니다.", []
         
-        # 성공 메시지 구성
-        method_names = {
-            "admin": "관리자 API",
-            "mobile": "모바일 API",
-            "rss": "RSS 피드"
-        }
+        # 날짜 형식 정규화 (YYYY-MM-DD) - 모든 포스트를 한 번에 처리
+        for post, date in zip(posts, normalize_date_formats([post.get('date') for post in posts])):
+            if date:
+                post['date'] = date
         
+        # 성공 메시지 구성
         # 안전한 메서드 이름 표시 
-        method_display = method_names[method_used] if method_used in method_names else str(method_used)
+        method_display = SCRAPE_METHOD_LABELS.get(method_used, str(method_used))
         private_post_note = ""
         if method_used == "rss" and access_token:
             private_post_note = " (RSS는 비공개 글은 포함하지 않습니다.)"
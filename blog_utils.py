@@ -1,7 +1,349 @@
+import os
 import re
+import time
+import random
+import asyncio
+import hashlib
+import logging
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from cachelib import FileSystemCache
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse, parse_qs
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 
+# 일시적인 오류로 보고 재시도하는 HTTP 상태 코드 (요청 과다, 게이트웨이 오류, 서비스 불가)
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# 재시도 대기 시간: RETRY_BACKOFF_BASE * 2^시도 횟수 + 0~RETRY_BACKOFF_JITTER초 (최대 RETRY_BACKOFF_MAX초)
+# 여러 요청이 같은 순간에 다시 몰리지 않도록 임의의 지연(jitter)을 더합니다.
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_JITTER = 0.3
+RETRY_BACKOFF_MAX = 30
+
+class CappedRetry(Retry):
+    """
+    Retry-After 대기 시간을 RETRY_BACKOFF_MAX초로 제한하는 urllib3 Retry
+    (urllib3의 backoff_max는 지수 백오프에만 적용되고 Retry-After 값은 그대로 기다립니다)
+    """
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_BACKOFF_MAX)
+
+
+# 네이버 요청용 공유 커넥션 풀
+# 사용자별 세션을 새로 만들더라도 같은 어댑터를 마운트하면 TCP/TLS 연결을 재사용할 수 있습니다.
+# 429/503 응답의 Retry-After 헤더를 따르되 최대 RETRY_BACKOFF_MAX초까지만 기다립니다.
+NAVER_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=CappedRetry(total=3, backoff_factor=RETRY_BACKOFF_BASE,
+                           backoff_jitter=RETRY_BACKOFF_JITTER,
+                           backoff_max=RETRY_BACKOFF_MAX,
+                           status_forcelist=sorted(RETRYABLE_STATUSES),
+                           respect_retry_after_header=True,
+                           raise_on_status=False)
+)
+
+
+def retry_delay(attempt, retry_after=None):
+    """
+    재시도 전에 기다릴 시간(초)을 계산합니다.
+    서버가 Retry-After 헤더를 보냈으면 그 값을 따르고, 아니면 지수 백오프에 jitter를 더합니다.
+
+    Args:
+        attempt (int): 지금까지 실패한 횟수 (0부터 시작)
+        retry_after (str, optional): Retry-After 헤더 값 (초 또는 HTTP 날짜)
+
+    Returns:
+        float: 대기 시간 (초)
+    """
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), RETRY_BACKOFF_MAX)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                return min(max(delay, 0.0), RETRY_BACKOFF_MAX)
+            except (TypeError, ValueError):
+                pass
+    return min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** attempt + random.uniform(0, RETRY_BACKOFF_JITTER))
+
+
+def create_pooled_session():
+    """
+    공유 커넥션 풀을 사용하는 requests 세션을 생성합니다.
+    헤더와 쿠키는 세션마다 따로 관리되므로 사용자 간에 인증 정보가 섞이지 않습니다.
+
+    Returns:
+        requests.Session: 공유 어댑터가 마운트된 세션 객체
+    """
+    session = requests.Session()
+    session.mount('https://', NAVER_HTTP_ADAPTER)
+    session.mount('http://', NAVER_HTTP_ADAPTER)
+    return session
+
+
+# 인증 상태가 필요 없는 네이버 API 호출용 세션 (Authorization 헤더는 요청마다 전달)
+naver_http = create_pooled_session()
+
+logger = logging.getLogger(__name__)
+
+# 포스트 상세 페이지 동시 요청 수 (네이버 서버 부하를 고려하여 제한)
+DETAIL_FETCH_CONCURRENCY = 8
+
+# 포스트 상세 페이지 초당 요청 수 상한 (프로세스 전체 합계)
+NAVER_REQUESTS_PER_SECOND = float(os.environ.get("NAVER_REQUESTS_PER_SECOND", 10))
+
+
+class RateLimiter:
+    """
+    토큰 버킷 방식의 요청 속도 제한기입니다.
+    평균 rate회/per초를 넘지 않도록 각 요청의 시작 시각을 예약하며, 한동안 요청이 없었으면
+    burst개까지는 기다리지 않고 바로 보냅니다. 스레드와 이벤트 루프 어디에서든 공유할 수 있습니다.
+
+    요청 간격은 서버 응답에 따라 조정됩니다 (AIMD). 429/5xx 응답을 받으면 간격을 두 배로 늘리고(최대 max_interval초),
+    연속으로 success_streak번 성공할 때마다 절반으로 줄여 설정한 rate까지 회복합니다.
+    """
+
+    def __init__(self, rate, per=1.0, burst=1, max_interval=5.0, success_streak=5):
+        self.min_interval = per / rate
+        self.max_interval = max(max_interval, self.min_interval)
+        self.interval = self.min_interval
+        self.burst = max(int(burst), 1)
+        self.success_streak = success_streak
+        self._successes = 0
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def on_success(self):
+        """
+        요청이 성공했음을 알립니다. 연속 성공이 쌓이면 요청 간격을 줄입니다.
+        """
+        with self._lock:
+            if self.interval <= self.min_interval:
+                return
+            self._successes += 1
+            if self._successes >= self.success_streak:
+                self._successes = 0
+                self.interval = max(self.interval / 2, self.min_interval)
+
+    def on_rate_limited(self):
+        """
+        요청 과다(429)나 서버 오류(5xx) 응답을 받았음을 알립니다. 요청 간격을 두 배로 늘립니다.
+        """
+        with self._lock:
+            self._successes = 0
+            self.interval = min(self.interval * 2, self.max_interval)
+            logger.warning(f"네이버 요청 간격 조정: {self.interval:.2f}초")
+
+    def _reserve(self):
+        """
+        다음 요청 시각을 예약하고, 그때까지 기다려야 하는 시간(초)을 반환합니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            # 쉬는 동안 쌓인 토큰은 burst개까지만 인정
+            start = max(self._next_time, now - (self.burst - 1) * self.interval)
+            self._next_time = start + self.interval
+            return max(start - now, 0.0)
+
+    def wait(self):
+        """
+        요청을 보내도 될 때까지 현재 스레드를 대기시킵니다.
+        """
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def wait_async(self):
+        """
+        요청을 보내도 될 때까지 현재 코루틴을 대기시킵니다 (이벤트 루프는 막지 않음).
+        """
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+# 모든 사용자의 상세 페이지 요청이 함께 쓰는 속도 제한기
+naver_rate_limiter = RateLimiter(NAVER_REQUESTS_PER_SECOND, burst=DETAIL_FETCH_CONCURRENCY)
+
+
+def fetch_details_concurrently(get_detail, session, blog_id, log_nos):
+    """
+    동기 방식 상세 조회 함수를 스레드 풀에서 동시에 실행합니다.
+    포스트마다 순서대로 요청하면 전체 시간이 응답 대기 시간의 합이 되므로
+    DETAIL_FETCH_CONCURRENCY개까지 동시에 요청하고, 초당 요청 수는 naver_rate_limiter로 제한합니다.
+
+    Args:
+        get_detail (callable): (session, blog_id, log_no)를 받아 포스트 딕셔너리를 반환하는 함수
+        session (requests.Session): 인증된 세션 (공유 커넥션 풀 사용)
+        blog_id (str): 블로그 ID
+        log_nos (list): 포스트 번호 목록
+
+    Returns:
+        list: 가져온 포스트 목록 (log_nos 순서 유지, 실패한 포스트 제외)
+    """
+    def fetch(log_no):
+        try:
+            naver_rate_limiter.wait()
+            return get_detail(session, blog_id, log_no)
+        except Exception as e:
+            logger.error(f"포스트 {log_no} 처리 중 오류: {str(e)}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=DETAIL_FETCH_CONCURRENCY, thread_name_prefix="post-detail") as executor:
+        return [post for post in executor.map(fetch, log_nos) if post]
+
+
+# 조건부 요청(ETag/Last-Modified) 캐시
+# 응답 검증자와 함께 파싱이 끝난 결과를 저장해 두고, 서버가 304(변경 없음)를 반환하면 다시 파싱하지 않고 재사용합니다.
+# 기본 위치는 Flask 인스턴스 폴더(instance/) 아래이며, 캐시 디렉터리는 처음 사용할 때 만듭니다.
+HTTP_CACHE_DIR = os.environ.get(
+    "HTTP_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instance', 'http_cache')
+)
+HTTP_CACHE_TTL = int(os.environ.get("HTTP_CACHE_TTL", 7 * 86400))
+_http_cache = None
+_http_cache_lock = threading.Lock()
+
+
+def _get_http_cache():
+    """
+    조건부 요청 캐시를 처음 사용할 때 만듭니다. 모듈을 import하기만 해도 캐시 디렉터리가 생기지 않도록 합니다.
+    
+    Returns:
+        FileSystemCache: 조건부 요청 캐시
+    """
+    global _http_cache
+    if _http_cache is None:
+        with _http_cache_lock:
+            if _http_cache is None:
+                _http_cache = FileSystemCache(HTTP_CACHE_DIR, threshold=5000, default_timeout=HTTP_CACHE_TTL)
+    return _http_cache
+
+
+def http_cache_key(resource, scope=''):
+    """
+    조건부 요청 캐시 키를 만듭니다.
+
+    Args:
+        resource (str): 캐시할 자원 (URL 등, 요청마다 바뀌는 캐시 방지 파라미터는 제외)
+        scope (str): 같은 자원이라도 결과가 달라지는 인증 정보 등 (원문 대신 해시만 키에 사용)
+
+    Returns:
+        str: 캐시 키
+    """
+    return "http:" + hashlib.sha1(f"{scope}\n{resource}".encode('utf-8')).hexdigest()
+
+
+def load_validated(key):
+    """
+    캐시된 검증자로 조건부 요청 헤더를 만들고, 캐시된 결과를 함께 반환합니다.
+
+    Args:
+        key (str): http_cache_key로 만든 캐시 키
+
+    Returns:
+        tuple: (요청에 추가할 헤더 딕셔너리, 캐시된 결과 또는 None)
+    """
+    try:
+        entry = _get_http_cache().get(key)
+    except Exception as e:
+        logger.error(f"HTTP 캐시 조회 오류: {str(e)}")
+        entry = None
+    if not entry:
+        return {}, None
+
+    headers = {}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers, entry['value']
+
+
+def load_fresh(key, max_age):
+    """
+    저장된 지 max_age초가 지나지 않은 결과를 반환합니다. 이 경우 요청 자체를 보내지 않아도 됩니다.
+
+    Args:
+        key (str): http_cache_key로 만든 캐시 키
+        max_age (float): 요청 없이 재사용할 최대 시간 (초)
+
+    Returns:
+        캐시된 결과, 없거나 오래되었으면 None
+    """
+    try:
+        entry = _get_http_cache().get(key)
+    except Exception as e:
+        logger.error(f"HTTP 캐시 조회 오류: {str(e)}")
+        return None
+    if entry and time.time() - entry.get('stored_at', 0) < max_age:
+        return entry['value']
+    return None
+
+
+def save_validated(key, response_headers, value, keep_without_validators=False):
+    """
+    응답에 ETag나 Last-Modified가 있으면 파싱한 결과와 함께 저장합니다.
+
+    Args:
+        key (str): http_cache_key로 만든 캐시 키
+        response_headers (Mapping): 응답 헤더
+        value: 저장할 파싱 결과
+        keep_without_validators (bool): True이면 검증자가 없어도 저장 (load_fresh로만 재사용)
+    """
+    etag = response_headers.get('ETag')
+    last_modified = response_headers.get('Last-Modified')
+    if not etag and not last_modified and not keep_without_validators:
+        return
+    try:
+        _get_http_cache().set(key, {'etag': etag, 'last_modified': last_modified, 'value': value,
+                              'stored_at': time.time()})
+    except Exception as e:
+        logger.error(f"HTTP 캐시 저장 오류: {str(e)}")
+
+
+# 링크/본문에서 logNo 파라미터를 찾는 정규식 (한 번만 컴파일)
+LOGNO_PARAM_RE = re.compile(r'logNo=(\d+)')
+
+# 페이지 스크립트의 post_id 값 추출용 정규식
+POST_ID_RE = re.compile(r'post_id\s*:\s*[\'"]?(\d+)[\'"]?')
+
+
+def extract_log_no(href):
+    """
+    링크 주소에서 logNo 파라미터 값을 추출합니다.
+    
+    Args:
+        href (str): 링크 주소
+        
+    Returns:
+        str or None: 숫자로 된 logNo, 없으면 None
+    """
+    match = LOGNO_PARAM_RE.search(href)
+    return match.group(1) if match else None
+
+
+# blog.naver.com 바로 아래에 있지만 블로그 ID가 아닌 경로
+_BLOG_SYSTEM_PATHS = frozenset(('PostView.naver', 'PostList.naver', 'SympathyUpdateCenter.naver',
+                                'CommentList.naver', 'api', 'BlogTagCloud.naver'))
+
+# 가장 흔한 https://blog.naver.com/{id} 형식은 urlparse 없이 처리
+_BLOG_PATH_PREFIXES = ('https://blog.naver.com/', 'https://m.blog.naver.com/',
+                       'http://blog.naver.com/', 'http://m.blog.naver.com/')
+
+
+# 같은 URL은 항상 같은 ID를 반환하므로 결과를 캐시 (실패 시 예외는 캐시되지 않음)
+@lru_cache(maxsize=1024)
 def extract_blog_id(url):
     """
     네이버 블로그 URL에서 blogId를 추출합니다.
@@ -30,6 +372,12 @@ def extract_blog_id(url):
     if not url.startswith(('http://', 'https://')):
         url = 'https://' + url
     
+    # 빠른 경로: 쿼리/프래그먼트가 없는 경로 형식이면 첫 번째 경로 세그먼트가 ID
+    if url.startswith(_BLOG_PATH_PREFIXES) and not any(ch in url for ch in '?#;'):
+        blog_id = url.split('/', 4)[3]
+        if blog_id and blog_id not in _BLOG_SYSTEM_PATHS:
+            return blog_id
+    
     # 네이버 블로그 도메인 확인
     parsed_url = urlparse(url)
     netloc = parsed_url.netloc.lower()
@@ -66,8 +414,7 @@ def extract_blog_id(url):
         if path:
             blog_id = path.split('/')[0]
             # 특수한 경로나 시스템 페이지가 아닌지 확인
-            if blog_id in ('PostView.naver', 'PostList.naver', 'SympathyUpdateCenter.naver',
-                          'CommentList.naver', 'api', 'BlogTagCloud.naver'):
+            if blog_id in _BLOG_SYSTEM_PATHS:
                 raise ValueError("네이버 블로그 URL에서 블로그 ID를 찾을 수 없습니다.")
             return blog_id
     
@@ -2,10 +2,58 @@ from replit import db
 import json
 import logging
 
+# orjson이 설치되어 있으면 포스트 직렬화에 사용 (없으면 표준 json 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
-def save_blog_post(post_id, title, content, date, is_private=False, extra_data=None):
+# 포스트 키 접두사
+POST_KEY_PREFIX = "post_"
+
+def _post_keys():
+    """
+    'post_' 접두사가 붙은 키 목록을 조회합니다.
+    Replit DB는 네트워크 저장소이므로 전체 키를 받아 걸러내지 않고 접두사 조회 한 번으로 가져옵니다.
+    
+    Returns:
+        tuple: 포스트 키 목록
+    """
+    return db.prefix(POST_KEY_PREFIX)
+
+def _dumps(data):
+    """
+    포스트 데이터를 DB에 저장할 JSON 문자열로 변환합니다.
+    Replit DB는 문자열 값을 저장하므로 orjson의 bytes 결과는 디코딩해서 반환합니다.
+    
+    Args:
+        data (dict): 포스트 데이터
+        
+    Returns:
+        str: JSON 문자열
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data)
+
+def _loads(raw):
+    """
+    DB에 저장된 JSON 문자열을 포스트 데이터로 변환합니다.
+    
+    Args:
+        raw (str): JSON 문자열
+        
+    Returns:
+        dict: 포스트 데이터
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def save_blog_post(post_id, title, content, date, is_private=False, extra_data=None, check_existing=True):
     """
     네이버 블로그 포스트를 Replit DB에 저장합니다.
     
@@ -16,16 +64,18 @@ def save_blog_post(post_id, title, content, date, is_private=False, extra_data=N
         date (str): 포스트 작성일
         is_private (bool, optional): 비공개 포스트 여부
         extra_data (dict, optional): 추가 메타데이터
+        check_existing (bool, optional): 이미 저장된 포스트인지 확인해 로그를 남길지 여부
+                                         (확인에 요청이 한 번 더 필요하므로 일괄 저장 시에는 생략)
         
     Returns:
         bool: 저장 성공 여부
     """
     try:
         # 키 이름 생성 - 'post_' 접두사 추가
-        key = f"post_{post_id}"
+        key = f"{POST_KEY_PREFIX}{post_id}"
         
         # 이미 저장된 포스트인지 확인
-        if key in db.keys():
+        if check_existing and key in db:
             logger.info(f"포스트 ID {post_id}는 이미 저장되어 있습니다. 업데이트합니다.")
         
         # 저장할 데이터 구성
@@ -42,7 +92,7 @@ def save_blog_post(post_id, title, content, date, is_private=False, extra_data=N
             post_data.update(extra_data)
         
         # DB에 저장
-        db[key] = json.dumps(post_data)
+        db[key] = _dumps(post_data)
         logger.debug(f"포스트 ID {post_id} 저장 완료")
         
         return True
@@ -62,13 +112,15 @@ def get_blog_post(post_id):
         dict or None: 저장된 포스트 데이터 또는 None (없는 경우)
     """
     try:
-        key = f"post_{post_id}"
+        key = f"{POST_KEY_PREFIX}{post_id}"
         
-        if key not in db.keys():
+        # 존재 확인과 조회를 한 번의 요청으로 처리
+        raw = db.get(key)
+        if raw is None:
             logger.warning(f"포스트 ID {post_id}가 DB에 존재하지 않습니다.")
             return None
             
-        post_data = json.loads(db[key])
+        post_data = _loads(raw)
         return post_data
         
     except Exception as e:
@@ -83,11 +135,8 @@ def list_all_posts():
         list: 저장된 포스트 ID 목록
     """
     try:
-        # 'post_' 접두사가 있는 키만 필터링
-        post_keys = [key for key in db.keys() if key.startswith("post_")]
-        
         # 접두사 제거하여 실제 포스트 ID만 반환
-        post_ids = [key.replace("post_", "") for key in post_keys]
+        post_ids = [key[len(POST_KEY_PREFIX):] for key in _post_keys()]
         
         return post_ids
         
@@ -106,13 +155,15 @@ def delete_blog_post(post_id):
         bool: 삭제 성공 여부
     """
     try:
-        key = f"post_{post_id}"
+        key = f"{POST_KEY_PREFIX}{post_id}"
         
-        if key not in db.keys():
+        # 존재 확인 없이 바로 삭제 - 없는 키면 KeyError
+        try:
+            del db[key]
+        except KeyError:
             logger.warning(f"포스트 ID {post_id}가 DB에 존재하지 않아 삭제할 수 없습니다.")
             return False
             
-        del db[key]
         logger.debug(f"포스트 ID {post_id} 삭제 완료")
         return True
         
@@ -153,7 +204,8 @@ def save_multiple_posts(posts):
         extra_data = {k: v for k, v in post.items() 
                      if k not in ['id', 'logNo', 'title', 'content', 'date', 'is_private']}
         
-        if save_blog_post(post_id, title, content, date, is_private, extra_data):
+        # 기존 포스트 확인은 로그용이므로 생략하고 포스트당 쓰기 요청 한 번만 보냄
+        if save_blog_post(post_id, title, content, date, is_private, extra_data, check_existing=False):
             success_count += 1
         else:
             fail_count += 1
@@ -169,8 +221,7 @@ def get_total_post_count():
         int: 저장된 포스트의 총 개수
     """
     try:
-        post_keys = [key for key in db.keys() if key.startswith("post_")]
-        return len(post_keys)
+        return len(_post_keys())
     except Exception as e:
         logger.error(f"포스트 개수 조회 중 오류 발생: {str(e)}")
         return 0
@@ -184,7 +235,8 @@ def clear_all_posts():
         int: 삭제된 포스트 개수
     """
     try:
-        post_keys = [key for key in db.keys() if key.startswith("post_")]
+        # Replit DB 클라이언트에는 일괄 삭제가 없으므로 키 목록만 한 번 조회해 두고 하나씩 삭제
+        post_keys = _post_keys()
         count = 0
         
         for key in post_keys:
@@ -0,0 +1,17 @@
+import os
+
+# gunicorn 설정 - 실행 디렉터리의 gunicorn.conf.py는 gunicorn이 자동으로 읽음
+# 블로그 수집(/blog/submit)과 분석 스트리밍(/analyze/<id>/stream)은 네트워크 대기 시간이 길어
+# 기본 sync 워커(요청 1개씩 처리)로는 다른 요청이 모두 뒤에서 기다리게 되므로 스레드 워커 사용
+
+# 작업 진행 상태는 DB(analysis_job 테이블)에 저장되므로 워커를 늘려도 되지만,
+# 프로세스마다 분석 워커 스레드(ANALYSIS_WORKERS)가 생기므로 기본값은 워커 1개
+workers = int(os.environ.get("GUNICORN_WORKERS", 1))
+worker_class = "gthread"
+
+# 요청 스레드 수 - DB 연결 풀(DB_POOL_SIZE + DB_MAX_OVERFLOW, 기본 30)을 넘지 않도록 설정
+threads = int(os.environ.get("GUNICORN_THREADS", 16))
+
+# 블로그 수집은 수십 초가 걸릴 수 있으므로 기본 30초보다 넉넉하게 설정
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
+keepalive = 5
@@ -14,10 +14,39 @@ class Blog(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     url = db.Column(db.String(255), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
+    # 블로그를 제출한 네이버 사용자 ID - 수집한 포스트(비공개 글 포함)와 보고서는 이 사용자의 것
+    naver_user_id = db.Column(db.String(64), nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     posts = db.relationship('BlogPost', backref='blog', lazy=True, cascade="all, delete-orphan")
     reports = db.relationship('Report', backref='blog', lazy=True, cascade="all, delete-orphan")
+    
+    # 같은 사용자가 같은 블로그 URL을 다시 제출하면 기존 블로그/보고서 재사용
+    # 다른 사용자의 보고서는 그 사용자의 비공개 글로 만들어졌으므로 사용자별로 따로 등록
+    __table_args__ = (
+        db.UniqueConstraint('url', 'naver_user_id', name='uq_blog_url_user'),
+    )
+
+def logno_sort_key(log_no):
+    """
+    포스트 최신순 정렬에 쓰는 logNo 정수 식을 만듭니다.
+    숫자로만 된 logNo만 정수로 변환하고 빈 문자열이나 예전 형식의 값은 0으로 처리하여
+    PostgreSQL에서 CAST 오류가 나지 않게 합니다. (정렬 인덱스와 ORDER BY가 같은 식을 사용)
+    
+    Args:
+        log_no: logNo 컬럼
+        
+    Returns:
+        ColumnElement: 정렬용 정수 식
+    """
+    # 상수는 바인드 파라미터가 아닌 SQL 리터럴로 넣어 ORDER BY 식이 인덱스 식과 그대로 일치하도록 함
+    empty = db.literal_column("''")
+    is_numeric = db.and_(
+        log_no != empty,
+        db.func.length(log_no) <= db.literal_column("18"),  # BIGINT 범위를 넘지 않는 길이
+        db.func.ltrim(log_no, db.literal_column("'0123456789'")) == empty,
+    )
+    return db.case((is_numeric, db.cast(log_no, db.BigInteger)), else_=db.literal_column("0"))
 
 class BlogPost(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -29,10 +58,20 @@ class BlogPost(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     # 네이버 블로그의 실제 logNo (포스트 ID)
     logNo = db.Column(db.String(50), nullable=True)
+    
+    # 블로그별 포스트 조회/정렬과 logNo 중복 검사를 인덱스로 처리
+    # (blog_id, logNo)는 유니크 - 저장 시 ON CONFLICT DO NOTHING의 충돌 기준으로 사용
+    __table_args__ = (
+        db.Index('ix_blogpost_blog_date', 'blog_id', 'date'),
+        db.Index('ix_blogpost_blog_logno', 'blog_id', 'logNo', unique=True),
+        # 분석/보고서 화면의 최신순 정렬(숫자 logNo 내림차순)을 정렬 단계 없이 인덱스 순서로 읽기 위한 인덱스
+        db.Index('ix_blogpost_blog_logno_sort', 'blog_id', logno_sort_key(logNo).desc()),
+    )
 
 class Report(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    blog_id = db.Column(db.Integer, db.ForeignKey('blog.id'), nullable=False)
+    # /status 폴링마다 blog_id로 보고서를 조회하므로 인덱스 추가
+    blog_id = db.Column(db.Integer, db.ForeignKey('blog.id'), nullable=False, index=True)
     characteristics = db.Column(db.Text, nullable=True)
     strengths = db.Column(db.Text, nullable=True)
     weaknesses = db.Column(db.Text, nullable=True)
@@ -40,4 +79,18 @@ class Report(db.Model):
     decision_making = db.Column(db.Text, nullable=True)
     unconscious_biases = db.Column(db.Text, nullable=True)
     advice = db.Column(db.Text, nullable=True)
-    created_at = db.Column(db.String(50), nullable=False)
+    # 생성 시각 (문자열 대신 DATETIME으로 저장하여 정렬/인덱스 활용)
+    # 예전 문자열 컬럼은 시작 시 migrate_report_created_at이 변경 (app.py)
+    created_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
+
+class AnalysisJob(db.Model):
+    # 백그라운드 작업(블로그 수집 -> 보고서 생성) 상태
+    # 여러 인스턴스가 같은 상태를 조회하고 중단된 작업을 다시 시작할 수 있도록 프로세스 메모리 대신 DB에 저장
+    blog_id = db.Column(db.Integer, db.ForeignKey('blog.id'), primary_key=True)
+    # 'scraping' | 'queued' | 'running' | 'error' (완료된 작업은 행을 삭제)
+    state = db.Column(db.String(20), nullable=False)
+    message = db.Column(db.Text, nullable=True)
+    # 작업을 맡은 프로세스가 발급한 토큰 - 다른 인스턴스가 중단된 작업을 넘겨받으면 바뀜
+    claim_token = db.Column(db.String(32), nullable=False)
+    # 작업을 맡은 프로세스가 하트비트로 갱신 - 오래 갱신되지 않으면 중단된 작업으로 판단
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
@@ -1,6 +1,11 @@
 import os
+import time
+import base64
+import hashlib
 import logging
-import requests
+import threading
+from cachelib import SimpleCache
+from blog_utils import naver_http
 from requests_oauthlib import OAuth2Session
 from urllib.parse import urlencode
 
@@ -17,6 +22,11 @@ NAVER_AUTH_URL = 'https://nid.naver.com/oauth2.0/authorize'
 NAVER_TOKEN_URL = 'https://nid.naver.com/oauth2.0/token'
 NAVER_PROFILE_URL = 'https://openapi.naver.com/v1/nid/me'
 
+# 사용자 정보 캐시 (액세스 토큰 해시 -> 사용자 정보, 5분 유지)
+USER_INFO_CACHE_TTL = 300
+_user_info_cache = SimpleCache(threshold=10000, default_timeout=USER_INFO_CACHE_TTL)
+_user_info_cache_lock = threading.Lock()
+
 
 def get_oauth_session():
     """
@@ -62,20 +72,38 @@ def get_token_from_code(code, state=None):
         raise
 
 
+def _user_info_cache_key(access_token):
+    """
+    액세스 토큰 원문 대신 해시값을 캐시 키로 사용합니다.
+    """
+    return hashlib.sha256(access_token.encode('utf-8')).hexdigest()
+
+
 def get_user_info(token):
     """
     액세스 토큰으로 사용자 정보 조회
+    같은 토큰으로 다시 조회하면 네이버 API를 호출하지 않고 캐시된 정보를 반환합니다.
     """
     try:
+        access_token = token["access_token"]
+        key = _user_info_cache_key(access_token)
+        with _user_info_cache_lock:
+            cached = _user_info_cache.get(key)
+        if cached is not None:
+            return cached
+
         headers = {
-            'Authorization': f'Bearer {token["access_token"]}',
+            'Authorization': f'Bearer {access_token}',
             'Content-Type': 'application/json'
         }
-        response = requests.get(NAVER_PROFILE_URL, headers=headers)
+        response = naver_http.get(NAVER_PROFILE_URL, headers=headers)
         if response.status_code == 200:
             data = response.json()
             if data.get('resultcode') == '00':
-                return data.get('response', {})
+                user_info = data.get('response', {})
+                with _user_info_cache_lock:
+                    _user_info_cache.set(key, user_info)
+                return user_info
         
         logger.error(f"Failed to get user info: {response.text}")
         return None
@@ -84,6 +112,19 @@ def get_user_info(token):
         return None
 
 
+def invalidate_user_info(access_token):
+    """
+    로그아웃이나 토큰 갱신 시 캐시된 사용자 정보를 삭제합니다.
+
+    Args:
+        access_token (str): 더 이상 사용하지 않는 액세스 토큰
+    """
+    if not access_token:
+        return
+    with _user_info_cache_lock:
+        _user_info_cache.delete(_user_info_cache_key(access_token))
+
+
 def refresh_token(refresh_token):
     """
     리프레시 토큰으로 새 액세스 토큰 발급
@@ -95,7 +136,7 @@ def refresh_token(refresh_token):
             'client_secret': NAVER_CLIENT_SECRET,
             'refresh_token': refresh_token
         }
-        response = requests.get(NAVER_TOKEN_URL, params=params)
+        response = naver_http.get(NAVER_TOKEN_URL, params=params)
         if response.status_code == 200:
             return response.json()
         else:
@@ -118,10 +159,6 @@ def generate_auth_cookies_from_token(access_token):
         dict: 인증 쿠키 딕셔너리
     """
     try:
-        import hashlib
-        import base64
-        import time
-        
         # 토큰 기반 변환 수행
         token_md5 = hashlib.md5(access_token.encode('utf-8')).hexdigest()
         token_b64 = base64.b64encode(access_token.encode('utf-8')).decode('utf-8')
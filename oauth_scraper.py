@@ -1,14 +1,13 @@
 import logging
 import json
-import time
 import os
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, parse_qs
-import requests
 from requests.cookies import cookiejar_from_dict
+from blog_utils import create_pooled_session, extract_log_no, fetch_details_concurrently, LOGNO_PARAM_RE, POST_ID_RE
+from scraper import extract_blog_id
 
 logger = logging.getLogger(__name__)
-
 class NaverOAuthScraper:
     """
     네이버 OAuth 인증을 활용한 블로그 스크래퍼
@@ -22,7 +21,7 @@ class NaverOAuthScraper:
         """
         액세스 토큰을 사용하여 인증된 세션 생성 - 비공개 글 접근 개선
         """
-        session = requests.Session()
+        session = create_pooled_session()
         session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
@@ -142,26 +141,13 @@ class NaverOAuthScraper:
         lognos = lognos[:30]
         logger.debug(f"포스트 ID {len(lognos)}개 발견 (최대 30개): {lognos}")
         
-        # 각 포스트 내용 가져오기
-        successful_count = 0
-        private_count = 0
-        
-        for logno in lognos:
-            try:
-                post = self._get_post_content(blog_id, logno)
-                if post:
-                    posts.append(post)
-                    successful_count += 1
-                    
-                    # 비공개 글 확인
-                    if post.get('is_private', False):
-                        private_count += 1
-                        logger.debug(f"비공개 글 발견: {logno}")
-                    
-                    # 네이버 서버에 부담을 주지 않기 위한 지연
-                    time.sleep(0.2)
-            except Exception as e:
-                logger.error(f"포스트 {logno} 스크래핑 중 오류: {str(e)}")
+        # 각 포스트 내용을 동시에 가져오기 (고정 지연 대신 동시 요청 수와 공유 속도 제한기로 조절)
+        posts.extend(fetch_details_concurrently(
+            lambda _session, _blog_id, logno: self._get_post_content(blog_id, logno),
+            self.session, blog_id, lognos
+        ))
+        successful_count = len(posts)
+        private_count = sum(1 for post in posts if post.get('is_private', False))
         
         # 스크래핑 결과 요약
         logger.debug(f"총 {successful_count}개 포스트 스크래핑 완료 (비공개글: {private_count}개)")
@@ -289,15 +275,11 @@ class NaverOAuthScraper:
                     if not href:
                         continue
                     
-                    # 직접 문자열 파싱으로 logNo 추출
-                    if 'logNo=' in href:
-                        try:
-                            logno = href.split('logNo=')[1].split('&')[0]
-                            if logno and logno.isdigit():
-                                lognos.add(logno)
-                                logger.debug(f"Found logNo: {logno}")
-                        except Exception as e:
-                            logger.error(f"Error parsing logNo: {str(e)}")
+                    # 링크 주소에서 logNo 추출
+                    logno = extract_log_no(href)
+                    if logno:
+                        lognos.add(logno)
+                        logger.debug(f"Found logNo: {logno}")
                 
                 # 2. 현대 네이버 블로그 형식 (/blogId/logNo)
                 for link in soup.select('a'):
@@ -317,19 +299,16 @@ class NaverOAuthScraper:
                             logger.error(f"Error parsing blog URL: {str(e)}")
                 
                 # 3. 세 번째 방법: 정규식으로 모든 텍스트에서 포스트 ID 찾기
-                import re
                 html_text = str(soup)
                 # logNo 패턴
-                logno_pattern = re.compile(r'logNo=(\d+)')
-                for match in logno_pattern.finditer(html_text):
+                for match in LOGNO_PARAM_RE.finditer(html_text):
                     logno = match.group(1)
                     if logno:
                         lognos.add(logno)
                         logger.debug(f"Found logNo via regex: {logno}")
                 
                 # 블로그 포스트 ID 패턴
-                postid_pattern = re.compile(r'post_id\s*:\s*[\'"]?(\d+)[\'"]?')
-                for match in postid_pattern.finditer(html_text):
+                for match in POST_ID_RE.finditer(html_text):
                     logno = match.group(1)
                     if logno:
                         lognos.add(logno)
@@ -343,15 +322,10 @@ class NaverOAuthScraper:
                     if mobile_response.status_code == 200:
                         mobile_soup = BeautifulSoup(mobile_response.text, 'html.parser')
                         for link in mobile_soup.select('a'):
-                            href = link.get('href', '')
-                            if 'logNo=' in href:
-                                try:
-                                    logno = href.split('logNo=')[1].split('&')[0]
-                                    if logno and logno.isdigit():
-                                        lognos.add(logno)
-                                        logger.debug(f"Found logNo from mobile: {logno}")
-                                except Exception as e:
-                                    logger.error(f"Error parsing mobile logNo: {str(e)}")
+                            logno = extract_log_no(link.get('href', ''))
+                            if logno:
+                                lognos.add(logno)
+                                logger.debug(f"Found logNo from mobile: {logno}")
                 except Exception as e:
                     logger.error(f"Error accessing mobile version: {str(e)}")
                 
@@ -699,7 +673,6 @@ def scrape_blog_with_oauth(blog_url, access_token):
     """
     try:
         # 블로그 ID 추출
-        from scraper import extract_blog_id
         blog_id = extract_blog_id(blog_url)
         
         if not blog_id:
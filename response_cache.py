@@ -0,0 +1,191 @@
+import os
+import json
+import math
+import hashlib
+import logging
+import threading
+from cachelib import FileSystemCache, SimpleCache
+
+logger = logging.getLogger(__name__)
+
+# 분석 결과 캐시 유지 시간 (초) - 기본 24시간
+CACHE_TTL = int(os.environ.get("ANALYSIS_CACHE_TTL", 86400))
+
+# 분석 결과 캐시 저장 위치 (기본값은 Flask 인스턴스 폴더 instance/ 아래)
+# gunicorn 워커 프로세스들이 같은 캐시를 공유하도록 파일 시스템 캐시를 사용합니다.
+CACHE_DIR = os.environ.get(
+    "ANALYSIS_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instance', 'analysis_cache')
+)
+
+# 의미 기반 캐시 설정
+# 임베딩 코사인 유사도가 임계값 이상이면 거의 같은 블로그로 보고 기존 분석 결과를 재사용합니다.
+SEMANTIC_CACHE_THRESHOLD = float(os.environ.get("SEMANTIC_CACHE_THRESHOLD", 0.93))
+SEMANTIC_CACHE_MAX_ENTRIES = 200
+# 항목 목록을 읽고-추가하고-다시 쓰는 동안 다른 분석 워커 스레드가 끼어들어 항목을 덮어쓰지 않도록 보호
+# (프로세스 사이에는 잠기지 않으므로 드물게 항목 하나가 빠질 수 있지만, 캐시 적중을 놓칠 뿐 결과는 틀리지 않음)
+_semantic_cache_lock = threading.Lock()
+
+
+def _create_cache():
+    """
+    분석 결과 캐시를 생성합니다. REDIS_URL이 설정되어 있고 redis 패키지가 설치되어 있으면
+    Redis를, 그렇지 않으면 파일 시스템 캐시를 사용합니다.
+
+    Returns:
+        BaseCache: cachelib 캐시 객체
+    """
+    redis_url = os.environ.get("REDIS_URL")
+    if redis_url:
+        try:
+            import redis
+            from cachelib import RedisCache
+            logger.debug("분석 결과 캐시: Redis 사용")
+            return RedisCache(host=redis.Redis.from_url(redis_url), default_timeout=CACHE_TTL)
+        except ImportError:
+            logger.warning("redis 패키지가 설치되어 있지 않아 파일 시스템 캐시를 사용합니다.")
+
+    logger.debug(f"분석 결과 캐시: 파일 시스템 사용 ({CACHE_DIR})")
+    return FileSystemCache(CACHE_DIR, default_timeout=CACHE_TTL)
+
+
+_cache = None
+_cache_init_lock = threading.Lock()
+
+
+def _get_cache():
+    """
+    분석 결과 캐시를 처음 사용할 때 만듭니다. 모듈을 import하기만 해도 캐시 디렉터리가 생기지 않도록 합니다.
+    
+    Returns:
+        BaseCache: cachelib 캐시 객체
+    """
+    global _cache
+    if _cache is None:
+        with _cache_init_lock:
+            if _cache is None:
+                _cache = _create_cache()
+    return _cache
+
+# 프로세스 내 메모리 캐시 - 자주 조회되는 결과는 파일/Redis 조회 없이 반환
+# 결과 딕셔너리 대신 JSON 문자열을 저장하므로, 호출한 쪽이 반환된 결과를 수정해도 캐시된 항목은 바뀌지 않음
+LOCAL_CACHE_MAX_ENTRIES = 256
+_local_cache = SimpleCache(threshold=LOCAL_CACHE_MAX_ENTRIES, default_timeout=CACHE_TTL)
+_local_cache_lock = threading.Lock()
+
+
+def make_cache_key(content, prompt_version, model):
+    """
+    블로그 내용, 프롬프트 버전, 모델 이름으로 캐시 키를 만듭니다.
+    프롬프트나 모델이 바뀌면 키도 바뀌므로 이전 결과가 재사용되지 않습니다.
+
+    Args:
+        content (str): 분석할 블로그 내용
+        prompt_version (str): 프롬프트 버전
+        model (str): 분석에 사용하는 모델 이름
+
+    Returns:
+        str: 캐시 키
+    """
+    digest = hashlib.sha256(f"{prompt_version}:{model}:{content}".encode('utf-8')).hexdigest()
+    return f"analyze:{prompt_version}:{digest}"
+
+
+def get_cached_result(key):
+    """
+    캐시에서 분석 결과를 조회합니다.
+
+    Args:
+        key (str): make_cache_key로 만든 캐시 키
+
+    Returns:
+        dict or None: 캐시된 분석 결과, 없거나 조회에 실패하면 None
+    """
+    with _local_cache_lock:
+        local = _local_cache.get(key)
+    if local is not None:
+        return json.loads(local)
+    
+    try:
+        cached = _get_cache().get(key)
+        if cached is None:
+            return None
+        with _local_cache_lock:
+            _local_cache.set(key, cached)
+        return json.loads(cached)
+    except Exception as e:
+        logger.error(f"분석 결과 캐시 조회 오류: {str(e)}")
+        return None
+
+
+def set_cached_result(key, result):
+    """
+    분석 결과를 캐시에 저장합니다. 저장에 실패해도 분석 흐름에는 영향을 주지 않습니다.
+
+    Args:
+        key (str): make_cache_key로 만든 캐시 키
+        result (dict): 저장할 분석 결과
+    """
+    try:
+        serialized = json.dumps(result, ensure_ascii=False)
+        with _local_cache_lock:
+            _local_cache.set(key, serialized)
+        _get_cache().set(key, serialized)
+    except Exception as e:
+        logger.error(f"분석 결과 캐시 저장 오류: {str(e)}")
+
+
+def _cosine_similarity(a, b):
+    """
+    두 벡터의 코사인 유사도를 계산합니다.
+    """
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+def find_similar_result(namespace, embedding):
+    """
+    저장된 임베딩 중 가장 유사한 항목을 찾아, 유사도가 임계값 이상이면 그 분석 결과를 반환합니다.
+
+    Args:
+        namespace (str): 의미 기반 캐시 이름 (프롬프트 버전, 모델, 사용자 범위 포함)
+        embedding (list): 조회할 블로그 내용의 임베딩
+
+    Returns:
+        dict or None: 유사한 블로그의 분석 결과, 없으면 None
+    """
+    try:
+        entries = _get_cache().get(namespace) or []
+        best_score = 0.0
+        best_result = None
+        for entry in entries:
+            score = _cosine_similarity(embedding, entry['embedding'])
+            if score > best_score:
+                best_score = score
+                best_result = entry['result']
+
+        if best_result is not None and best_score >= SEMANTIC_CACHE_THRESHOLD:
+            logger.debug(f"의미 기반 캐시 적중 (유사도: {best_score:.3f})")
+            return best_result
+        return None
+    except Exception as e:
+        logger.error(f"의미 기반 캐시 조회 오류: {str(e)}")
+        return None
+
+
+def add_semantic_result(namespace, embedding, result):
+    """
+    임베딩과 분석 결과를 의미 기반 캐시에 추가합니다. 최근 SEMANTIC_CACHE_MAX_ENTRIES개만 유지합니다.
+
+    Args:
+        namespace (str): 의미 기반 캐시 이름 (프롬프트 버전, 모델, 사용자 범위 포함)
+        embedding (list): 블로그 내용의 임베딩
+        result (dict): 저장할 분석 결과
+    """
+    try:
+        with _semantic_cache_lock:
+            entries = _get_cache().get(namespace) or []
+            entries.append({'embedding': embedding, 'result': result})
+            _get_cache().set(namespace, entries[-SEMANTIC_CACHE_MAX_ENTRIES:])
+    except Exception as e:
+        logger.error(f"의미 기반 캐시 저장 오류: {str(e)}")
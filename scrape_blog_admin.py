@@ -2,13 +2,21 @@ import logging
 import time
 import json
 import re
-import requests
+import hashlib
+import base64
 from bs4 import BeautifulSoup
-from blog_utils import extract_blog_id
+from blog_utils import extract_blog_id, extract_log_no, create_pooled_session, naver_http, fetch_details_concurrently
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 비공개 글 안내 문구
+PRIVATE_TEXT_RE = re.compile(r'비공개|권한이 없습니다')
+
+# 로그인 페이지의 CSRF 토큰, 스크립트 안의 postList 배열
+CSRF_TOKEN_RE = re.compile(r'name="csrf_token"\s+value="([^"]+)"')
+SCRIPT_POST_LIST_RE = re.compile(r'postList\s*:\s*(\[.*?\])', re.DOTALL)
+
 def scrape_blog_admin_mode(blog_url, access_token):
     """
     네이버 블로그 관리자 AJAX API를 사용하여 포스트 목록과 내용을 스크래핑합니다.
@@ -40,21 +48,9 @@ def scrape_blog_admin_mode(blog_url, access_token):
             logger.debug(f"포스트 수 제한: {len(posts)}개 -> 30개")
             posts = posts[:30]
         
-        # 각 포스트 내용 가져오기
-        detailed_posts = []
-        
-        for post in posts:
-            log_no = post.get('logNo')
-            if not log_no:
-                continue
-                
-            # 포스트 상세 내용 가져오기
-            post_detail = get_post_detail(session, blog_id, log_no)
-            
-            if post_detail:
-                detailed_posts.append(post_detail)
-                # 서버 부하 방지
-                time.sleep(0.5)
+        # 각 포스트 내용을 동시에 가져오기 (동시 요청 수는 DETAIL_FETCH_CONCURRENCY로 제한)
+        log_nos = [log_no for post in posts if (log_no := post.get('logNo'))]
+        detailed_posts = fetch_details_concurrently(get_post_detail, session, blog_id, log_nos)
         
         logger.debug(f"총 {len(detailed_posts)}개의 상세 포스트를 가져왔습니다.")
         return detailed_posts
@@ -75,7 +71,7 @@ def create_authenticated_session(access_token):
         requests.Session: 인증된 세션 객체
     """
     # 세션 생성
-    session = requests.Session()
+    session = create_pooled_session()
     
     # 기본 헤더 설정
     session.headers.update({
@@ -99,10 +95,6 @@ def create_authenticated_session(access_token):
         # 2. 네이버 인증 쿠키 설정 - 비공개 글 접근에 필수
         try:
             # 네이버 토큰으로부터 여러 다양한 쿠키 형식 시도
-            import hashlib
-            import base64
-            import time
-            
             # 보다 강력한 토큰 변환
             token_md5 = hashlib.md5(access_token.encode('utf-8')).hexdigest()
             token_b64 = base64.b64encode(access_token.encode('utf-8')).decode('utf-8')
@@ -149,7 +141,7 @@ def create_authenticated_session(access_token):
         api_headers = {'Authorization': f'Bearer {access_token}'}
         
         try:
-            profile_resp = requests.get(api_url, headers=api_headers, timeout=5)
+            profile_resp = naver_http.get(api_url, headers=api_headers, timeout=5)
             if profile_resp.status_code == 200:
                 profile_data = profile_resp.json()
                 if profile_data.get('resultcode') == '00':
@@ -180,8 +172,7 @@ def create_authenticated_session(access_token):
                 logger.debug("로그인 페이지 접속 성공")
                 
                 # csrf_token 추출 시도
-                import re
-                csrf_match = re.search(r'name="csrf_token"\s+value="([^"]+)"', login_resp.text)
+                csrf_match = CSRF_TOKEN_RE.search(login_resp.text)
                 if csrf_match:
                     csrf_token = csrf_match.group(1)
                     logger.debug(f"CSRF 토큰 추출: {csrf_token[:8]}...")
@@ -217,13 +208,14 @@ def create_authenticated_session(access_token):
     return session
 
 
-def get_posts_via_admin_api(session, blog_id):
+def get_posts_via_admin_api(session, blog_id, max_posts=None):
     """
     네이버 블로그 관리자 AJAX API를 사용하여 포스트 목록을 가져옵니다.
     
     Args:
         session (requests.Session): 인증된 세션
         blog_id (str): 블로그 ID
+        max_posts (int, optional): 필요한 최대 포스트 수. 이만큼 모이면 다음 페이지를 요청하지 않음
         
     Returns:
         list: 포스트 목록
@@ -236,7 +228,6 @@ def get_posts_via_admin_api(session, blog_id):
         # 결과 포스트 목록
         all_posts = []
         page = 1
-        max_retries = 2
         
         # 페이지별로 포스트 수집
         while True:
@@ -249,32 +240,26 @@ def get_posts_via_admin_api(session, blog_id):
                 'X-Requested-With': 'XMLHttpRequest'
             }
             
-            retry_count = 0
-            response = None
-            
-            # 재시도 로직 구현
-            while retry_count <= max_retries:
-                try:
-                    response = session.get(
-                        ajax_url,
-                        headers=headers,
-                        params={
-                            'blogId': blog_id,
-                            'menu': 'post',
-                            'range': 'all',  # 전체 기간
-                            'page': page,    # 현재 페이지 번호
-                            'countPerPage': 20,  # 페이지당 20개
-                        },
-                        timeout=5
-                    )
-                    break
-                except Exception as retry_error:
-                    retry_count += 1
-                    logger.warning(f"AJAX 요청 재시도 {retry_count}/{max_retries}: {str(retry_error)}")
-                    time.sleep(1)  # 1초 대기 후 재시도
+            # 연결 오류와 429/5xx는 세션 어댑터(urllib3 Retry)가 지수 백오프 + jitter로 재시도하므로 한 번만 호출
+            try:
+                response = session.get(
+                    ajax_url,
+                    headers=headers,
+                    params={
+                        'blogId': blog_id,
+                        'menu': 'post',
+                        'range': 'all',  # 전체 기간
+                        'page': page,    # 현재 페이지 번호
+                        'countPerPage': 20,  # 페이지당 20개
+                    },
+                    timeout=5
+                )
+            except Exception as request_error:
+                logger.error(f"관리자 API 요청 오류 (페이지 {page}): {str(request_error)}")
+                break
             
-            if not response or response.status_code != 200:
-                logger.error(f"관리자 API 응답 오류 (페이지 {page}): {response.status_code if response else 'No response'}")
+            if response.status_code != 200:
+                logger.error(f"관리자 API 응답 오류 (페이지 {page}): {response.status_code}")
                 break
             
             # JSON 응답 파싱 시도
@@ -303,6 +288,11 @@ def get_posts_via_admin_api(session, blog_id):
                     logger.debug(f"페이지 {page}에서 20개 미만의 포스트 발견, 수집 종료")
                     break
                 
+                # 필요한 만큼 모였으면 나머지 페이지는 요청하지 않음 (최신 글부터 반환됨)
+                if max_posts and len(all_posts) >= max_posts:
+                    logger.debug(f"필요한 포스트 {max_posts}개를 모두 수집하여 종료")
+                    break
+                
                 # 다음 페이지로
                 page += 1
                 
@@ -318,7 +308,7 @@ def get_posts_via_admin_api(session, blog_id):
                     script_text = script.string if script.string else ""
                     if 'postList' in script_text:
                         # JSON 데이터 추출
-                        match = re.search(r'postList\s*:\s*(\[.*?\])', script_text, re.DOTALL)
+                        match = SCRIPT_POST_LIST_RE.search(script_text)
                         if match:
                             try:
                                 post_list_json = match.group(1)
@@ -348,9 +338,7 @@ def get_posts_via_admin_api(session, blog_id):
                             # logNo 추출
                             log_no_elem = row.select_one('a[href*="logNo="]')
                             if log_no_elem:
-                                href = log_no_elem.get('href', '')
-                                if 'logNo=' in href:
-                                    log_no = href.split('logNo=')[1].split('&')[0]
+                                log_no = extract_log_no(log_no_elem.get('href', '')) or ''
                             
                             # 제목 추출
                             title_elem = row.select_one('.title, .post_title, .area_text')
@@ -388,10 +376,15 @@ def get_posts_via_admin_api(session, blog_id):
                     logger.debug(f"페이지 {page}에서 20개 미만의 포스트 발견, 수집 종료")
                     break
                 
+                # 필요한 만큼 모였으면 나머지 페이지는 요청하지 않음 (최신 글부터 반환됨)
+                if max_posts and len(all_posts) >= max_posts:
+                    logger.debug(f"필요한 포스트 {max_posts}개를 모두 수집하여 종료")
+                    break
+                
                 # 다음 페이지로
                 page += 1
         
-        return all_posts
+        return all_posts[:max_posts] if max_posts else all_posts
         
     except Exception as e:
         logger.error(f"관리자 API 호출 오류: {str(e)}")
@@ -486,7 +479,8 @@ def get_post_detail(session, blog_id, log_no):
         
         # 4. 비공개 여부 확인
         is_private = False
-        if "비공개" in soup.get_text() or "권한이 없습니다" in soup.get_text():
+        # 페이지 전체 텍스트는 한 번만 추출해서 검사
+        if PRIVATE_TEXT_RE.search(soup.get_text()):
             is_private = True
         
         if title or content:
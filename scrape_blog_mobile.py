@@ -1,15 +1,41 @@
+import os
 import logging
 import time
+import asyncio
 import json
 import re
+import hashlib
+import base64
+import urllib.parse
+import importlib.util
 import requests
+import httpx
 from requests.exceptions import RequestException, Timeout, ConnectionError, ReadTimeout
 from bs4 import BeautifulSoup
-from blog_utils import extract_blog_id
+from blog_utils import (extract_blog_id, extract_log_no, create_pooled_session, naver_http,
+                        DETAIL_FETCH_CONCURRENCY, naver_rate_limiter, RETRYABLE_STATUSES, retry_delay,
+                        http_cache_key, load_validated, load_fresh, save_validated)
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 한 번 가져온 포스트를 다시 요청하지 않고 재사용하는 시간 (초) - 발행된 글은 거의 수정되지 않음
+POST_DETAIL_CACHE_TTL = int(os.environ.get("POST_DETAIL_CACHE_TTL", 7 * 86400))
+
+# h2 패키지가 설치되어 있으면 포스트 상세 요청을 HTTP/2로 하나의 연결에 다중화
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# 비공개 글 안내 문구 (페이지 텍스트에서 한 번에 검색)
+PRIVATE_KEYWORDS_RE = re.compile(
+    r'비공개|권한이 없습니다|비밀글|서비스 권한|접근 제한|'
+    r'친구만 공개|접근 권한|비밀번호가 필요한|비밀번호를 입력하세요'
+)
+
+# 포스트 목록 페이지 스크립트의 JavaScript 객체와 이를 JSON으로 바꾸기 위한 정규식
+SCRIPT_POST_JSON_RE = re.compile(r'(?:blogPostListForm|blogInfo|postList)\s*=\s*(\{.*?\});', re.DOTALL)
+JS_OBJECT_KEY_RE = re.compile(r'(\w+):')
+TRAILING_COMMA_RE = re.compile(r',\s*\}')
+
 def scrape_blog_mobile_mode(blog_url, access_token):
     """
     네이버 모바일 블로그 API를 사용하여 포스트 목록과 내용을 스크래핑합니다.
@@ -41,21 +67,9 @@ def scrape_blog_mobile_mode(blog_url, access_token):
             logger.debug(f"포스트 수 제한: {len(posts)}개 -> 30개")
             posts = posts[:30]
         
-        # 각 포스트 내용 가져오기
-        detailed_posts = []
-        
-        for post in posts:
-            log_no = post.get('logNo')
-            if not log_no:
-                continue
-                
-            # 포스트 상세 내용 가져오기
-            post_detail = get_post_detail(session, blog_id, log_no)
-            
-            if post_detail:
-                detailed_posts.append(post_detail)
-                # 서버 부하 방지
-                time.sleep(0.5)
+        # 각 포스트 내용을 동시에 가져오기 (동시 요청 수는 세마포어로 제한)
+        log_nos = [log_no for post in posts if (log_no := post.get('logNo'))]
+        detailed_posts = [post for post in asyncio.run(fetch_post_details(session, blog_id, log_nos)) if post]
         
         logger.debug(f"총 {len(detailed_posts)}개의 상세 포스트를 가져왔습니다.")
         return detailed_posts
@@ -76,7 +90,7 @@ def create_authenticated_session(access_token):
         requests.Session: 인증된 세션 객체
     """
     # 세션 생성
-    session = requests.Session()
+    session = create_pooled_session()
     
     # 기본 헤더 설정 - 모바일 기기 User-Agent
     session.headers.update({
@@ -100,10 +114,6 @@ def create_authenticated_session(access_token):
         # 2. 네이버 인증 쿠키 설정 - 비공개 글 접근에 필수
         try:
             # 관리자 API와 동일한 강화된 인증 시스템 적용
-            import hashlib
-            import base64
-            import time
-            
             # 보다 강력한 토큰 변환
             token_md5 = hashlib.md5(access_token.encode('utf-8')).hexdigest()
             token_b64 = base64.b64encode(access_token.encode('utf-8')).decode('utf-8')
@@ -153,7 +163,7 @@ def create_authenticated_session(access_token):
         api_headers = {'Authorization': f'Bearer {access_token}'}
         
         try:
-            profile_resp = requests.get(api_url, headers=api_headers, timeout=5)
+            profile_resp = naver_http.get(api_url, headers=api_headers, timeout=5)
             if profile_resp.status_code == 200:
                 profile_data = profile_resp.json()
                 if profile_data.get('resultcode') == '00':
@@ -233,29 +243,20 @@ def fetch_mobile_lognos(session, blog_id):
         # 모바일 PostList URL
         url = f"https://m.blog.naver.com/PostList.naver?blogId={blog_id}"
         
-        # 재시도 로직
-        max_retries = 2
-        retry_count = 0
-        response = None
-        
-        while retry_count <= max_retries:
-            try:
-                logger.debug(f"모바일 PostList 요청 시도 {retry_count+1}/{max_retries+1}")
-                response = session.get(url, timeout=5)
-                if response.status_code == 200:
-                    break
-            except Exception as retry_error:
-                logger.warning(f"모바일 API 요청 재시도 {retry_count+1}/{max_retries+1}: {str(retry_error)}")
-            
-            retry_count += 1
-            time.sleep(1)  # backoff
+        # 연결 오류와 429/5xx는 세션 어댑터(urllib3 Retry)가 지수 백오프 + jitter로 재시도하므로 한 번만 호출
+        try:
+            response = session.get(url, timeout=5)
+        except Exception as request_error:
+            logger.error(f"모바일 API 요청 오류: {str(request_error)}")
+            return None
         
-        if not response or response.status_code != 200:
-            logger.error(f"모바일 API 응답 오류: {response.status_code if response else 'No response'}")
+        if response.status_code != 200:
+            logger.error(f"모바일 API 응답 오류: {response.status_code}")
             return None
         
         # logNo 목록 추출
         log_nos = []
+        seen_log_nos = set()  # 중복 검사용 (리스트는 순서 유지용)
         
         # 1. JSON 데이터 찾기 (페이지에 내장된 JSON)
         soup = BeautifulSoup(response.text, 'html.parser')
@@ -264,14 +265,13 @@ def fetch_mobile_lognos(session, blog_id):
             script_text = script.string if script.string else ""
             
             # postList 객체 찾기
-            json_pattern = re.compile(r'(?:blogPostListForm|blogInfo|postList)\s*=\s*(\{.*?\});', re.DOTALL)
-            json_matches = json_pattern.findall(script_text)
+            json_matches = SCRIPT_POST_JSON_RE.findall(script_text)
             
             for json_str in json_matches:
                 try:
                     # JavaScript 객체를 JSON으로 변환
-                    json_str = re.sub(r'(\w+):', r'"\1":', json_str)  # 키에 따옴표 추가
-                    json_str = re.sub(r',\s*\}', '}', json_str)  # 후행 콤마 제거
+                    json_str = JS_OBJECT_KEY_RE.sub(r'"\1":', json_str)  # 키에 따옴표 추가
+                    json_str = TRAILING_COMMA_RE.sub('}', json_str)  # 후행 콤마 제거
                     data = json.loads(json_str)
                     
                     # 다양한 JSON 구조 처리
@@ -279,7 +279,8 @@ def fetch_mobile_lognos(session, blog_id):
                     
                     for post_info in post_list:
                         log_no = str(post_info.get('logNo', ''))
-                        if log_no and log_no.isdigit() and log_no not in log_nos:
+                        if log_no and log_no.isdigit() and log_no not in seen_log_nos:
+                            seen_log_nos.add(log_no)
                             log_nos.append(log_no)
                 except Exception as json_error:
                     logger.debug(f"JSON 파싱 오류: {str(json_error)}")
@@ -290,20 +291,19 @@ def fetch_mobile_lognos(session, blog_id):
             # href에서 logNo 파라미터 찾기
             for link in soup.find_all('a'):
                 href = link.get('href', '')
-                if 'logNo=' in href:
-                    try:
-                        log_no = href.split('logNo=')[1].split('&')[0]
-                        if log_no.isdigit() and log_no not in log_nos:
-                            log_nos.append(log_no)
-                    except:
-                        continue
+                log_no = extract_log_no(href)
+                if log_no:
+                    if log_no not in seen_log_nos:
+                        seen_log_nos.add(log_no)
+                        log_nos.append(log_no)
                 
                 # /blogId/logNo 형식 체크
                 elif f'/{blog_id}/' in href:
                     try:
                         parts = href.split(f'/{blog_id}/')[1].split('?')[0].split('/')
                         for part in parts:
-                            if part.isdigit() and part not in log_nos:
+                            if part.isdigit() and part not in seen_log_nos:
+                                seen_log_nos.add(part)
                                 log_nos.append(part)
                                 break
                     except:
@@ -348,16 +348,8 @@ def get_posts_via_mobile_api(session, blog_id):
             logger.debug(f"포스트 수 제한: {len(log_nos)}개 -> 30개")
             log_nos = log_nos[:30]
         
-        for log_no in log_nos:
-            try:
-                post_detail = get_post_detail(session, blog_id, log_no)
-                if post_detail:
-                    posts.append(post_detail)
-                    # 서버 부하 방지
-                    time.sleep(0.5)
-            except Exception as post_error:
-                logger.error(f"포스트 {log_no} 처리 중 오류: {str(post_error)}")
-                continue
+        # 포스트 상세 페이지를 동시에 요청 (동시 요청 수는 세마포어로 제한)
+        posts = [post for post in asyncio.run(fetch_post_details(session, blog_id, log_nos)) if post]
         
         logger.debug(f"총 {len(posts)}개의 상세 포스트를 가져왔습니다")
         return posts
@@ -367,6 +359,184 @@ def get_posts_via_mobile_api(session, blog_id):
         return []
 
 
+# 포스트 상세 페이지 요청 헤더
+POST_DETAIL_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Charset': 'utf-8',
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'same-origin',
+    'Sec-Fetch-User': '?1',
+    'Upgrade-Insecure-Requests': '1',
+    'Connection': 'keep-alive'
+}
+
+
+def decode_html(raw_content):
+    """
+    응답 바이트를 여러 인코딩으로 순서대로 디코딩해 봅니다.
+    
+    Args:
+        raw_content (bytes): 응답 본문
+        
+    Returns:
+        str: 디코딩된 HTML
+    """
+    encodings_to_try = ['utf-8', 'euc-kr', 'cp949', 'iso-8859-1', 'latin-1']
+    
+    for encoding in encodings_to_try:
+        try:
+            content = raw_content.decode(encoding)
+            logger.debug(f"인코딩 '{encoding}'으로 성공적으로 디코딩")
+            return content
+        except UnicodeDecodeError:
+            continue
+    
+    # 모든 인코딩이 실패한 경우 errors='replace'로 강제 변환
+    logger.warning("모든 인코딩 방식 실패, 'replace' 옵션으로 디코딩")
+    return raw_content.decode('utf-8', errors='replace')
+
+
+async def fetch_post_detail_async(session, blog_id, log_no, refresh=False):
+    """
+    get_post_detail의 비동기 버전입니다. 여러 포스트를 동시에 가져올 때 사용합니다.
+    네트워크 오류(httpx.TransportError)와 재시도 대상 상태 코드(httpx.HTTPStatusError)는
+    호출한 쪽에서 재시도할 수 있도록 그대로 전달합니다.
+    
+    Args:
+        session (httpx.AsyncClient): 인증 헤더와 쿠키가 설정된 클라이언트
+        blog_id (str): 블로그 ID
+        log_no (str): 포스트 번호
+        refresh (bool): True이면 POST_DETAIL_CACHE_TTL 안에 가져온 포스트도 다시 요청
+        
+    Returns:
+        dict: 포스트 상세 정보, 조회에 실패하면 None
+    """
+    # 모바일 포스트 조회 URL (캐시 방지 쿼리 추가)
+    url = f"https://m.blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}&t={int(time.time())}"
+    
+    # 비공개 글은 인증 정보에 따라 내용이 다르므로 Authorization 헤더별로 따로 캐시
+    cache_key = http_cache_key(f"m.blog.naver.com/{blog_id}/{log_no}", session.headers.get('Authorization', ''))
+    if not refresh:
+        fresh_post = load_fresh(cache_key, POST_DETAIL_CACHE_TTL)
+        if fresh_post is not None:
+            logger.debug(f"포스트 {log_no} 캐시 사용 (요청 생략)")
+            return dict(fresh_post)
+    validator_headers, cached_post = load_validated(cache_key)
+    
+    response = await session.get(url, headers={**POST_DETAIL_HEADERS, **validator_headers}, follow_redirects=True)
+    # 요청 과다(429)나 일시적 서버 오류는 PC 버전으로 넘어가지 않고 재시도하도록 예외로 전달
+    if response.status_code in RETRYABLE_STATUSES:
+        response.raise_for_status()
+    status = response.status_code
+    response_headers = response.headers
+    raw_content = response.content
+    
+    # 변경되지 않은 포스트는 다시 파싱하지 않고 이전 결과 사용
+    if status == 304 and cached_post is not None:
+        logger.debug(f"포스트 {log_no} 변경 없음, 저장된 내용 사용")
+        return dict(cached_post)
+    
+    # PC 웹 버전으로 시도 (모바일 버전이 실패하는 경우)
+    if status != 200:
+        logger.warning(f"모바일 버전 접근 실패({status}), PC 웹 버전 시도")
+        pc_url = f"https://blog.naver.com/{blog_id}/{log_no}"
+        response = await session.get(pc_url, headers=POST_DETAIL_HEADERS, follow_redirects=True)
+        if response.status_code in RETRYABLE_STATUSES:
+            response.raise_for_status()
+        status = response.status_code
+        # PC 버전 응답의 검증자는 모바일 URL 조건부 요청에 쓸 수 없으므로 저장하지 않음
+        response_headers = {}
+        raw_content = response.content
+    
+    if status != 200:
+        logger.error(f"모바일 포스트 상세 조회 오류: {status}")
+        return None
+    
+    # HTML 파싱은 CPU 작업이므로 별도 스레드에서 실행하여 다른 포스트의 다운로드와 겹치도록 함
+    post = await asyncio.to_thread(parse_post_detail, decode_html(raw_content), blog_id, log_no)
+    if post:
+        # 비공개/접근 제한으로 판단된 결과는 권한이 바뀔 수 있으므로 요청 없이 재사용하지 않음
+        save_validated(cache_key, response_headers, post, keep_without_validators=not post.get('is_private'))
+    return post
+
+
+async def _fetch_post_with_retry(session, semaphore, blog_id, log_no, max_retries=3, refresh=False):
+    """
+    포스트 하나의 상세 내용을 가져옵니다. 네트워크 오류와 429/5xx 응답은 max_retries번까지 재시도하며,
+    재시도 간격은 Retry-After 헤더 또는 jitter를 더한 지수 백오프를 따릅니다.
+    
+    Args:
+        session (httpx.AsyncClient): 인증된 클라이언트
+        semaphore (asyncio.Semaphore): 동시 요청 수 제한
+        blog_id (str): 블로그 ID
+        log_no (str): 포스트 번호
+        max_retries (int): 최대 재시도 횟수
+        refresh (bool): True이면 캐시된 포스트도 다시 요청
+        
+    Returns:
+        dict: 포스트 상세 정보, 실패하면 None
+    """
+    async with semaphore:
+        for retry_count in range(max_retries + 1):
+            try:
+                await naver_rate_limiter.wait_async()
+                logger.debug(f"포스트 {log_no} 상세 내용 가져오기 시도 {retry_count+1}/{max_retries+1}")
+                post = await fetch_post_detail_async(session, blog_id, log_no, refresh)
+                naver_rate_limiter.on_success()
+                return post
+            except httpx.HTTPStatusError as status_err:
+                logger.warning(f"포스트 {log_no} 응답 오류 {status_err.response.status_code} (재시도 {retry_count+1}/{max_retries+1})")
+                # 서버가 부하를 알리면 모든 요청의 간격을 늘림
+                naver_rate_limiter.on_rate_limited()
+                if retry_count < max_retries:
+                    await asyncio.sleep(retry_delay(retry_count, status_err.response.headers.get('Retry-After')))
+            except httpx.TransportError as req_err:
+                logger.warning(f"포스트 {log_no} 네트워크 오류 (재시도 {retry_count+1}/{max_retries+1}): {str(req_err)}")
+                if retry_count < max_retries:
+                    await asyncio.sleep(retry_delay(retry_count))
+            except Exception as other_err:
+                logger.error(f"포스트 {log_no} 처리 중 오류: {str(other_err)}")
+                return None  # 네트워크 오류가 아닌 경우 재시도하지 않음
+    return None
+
+
+async def fetch_post_details(session, blog_id, log_nos, refresh=False):
+    """
+    여러 포스트의 상세 내용을 동시에 가져옵니다.
+    
+    Args:
+        session (requests.Session): 인증 헤더와 쿠키가 설정된 세션 (비동기 클라이언트에 그대로 복사)
+        blog_id (str): 블로그 ID
+        log_nos (list): 포스트 번호 목록
+        refresh (bool): True이면 POST_DETAIL_CACHE_TTL 안에 가져온 포스트도 다시 요청
+        
+    Returns:
+        list: log_nos와 같은 순서의 포스트 상세 정보 목록 (실패한 포스트는 None)
+    """
+    semaphore = asyncio.Semaphore(DETAIL_FETCH_CONCURRENCY)
+    
+    # 압축은 httpx가 처리하므로 requests 세션의 Accept-Encoding 설정은 제외
+    headers = {key: value for key, value in session.headers.items() if key.lower() != 'accept-encoding'}
+    
+    # 모든 포스트 요청이 하나의 연결 풀을 공유하여 keep-alive 연결을 재사용 (요청마다 TLS 핸드셰이크 방지)
+    # HTTP/2를 사용할 수 있으면 동시 요청이 같은 연결에 다중화됨
+    async with httpx.AsyncClient(
+        http2=HTTP2_ENABLED,
+        headers=headers,
+        cookies=session.cookies.get_dict(),
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=DETAIL_FETCH_CONCURRENCY, keepalive_expiry=30),
+        timeout=httpx.Timeout(15)
+    ) as async_session:
+        return await asyncio.gather(
+            *[_fetch_post_with_retry(async_session, semaphore, blog_id, log_no, refresh=refresh) for log_no in log_nos]
+        )
+
+
 def get_post_detail(session, blog_id, log_no):
     """
     특정 포스트의 상세 내용을 모바일 페이지에서 가져옵니다.
@@ -402,23 +572,8 @@ def get_post_detail(session, blog_id, log_no):
         # 더 짧은 타임아웃 및 예외 처리 강화
         try:
             # 인코딩 문제 방지를 위해 여러 개선 옵션 적용
-            import urllib.parse
-            
             # 기존 헤더 대신 완전히 새로운 헤더 세트를 사용
-            custom_headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept-Charset': 'utf-8',
-                'Cache-Control': 'no-cache',
-                'Pragma': 'no-cache',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'same-origin',
-                'Sec-Fetch-User': '?1',
-                'Upgrade-Insecure-Requests': '1',
-                'Connection': 'keep-alive'
-            }
+            custom_headers = dict(POST_DETAIL_HEADERS)
             
             # URL을 안전하게 인코딩 (한글 포함 문자 처리)
             # 네이버 모바일은 인코딩이 되지 않은 URL을 선호하는 경우도 있음
@@ -473,22 +628,7 @@ def get_post_detail(session, blog_id, log_no):
                         all_content += chunk
                 
                 # 2. 다양한 인코딩 방식 순차적으로 시도
-                encodings_to_try = ['utf-8', 'euc-kr', 'cp949', 'iso-8859-1', 'latin-1']
-                decoded = False
-                
-                for encoding in encodings_to_try:
-                    try:
-                        content = all_content.decode(encoding)
-                        logger.debug(f"인코딩 '{encoding}'으로 성공적으로 디코딩")
-                        decoded = True
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                
-                # 3. 모든 인코딩이 실패한 경우 errors='replace'로 강제 변환
-                if not decoded:
-                    logger.warning("모든 인코딩 방식 실패, 'replace' 옵션으로 디코딩")
-                    content = all_content.decode('utf-8', errors='replace')
+                content = decode_html(all_content)
                 
                 # 4. 가짜 응답 객체 생성
                 class FakeResponse:
@@ -547,7 +687,29 @@ def get_post_detail(session, blog_id, log_no):
                 'url': url
             }
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        return parse_post_detail(response.text, blog_id, log_no)
+        
+    except Exception as e:
+        logger.error(f"모바일 포스트 상세 내용 가져오기 실패: {str(e)}")
+        return None
+
+
+def parse_post_detail(html, blog_id, log_no):
+    """
+    포스트 페이지 HTML에서 제목, 내용, 날짜, 비공개 여부를 추출합니다.
+    네트워크 요청 없이 HTML만 다루므로 동기/비동기 수집 모두에서 사용합니다.
+    
+    Args:
+        html (str): 포스트 페이지 HTML
+        blog_id (str): 블로그 ID
+        log_no (str): 포스트 번호
+        
+    Returns:
+        dict: 포스트 상세 정보, 제목과 내용이 모두 없으면 None
+    """
+    try:
+        # lxml 파서가 html.parser보다 훨씬 빠름
+        soup = BeautifulSoup(html, 'lxml')
         
         # 1. 제목 추출
         title = ""
@@ -626,9 +788,11 @@ def get_post_detail(session, blog_id, log_no):
             if meta_date:
                 date = meta_date.get('content', '')
         
+        # 페이지 전체 텍스트는 날짜 검색과 비공개 확인에 함께 쓰도록 한 번만 추출
+        page_text = soup.get_text()
+        
         # 3. 마지막으로 전체 페이지 텍스트에서 날짜 패턴 검색
         if not date:
-            page_text = soup.get_text()
             for pattern in date_patterns:
                 match = re.search(pattern, page_text)
                 if match:
@@ -641,17 +805,10 @@ def get_post_detail(session, blog_id, log_no):
         is_private = False
         
         # 1. 페이지 텍스트에서 비공개 키워드 확인
-        page_text = soup.get_text()
-        private_keywords = [
-            "비공개", "권한이 없습니다", "비밀글", "서비스 권한", "접근 제한", 
-            "친구만 공개", "접근 권한", "비밀번호가 필요한", "비밀번호를 입력하세요"
-        ]
-        
-        for keyword in private_keywords:
-            if keyword in page_text:
-                is_private = True
-                logger.debug(f"비공개 글 감지: 키워드 '{keyword}' 발견")
-                break
+        private_match = PRIVATE_KEYWORDS_RE.search(page_text)
+        if private_match:
+            is_private = True
+            logger.debug(f"비공개 글 감지: 키워드 '{private_match.group()}' 발견")
                 
         # 2. 특정 HTML 요소로 비공개 확인
         if not is_private:
@@ -684,7 +841,7 @@ def get_post_detail(session, blog_id, log_no):
         return None
         
     except Exception as e:
-        logger.error(f"모바일 포스트 상세 내용 가져오기 실패: {str(e)}")
+        logger.error(f"포스트 HTML 파싱 실패: {str(e)}")
         return None
 
 
@@ -1,14 +1,18 @@
+import io
 import logging
-import time
 import json
 import re
-import requests
 from bs4 import BeautifulSoup
-from blog_utils import extract_blog_id
+from lxml import etree
+from blog_utils import (extract_blog_id, extract_log_no, create_pooled_session, fetch_details_concurrently,
+                        http_cache_key, load_validated, save_validated)
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 본문 텍스트의 연속 공백 정리용 정규식
+_WHITESPACE_RE = re.compile(r'\s+')
+
 def fetch_rss_lognos(blog_id):
     """
     RSS 피드에서 포스트 ID(logNo) 목록만 가져옵니다.
@@ -24,67 +28,60 @@ def fetch_rss_lognos(blog_id):
         rss_url = f"https://rss.blog.naver.com/{blog_id}.xml"
         logger.debug(f"RSS URL: {rss_url}")
         
-        # 재시도 로직
-        max_retries = 2
-        retry_count = 0
-        response = None
-        
         # 일반 세션으로 충분함
-        session = requests.Session()
+        session = create_pooled_session()
         
-        while retry_count <= max_retries:
-            try:
-                logger.debug(f"RSS 요청 시도 {retry_count+1}/{max_retries+1}")
-                response = session.get(rss_url, timeout=5)
-                if response.status_code == 200:
-                    break
-            except Exception as retry_error:
-                logger.warning(f"RSS 요청 재시도 {retry_count+1}/{max_retries+1}: {str(retry_error)}")
-            
-            retry_count += 1
-            time.sleep(1)  # backoff
-        
-        if not response or response.status_code != 200:
-            logger.error(f"RSS 응답 오류: {response.status_code if response else 'No response'}")
+        # 이전에 받은 피드의 ETag/Last-Modified로 조건부 요청 (변경이 없으면 304로 본문 없이 응답)
+        cache_key = http_cache_key(rss_url)
+        validator_headers, cached_log_nos = load_validated(cache_key)
+        
+        # 연결 오류와 429/5xx는 세션 어댑터(urllib3 Retry)가 지수 백오프 + jitter로 재시도하므로 한 번만 호출
+        try:
+            response = session.get(rss_url, timeout=5, headers=validator_headers)
+        except Exception as request_error:
+            logger.error(f"RSS 요청 오류: {str(request_error)}")
+            return []
+        
+        if response.status_code == 304 and cached_log_nos is not None:
+            logger.debug(f"RSS 피드 변경 없음, 저장된 logNo {len(cached_log_nos)}개 사용")
+            return cached_log_nos
+        
+        if response.status_code != 200:
+            logger.error(f"RSS 응답 오류: {response.status_code}")
             return []
         
         # logNo 목록 추출
         log_nos = []
+        seen_log_nos = set()  # 중복 검사용 (리스트는 순서 유지용)
         
-        # XML 파싱 시도
+        # XML 스트리밍 파싱 - 문서 전체 트리를 만들지 않고 <item>이 끝날 때마다 처리한 뒤 버림
         try:
-            soup = BeautifulSoup(response.content, 'xml')
-            
-            # RSS 구조 확인
-            if soup and soup.find('rss'):
-                # <item> 태그 찾기
-                items = soup.find_all('item')
+            for _, item in etree.iterparse(io.BytesIO(response.content), events=('end',), tag='item', recover=True):
+                # <guid> 태그에서 logNo 추출
+                log_no = None
+                guid_url = (item.findtext('guid') or '').strip()
+                # 형식: https://blog.naver.com/[blogId]/[logNo]
+                if f'/{blog_id}/' in guid_url:
+                    log_no = guid_url.split(f'/{blog_id}/')[1].split('?')[0].strip()
                 
-                for item in items:
-                    # <guid> 태그에서 logNo 추출
-                    guid = item.find('guid')
-                    log_no = None
-                    
-                    if guid and guid.text:
-                        guid_url = guid.text.strip()
-                        # 형식: https://blog.naver.com/[blogId]/[logNo]
-                        if f'/{blog_id}/' in guid_url:
-                            log_no = guid_url.split(f'/{blog_id}/')[1].split('?')[0].strip()
-                    
-                    if not log_no:
-                        # <link> 태그에서 추출 시도
-                        link = item.find('link')
-                        if link and link.text:
-                            link_url = link.text.strip()
-                            if 'logNo=' in link_url:
-                                log_no = link_url.split('logNo=')[1].split('&')[0].strip()
+                if not log_no:
+                    # <link> 태그에서 추출 시도
+                    link_url = (item.findtext('link') or '').strip()
+                    if 'logNo=' in link_url:
+                        log_no = link_url.split('logNo=')[1].split('&')[0].strip()
+                
+                # 처리한 <item>과 앞선 형제 노드를 메모리에서 해제
+                item.clear()
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
+                
+                if log_no and log_no.isdigit() and log_no not in seen_log_nos:
+                    seen_log_nos.add(log_no)
+                    log_nos.append(log_no)
                     
-                    if log_no and log_no.isdigit() and log_no not in log_nos:
-                        log_nos.append(log_no)
-                        
-                        # 최대 100개 제한
-                        if len(log_nos) >= 100:
-                            break
+                    # 최대 100개 제한 (나머지 문서는 파싱하지 않음)
+                    if len(log_nos) >= 100:
+                        break
         except Exception as xml_error:
             logger.error(f"XML 파싱 오류: {str(xml_error)}")
         
@@ -101,7 +98,8 @@ def fetch_rss_lognos(blog_id):
                     if f'/{blog_id}/' in href:
                         try:
                             log_no = href.split(f'/{blog_id}/')[1].split('?')[0]
-                            if log_no.isdigit() and log_no not in log_nos:
+                            if log_no.isdigit() and log_no not in seen_log_nos:
+                                seen_log_nos.add(log_no)
                                 log_nos.append(log_no)
                                 
                                 # 최대 100개 제한
@@ -112,20 +110,20 @@ def fetch_rss_lognos(blog_id):
                     
                     # logNo= 파라미터 찾기
                     elif 'logNo=' in href:
-                        try:
-                            log_no = href.split('logNo=')[1].split('&')[0]
-                            if log_no.isdigit() and log_no not in log_nos:
-                                log_nos.append(log_no)
-                                
-                                # 최대 100개 제한
-                                if len(log_nos) >= 100:
-                                    break
-                        except:
-                            continue
+                        log_no = extract_log_no(href)
+                        if log_no and log_no not in seen_log_nos:
+                            seen_log_nos.add(log_no)
+                            log_nos.append(log_no)
+                            
+                            # 최대 100개 제한
+                            if len(log_nos) >= 100:
+                                break
             except Exception as html_error:
                 logger.error(f"HTML 파싱 오류: {str(html_error)}")
         
         logger.debug(f"RSS에서 {len(log_nos)}개의 logNo 발견")
+        if log_nos:
+            save_validated(cache_key, response.headers, log_nos)
         return log_nos
         
     except Exception as e:
@@ -158,24 +156,13 @@ def scrape_blog_rss_mode(blog_url, access_token=None):
         # 세션 생성 - RSS는 OAuth 없이도 가능하지만 접근성을 높이기 위해 토큰 사용
         session = create_authenticated_session(access_token)
         
-        # 포스트 상세 내용 수집
-        posts = []
-        
         # 최대 30개로 제한
         if len(log_nos) > 30:
             logger.debug(f"포스트 수 제한: {len(log_nos)}개 -> 30개")
             log_nos = log_nos[:30]
         
-        for log_no in log_nos:
-            try:
-                post_detail = get_post_detail(session, blog_id, log_no)
-                if post_detail:
-                    posts.append(post_detail)
-                    # 서버 부하 방지
-                    time.sleep(0.5)
-            except Exception as post_error:
-                logger.error(f"포스트 {log_no} 처리 중 오류: {str(post_error)}")
-                continue
+        # 포스트 상세 내용을 동시에 수집 (동시 요청 수는 DETAIL_FETCH_CONCURRENCY로 제한)
+        posts = fetch_details_concurrently(get_post_detail, session, blog_id, log_nos)
         
         logger.debug(f"RSS 모드로 {len(posts)}개의 포스트를 찾았습니다.")
         return posts
@@ -195,7 +182,7 @@ def create_authenticated_session(access_token):
     Returns:
         requests.Session: 인증된 세션 객체
     """
-    session = requests.Session()
+    session = create_pooled_session()
     
     # 토큰을 쿠키와 헤더에 모두 설정 (네이버의 다양한 인증 방식 지원)
     session.headers.update({
@@ -324,8 +311,7 @@ def clean_html_content(html_content):
     text = soup.get_text(separator='\n', strip=True)
     
     # 연속된 공백 제거
-    import re
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WHITESPACE_RE.sub(' ', text).strip()
     
     return text
 
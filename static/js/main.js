@@ -92,6 +92,12 @@ document.addEventListener('DOMContentLoaded', function() {
             pollStatus(blogId);
         }
     }
+    
+    // 보고서 생성 페이지: 분석 결과를 스트리밍으로 받아 표시
+    const streamContainer = document.getElementById('stream-container');
+    if (streamContainer) {
+        streamAnalysis(streamContainer.getAttribute('data-stream-url'));
+    }
 });
 
 // 쿠키 방식 제거됨 - 관련 함수 삭제
@@ -129,6 +135,22 @@ function pollStatus(blogId) {
             .then(data => {
                 document.getElementById('post-count').textContent = data.post_count;
                 
+                // 블로그 수집 단계와 분석 단계를 구분해서 표시
+                const statusMessage = document.getElementById('status-message');
+                if (statusMessage) {
+                    statusMessage.textContent = data.analysis_state === 'scraping'
+                        ? '블로그 글을 수집하고 있습니다...'
+                        : '블로그 글을 분석하고 있습니다...';
+                }
+                
+                // 보고서 생성이 아직 시작되지 않았으면 실시간 분석 화면으로 이동할 수 있는 링크 표시
+                const liveLink = document.getElementById('live-link');
+                if (liveLink) {
+                    const canStream = data.post_count > 0 && !data.has_report
+                        && (data.analysis_state === undefined || data.analysis_state === 'queued');
+                    liveLink.classList.toggle('d-none', !canStream);
+                }
+                
                 // If report is ready, redirect to it
                 if (data.has_report) {
                     clearInterval(progressInterval);
@@ -138,6 +160,14 @@ function pollStatus(blogId) {
                     setTimeout(() => {
                         window.location.href = `/report/${data.report_id}`;
                     }, 1000);
+                } else if (data.analysis_error) {
+                    // 백그라운드 분석이 실패한 경우 폴링 중단 후 오류 표시
+                    clearInterval(progressInterval);
+                    const errorElement = document.getElementById('analysis-error');
+                    if (errorElement) {
+                        errorElement.textContent = data.analysis_error;
+                        errorElement.classList.remove('d-none');
+                    }
                 } else {
                     // Check again in 5 seconds
                     setTimeout(checkStatus, 5000);
@@ -153,3 +183,89 @@ function pollStatus(blogId) {
     // Start checking
     checkStatus();
 }
+
+// 생성 중인(닫히지 않았을 수 있는) JSON 텍스트에서 카테고리별 문자열 값을 추출
+function extractPartialSections(text) {
+    const sections = {};
+    const keyPattern = /"([a-z_]+)"\s*:\s*"/g;
+    let match;
+    
+    while ((match = keyPattern.exec(text)) !== null) {
+        let value = '';
+        let i = keyPattern.lastIndex;
+        
+        // 닫는 따옴표가 나오거나 텍스트가 끝날 때까지 문자열 값을 읽음
+        while (i < text.length && text[i] !== '"') {
+            if (text[i] === '\\') {
+                if (i + 1 >= text.length) break;  // 아직 도착하지 않은 이스케이프 시퀀스
+                const next = text[i + 1];
+                if (next === 'n') value += '\n';
+                else if (next === 't') value += '\t';
+                else if (next === 'u') {
+                    if (i + 5 >= text.length) break;
+                    value += String.fromCharCode(parseInt(text.substr(i + 2, 4), 16));
+                    i += 4;
+                }
+                else value += next;
+                i += 2;
+            } else {
+                value += text[i];
+                i += 1;
+            }
+        }
+        
+        sections[match[1]] = value;
+        keyPattern.lastIndex = i;
+    }
+    
+    return sections;
+}
+
+// Function to stream the analysis report via Server-Sent Events
+function streamAnalysis(streamUrl) {
+    const source = new EventSource(streamUrl);
+    const statusText = document.getElementById('stream-status');
+    let responseText = '';
+    
+    source.onmessage = function(e) {
+        const data = JSON.parse(e.data);
+        responseText += data.token;
+        
+        // 지금까지 도착한 내용을 카테고리별로 표시
+        const sections = extractPartialSections(responseText);
+        Object.keys(sections).forEach(key => {
+            const section = document.getElementById(`stream-section-${key.toLowerCase()}`);
+            const textElement = document.getElementById(`stream-text-${key.toLowerCase()}`);
+            if (section && textElement) {
+                section.classList.remove('d-none');
+                textElement.textContent = sections[key];
+            }
+        });
+    };
+    
+    source.addEventListener('done', function(e) {
+        source.close();
+        const data = JSON.parse(e.data);
+        statusText.textContent = '분석이 완료되었습니다. 보고서로 이동합니다...';
+        setTimeout(() => {
+            window.location.href = `/report/${data.report_id}`;
+        }, 1000);
+    });
+    
+    // 다른 곳에서 이미 수집/분석 중이면 진행 상황 페이지(/status 폴링)로 전환
+    source.addEventListener('pending', function(e) {
+        source.close();
+        window.location.href = JSON.parse(e.data).status_url;
+    });
+    
+    source.addEventListener('error', function(e) {
+        source.close();
+        document.getElementById('stream-spinner').classList.add('d-none');
+        // 서버가 보낸 오류 이벤트이면 메시지를 표시하고, 연결 오류이면 일반 분석 페이지로 전환
+        if (e.data) {
+            statusText.textContent = JSON.parse(e.data).message;
+        } else {
+            window.location.href = streamUrl.replace(/\/stream$/, '');
+        }
+    });
+}
@@ -2,6 +2,7 @@ from playwright.sync_api import sync_playwright
 import time
 import logging
 from bs4 import BeautifulSoup
+from blog_utils import extract_log_no, LOGNO_PARAM_RE, POST_ID_RE
 
 logger = logging.getLogger(__name__)
 
@@ -130,12 +131,10 @@ def fetch_all_posts_with_playwright(blog_id: str, cookie_str: str = "", access_t
                     
                     # 패턴 1: logNo 파라미터가 있는 링크 찾기
                     for link in soup.select('a[href*="logNo="]'):
-                        href = link.get('href', '')
-                        if 'logNo=' in href:
-                            log_no = href.split('logNo=')[1].split('&')[0]
-                            if log_no.isdigit():
-                                lognos.add(log_no)
-                                logger.debug(f"logNo 발견 (패턴1): {log_no}")
+                        log_no = extract_log_no(link.get('href', ''))
+                        if log_no:
+                            lognos.add(log_no)
+                            logger.debug(f"logNo 발견 (패턴1): {log_no}")
                     
                     # 패턴 2: 현대 네이버 블로그 형식 (/blogId/logNo)
                     for link in soup.select(f'a[href*="/{blog_id}/"]'):
@@ -149,17 +148,14 @@ def fetch_all_posts_with_playwright(blog_id: str, cookie_str: str = "", access_t
                                     logger.debug(f"logNo 발견 (패턴2): {part}")
                     
                     # 패턴 3: 정규식 사용 (JavaScript 변수 등에서 logNo 추출)
-                    import re
-                    logno_pattern = re.compile(r'logNo=(\d+)')
-                    for match in logno_pattern.finditer(content):
+                    for match in LOGNO_PARAM_RE.finditer(content):
                         log_no = match.group(1)
                         if log_no.isdigit():
                             lognos.add(log_no)
                             logger.debug(f"logNo 발견 (정규식): {log_no}")
                     
                     # 또다른 패턴: post_id나 다른 식별자
-                    postid_pattern = re.compile(r'post_id\s*:\s*[\'"]?(\d+)[\'"]?')
-                    for match in postid_pattern.finditer(content):
+                    for match in POST_ID_RE.finditer(content):
                         log_no = match.group(1)
                         if log_no.isdigit():
                             lognos.add(log_no)
@@ -187,12 +183,10 @@ def fetch_all_posts_with_playwright(blog_id: str, cookie_str: str = "", access_t
                 
                 # 모바일 링크에서 logNo 추출
                 for link in soup.select('a[href*="logNo="]'):
-                    href = link.get('href', '')
-                    if 'logNo=' in href:
-                        log_no = href.split('logNo=')[1].split('&')[0]
-                        if log_no.isdigit():
-                            lognos.add(log_no)
-                            logger.debug(f"모바일에서 logNo 발견: {log_no}")
+                    log_no = extract_log_no(link.get('href', ''))
+                    if log_no:
+                        lognos.add(log_no)
+                        logger.debug(f"모바일에서 logNo 발견: {log_no}")
             except Exception as e:
                 logger.error(f"모바일 버전 처리 중 오류: {str(e)}")
             